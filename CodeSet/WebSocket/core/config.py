@@ -22,4 +22,5 @@ LOCAL_DB_URL = os.getenv("LOCAL_DB_URL")
 TIME_OUT = 35
 N_FRAMES = 30
 FRAME_DIR = "/Users/v/SUN_RAT/QUEEN/BrainBuddy_BE/Test/IMG"
-MODEL_PATH = ""
\ No newline at end of file
+MODEL_PATH = ""
+MIN_FACE_RATIO = 0.2    # window 프레임 중 얼굴 검출 비율이 이보다 낮으면 CNN 없이 미집중(0) 처리
\ No newline at end of file
@@ -1 +1,2 @@
-from .infer import load_model, load_folder_frames, predict_sequence
\ No newline at end of file
+from .infer import load_model, load_folder_frames, predict_sequence, load_face_hints
+from .preprocess import FaceTracker
\ No newline at end of file
@@ -1,10 +1,11 @@
 import os
+import json
 import glob
 import argparse
 import cv2
 import torch
 from .model import CNN_LSTM
-from .preprocess import build_eval_tfms, to_tensor_from_bgr
+from .preprocess import build_eval_tfms, resolve_face_bbox, crop_to_tensor
 
 def load_model(ckpt_path: str, device=None, backbone="resnet18", hidden=256, num_layers=2,
                bidirectional=True, dropout=0.3):
@@ -18,16 +19,29 @@ def load_model(ckpt_path: str, device=None, backbone="resnet18", hidden=256, num
     return model, device
 
 @torch.inference_mode()
-def predict_sequence(model, device, frames_bgr, img_size=224, threshold=0.25, logit_bias=0.2, auto_zoom=True):
+def predict_sequence(model, device, frames_bgr, img_size=224, threshold=0.25, logit_bias=0.2, auto_zoom=True,
+                     tracker=None, face_hints=None, min_face_ratio=0.0):
+    """Returns (pred, prob). prob is None when the window was short-circuited as no-face:
+    with auto_zoom, if a face is found in fewer than min_face_ratio of the frames the window
+    is scored unfocused without running the model."""
     tfms = build_eval_tfms(img_size)
-    tens = [to_tensor_from_bgr(f, tfms, auto_zoom=auto_zoom) for f in frames_bgr]
+    face_hints = face_hints or [None] * len(frames_bgr)
+    if auto_zoom:
+        bboxes = [resolve_face_bbox(f, tracker, hint) for f, hint in zip(frames_bgr, face_hints)]
+        present = sum(b is not None for b in bboxes) / max(1, len(bboxes))
+        if present < min_face_ratio:
+            return 0, None
+    else:
+        bboxes = [None] * len(frames_bgr)
+    tens = [crop_to_tensor(f, tfms, bbox) for f, bbox in zip(frames_bgr, bboxes)]
     x = torch.stack(tens, dim=0).unsqueeze(0).to(device)  # (1,T,3,H,W)
     logit = model(x).float() + logit_bias
     prob = torch.sigmoid(logit).item()
     pred = int(prob >= threshold)
     return pred, float(prob)
 
-def load_folder_frames(folder: str, seq_len: int = 30):
+def load_folder_frames(folder: str, seq_len: int = 30, return_names: bool = False):
+    """With return_names, also returns the file name each (possibly padded) frame was read from."""
     exts = ("*.png","*.jpg","*.jpeg","*.bmp")
     files = []
     for e in exts:
@@ -39,13 +53,40 @@ def load_folder_frames(folder: str, seq_len: int = 30):
         files = files + [files[-1]] * (seq_len - len(files))
     else:
         files = files[:seq_len]
-    frames = [cv2.imread(fp) for fp in files]
-    frames = [f for f in frames if f is not None]
+    frames, names = [], []
+    for fp in files:
+        f = cv2.imread(fp)
+        if f is not None:
+            frames.append(f)
+            names.append(os.path.basename(fp))
     if len(frames) == 0:
         raise RuntimeError(f"Could not read any frames from: {folder}")
     if len(frames) < seq_len:
+        names += [names[-1]] * (seq_len - len(frames))
         frames += [frames[-1]] * (seq_len - len(frames))
-    return frames
+    return (frames, names) if return_names else frames
+
+FACE_HINTS_FILE = "faces.json"
+
+def load_face_hints(folder: str, names):
+    """Client face hints aligned to the frames loaded by load_folder_frames(..., return_names=True)
+    (None where absent). faces.json maps frame file name -> [x, y, w, h]; the older list form is
+    indexed by the frame number in the file name."""
+    path = os.path.join(folder, FACE_HINTS_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        hints = json.load(f)
+    if not hints:
+        return None
+    if isinstance(hints, dict):
+        return [hints.get(n) for n in names]
+    aligned = []
+    for n in names:
+        stem = os.path.splitext(n)[0]
+        idx = int(stem) if stem.isdigit() else -1
+        aligned.append(hints[idx] if 0 <= idx < len(hints) else None)
+    return aligned
 
 def main():
     ap = argparse.ArgumentParser()
@@ -61,7 +102,7 @@ def main():
     frames = load_folder_frames(args.folder, seq_len=args.seq_len)
     pred, prob = predict_sequence(model, device, frames, img_size=args.img_size,
                                   threshold=args.threshold, logit_bias=args.logit_bias, auto_zoom=True)
-    print(f"Prediction: {pred} (prob={prob:.4f})")
+    print(f"Prediction: {pred} (prob={prob:.4f})" if prob is not None else f"Prediction: {pred} (no face)")
 
 if __name__ == "__main__":
     main()
@@ -3,15 +3,15 @@ import torch.nn as nn
 from torchvision import models
 
 class CNNEncoder(nn.Module):
-    def __init__(self, backbone: str = "resnet18"):
+    def __init__(self, backbone: str = "resnet18", pretrained: bool = True):
         super().__init__()
         self.out_dim = 512
         if backbone == "resnet18":
-            m = models.resnet18(weights=models.ResNet18_Weights.IMAGENET1K_V1)
+            m = models.resnet18(weights=models.ResNet18_Weights.IMAGENET1K_V1 if pretrained else None)
             self.encoder = nn.Sequential(*list(m.children())[:-1])  # (B,512,1,1)
             self.out_dim = 512
         elif backbone == "efficientnet_b0":
-            m = models.efficientnet_b0(weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1)
+            m = models.efficientnet_b0(weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1 if pretrained else None)
             self.encoder = nn.Sequential(*list(m.features), nn.AdaptiveAvgPool2d((1,1)))
             self.out_dim = 1280
         else:
@@ -23,9 +23,10 @@ class CNNEncoder(nn.Module):
 
 class CNN_LSTM(nn.Module):
     def __init__(self, backbone: str = "resnet18", hidden: int = 256, num_layers: int = 2,
-                 bidirectional: bool = True, dropout: float = 0.3):
+                 bidirectional: bool = True, dropout: float = 0.3, pretrained: bool = True):
         super().__init__()
-        self.cnn = CNNEncoder(backbone=backbone)
+        # pretrained=False : 체크포인트로 덮어쓸 경우 ImageNet 가중치 다운로드 생략
+        self.cnn = CNNEncoder(backbone=backbone, pretrained=pretrained)
         self.lstm = nn.LSTM(
             input_size=self.cnn.out_dim,
             hidden_size=hidden,
@@ -1,3 +1,4 @@
+import math
 import cv2
 from PIL import Image
 from torchvision import transforms
@@ -44,6 +45,24 @@ def detect_face_bbox(frame_bgr):
     x, y, ww, hh = max(faces, key=lambda b: b[2]*b[3])
     return int(x), int(y), int(ww), int(hh)
 
+def client_face_bbox(box, frame_shape, min_size=0.05, max_aspect=2.0):
+    """Validate a client-supplied face box (normalized x,y,w,h) and return pixel (x,y,w,h), or None."""
+    try:
+        x, y, bw, bh = (float(v) for v in box)
+    except (TypeError, ValueError):
+        return None
+    if not all(math.isfinite(v) for v in (x, y, bw, bh)):
+        return None
+    if not (min_size <= bw <= 1.0 and min_size <= bh <= 1.0):
+        return None
+    if not (0.0 <= x + bw / 2 <= 1.0 and 0.0 <= y + bh / 2 <= 1.0):   # box center inside the frame
+        return None
+    h, w = frame_shape[:2]
+    aspect = (bw * w) / (bh * h)
+    if not (1.0 / max_aspect <= aspect <= max_aspect):
+        return None
+    return max(0, int(x * w)), max(0, int(y * h)), max(1, int(bw * w)), max(1, int(bh * h))
+
 def tight_square_crop(frame_bgr, bbox, box_scale=1.6):
     x, y, fw, fh = bbox
     h, w = frame_bgr.shape[:2]
@@ -60,10 +79,99 @@ def tight_square_crop(frame_bgr, bbox, box_scale=1.6):
     crop = frame_bgr[max(0,y0):y1, max(0,x0):x1]
     return crop if crop.size else frame_bgr
 
-def to_tensor_from_bgr(frame_bgr, tfms, auto_zoom=False, first_scale=1.6):
-    if auto_zoom:
-        bbox = detect_face_bbox(frame_bgr)
-        if bbox is not None:
-            frame_bgr = tight_square_crop(frame_bgr, bbox, box_scale=first_scale)
+class FaceTracker:
+    """Per-connection face ROI tracker.
+
+    Runs detect_face_bbox on keyframes only and follows the box on the frames in
+    between with template matching on a downscaled grayscale image. Re-detects
+    when the match score drops (drift / occlusion) or the box leaves the frame.
+    """
+    def __init__(self, keyframe_interval=10, scale=0.25, search=0.5, min_score=0.6):
+        self.keyframe_interval = keyframe_interval
+        self.scale = scale              # downscale factor for template matching
+        self.search = search            # search margin around the last box (fraction of box size)
+        self.min_score = min_score      # TM_CCOEFF_NORMED below this -> re-detect
+        self.bbox = None
+        self.template = None
+        self.since = keyframe_interval  # frames since last detection (detect on first frame)
+        self.frames = 0
+        self.detections = 0
+
+    def reset(self):
+        self.bbox, self.template, self.since = None, None, self.keyframe_interval
+
+    def _small(self, frame_bgr):
+        gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(gray, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+
+    def _detect(self, frame_bgr):
+        self.detections += 1
+        self.since = 0
+        self.bbox = detect_face_bbox(frame_bgr)
+        self.template = None
+        if self.bbox is not None:
+            x, y, w, h = (int(v * self.scale) for v in self.bbox)
+            tpl = self._small(frame_bgr)[y:y+h, x:x+w]
+            if tpl.shape[0] >= 4 and tpl.shape[1] >= 4:
+                self.template = tpl
+        return self.bbox
+
+    def _track(self, frame_bgr):
+        small = self._small(frame_bgr)
+        th, tw = self.template.shape
+        x, y = int(self.bbox[0] * self.scale), int(self.bbox[1] * self.scale)
+        mx, my = int(tw * self.search), int(th * self.search)
+        x0, y0 = max(0, x - mx), max(0, y - my)
+        region = small[y0:y + th + my, x0:x + tw + mx]
+        if region.shape[0] < th or region.shape[1] < tw:
+            return None
+        res = cv2.matchTemplate(region, self.template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, loc = cv2.minMaxLoc(res)
+        if score < self.min_score:
+            return None
+        _, _, fw, fh = self.bbox
+        return int((x0 + loc[0]) / self.scale), int((y0 + loc[1]) / self.scale), fw, fh
+
+    def update(self, frame_bgr):
+        """Return (x,y,w,h) of the face in this frame, or None."""
+        self.frames += 1
+        self.since += 1
+        if self.since >= self.keyframe_interval:
+            return self._detect(frame_bgr)
+        if self.bbox is None or self.template is None:
+            return None     # no face at the last keyframe: wait for the next one
+        bbox = self._track(frame_bgr)
+        if bbox is None:
+            return self._detect(frame_bgr)
+        self.bbox = bbox
+        return bbox
+
+    def stats(self):
+        return {"frames": self.frames,
+                "detections": self.detections,
+                "detections_per_frame": round(self.detections / self.frames, 4) if self.frames else 0.0}
+
+CROPPED = "cropped"
+
+def resolve_face_bbox(frame_bgr, tracker=None, face_hint=None):
+    """Face box for one frame, or None if no face.
+
+    face_hint: client-supplied normalized face box, or CROPPED if the frame is already a face crop
+    (returned as-is). Missing or implausible hints fall back to the tracker / detector.
+    """
+    if face_hint == CROPPED:
+        return CROPPED
+    bbox = client_face_bbox(face_hint, frame_bgr.shape) if face_hint is not None else None
+    if bbox is None:
+        bbox = tracker.update(frame_bgr) if tracker is not None else detect_face_bbox(frame_bgr)
+    return bbox
+
+def crop_to_tensor(frame_bgr, tfms, bbox=None, first_scale=1.6):
+    if bbox is not None and bbox != CROPPED:
+        frame_bgr = tight_square_crop(frame_bgr, bbox, box_scale=first_scale)
     rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
     return tfms(Image.fromarray(rgb))
+
+def to_tensor_from_bgr(frame_bgr, tfms, auto_zoom=False, first_scale=1.6, tracker=None, face_hint=None):
+    bbox = resolve_face_bbox(frame_bgr, tracker, face_hint) if auto_zoom else None
+    return crop_to_tensor(frame_bgr, tfms, bbox, first_scale)
@@ -1,7 +1,7 @@
 from pathlib import Path
 
-from WebSocket.core.config import MODEL_PATH
-from WebSocket.model import load_model, load_folder_frames, predict_sequence
+from WebSocket.core.config import MODEL_PATH, MIN_FACE_RATIO
+from WebSocket.model import load_model, load_folder_frames, predict_sequence, load_face_hints, FaceTracker
 
 import os, psutil, torch
 
@@ -19,6 +19,11 @@ def _format_bytes(n: int) -> str:
 class ModelService:
     brain_buddy = None
     device = None
+    # 연결(user_name) 별 얼굴 ROI tracker : keyframe 에서만 검출, 그 사이 프레임은 추적
+    trackers: dict = {}
+    # 얼굴 없음(no-face) short-circuit 통계
+    windows = 0
+    no_face_windows = 0
 
     @classmethod
     def init_model(cls):
@@ -91,8 +96,23 @@ class ModelService:
                 print("[Memory]", ds["note"])
 
     @classmethod
-    async def inference_focus(cls, img_dir: str) -> int:
-        frames = load_folder_frames(folder=img_dir)
-        focus, prob = predict_sequence(cls.brain_buddy, cls.device, frames)
+    async def inference_focus(cls, img_dir: str, user_name: str | None = None) -> int:
+        frames, names = load_folder_frames(folder=img_dir, return_names=True)
+        # 클라이언트가 보낸 얼굴 box 가 있으면 해당 프레임은 서버 검출 생략 (파일명 기준으로 프레임과 정렬)
+        hints = load_face_hints(folder=img_dir, names=names)
+        tracker = cls.trackers.setdefault(user_name, FaceTracker()) if user_name else None
+        focus, prob = predict_sequence(cls.brain_buddy, cls.device, frames, tracker=tracker, face_hints=hints,
+                                       min_face_ratio=MIN_FACE_RATIO)
+        cls.windows += 1
+        if prob is None:
+            cls.no_face_windows += 1
+            print(f"[DEBUG] :   no face -> focus = 0 (short-circuited {cls.no_face_windows}/{cls.windows} windows)")
+            return focus
         print(f"[DEBUG] :   focus = {focus} , prob = {prob}")
-        return focus
\ No newline at end of file
+        if tracker is not None:
+            print(f"[DEBUG] :   face tracker = {tracker.stats()}")
+        return focus
+
+    @classmethod
+    def forget_user(cls, user_name: str) -> None:
+        cls.trackers.pop(user_name, None)
\ No newline at end of file
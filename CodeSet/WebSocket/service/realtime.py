@@ -1,21 +1,54 @@
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from PIL import Image
 from datetime import datetime
-import time, os, pickle, io
+import time, os, pickle, io, json
 import asyncio
 
 from WebSocket.core.config import TIME_OUT, N_FRAMES, FRAME_DIR
 
+from WebSocket.model.infer import FACE_HINTS_FILE
+
+# 프레임 프로토콜
+#   binary : 프레임 이미지 (JPEG) bytes
+#   text   : (선택) 다음 binary 프레임의 얼굴 정보 (클라이언트 MediaPipe 결과)
+#            {"face": [x, y, w, h]}  -> 0~1 정규화 좌표 (relativeBoundingBox)
+#            {"cropped": true}       -> 다음 프레임이 이미 얼굴만 잘라낸 이미지
 class RealTimeService:
+    @staticmethod
+    def _parse_face_hint(text: str):
+        try:
+            msg = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(msg, dict):
+            return None
+        if msg.get("cropped") is True:
+            return "cropped"
+        face = msg.get("face")
+        if isinstance(face, list) and len(face) == 4:
+            return face
+        return None
+
     @staticmethod
     async def collect_frames(websocket: WebSocket, user_name: str) -> str:
         frames = []
+        hints = []      # 프레임별 얼굴 정보 (없으면 None -> 서버에서 검출)
+        hint = None
         start = time.time()
         cnt = 0
         while len(frames) < N_FRAMES and (time.time() - start) < TIME_OUT:
             try:
-                frame = await asyncio.wait_for(websocket.receive_bytes(), 1.0)
-                frames.append(frame)
+                message = await asyncio.wait_for(websocket.receive(), 1.0)
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+                if message.get("text") is not None:
+                    hint = RealTimeService._parse_face_hint(message["text"])
+                    continue
+                if message.get("bytes") is None:
+                    continue
+                frames.append(message["bytes"])
+                hints.append(hint)
+                hint = None
                 cnt += 1
                 print(f"[LOG] :     {cnt} - {datetime.now()}")
             except asyncio.TimeoutError:
@@ -28,12 +61,20 @@ class RealTimeService:
         cur_img_dir = os.path.join(user_dir, f"images_{int(start)}")
         os.makedirs(name=cur_img_dir, exist_ok=True)
 
-        for idx, img_bytes in enumerate(iterable=frames):
+        saved_hints = {}    # 저장에 성공한 프레임만 파일명 -> 얼굴 box (저장 실패 / 누락 프레임과 어긋나지 않도록)
+        for idx, (img_bytes, hint) in enumerate(zip(frames, hints)):
+            file_name = f"{idx:04d}.jpg"
+            file_path = os.path.join(cur_img_dir, file_name)
             try:
                 img = Image.open(io.BytesIO(img_bytes))  # bytes → Image 객체
-                file_path = os.path.join(cur_img_dir, f"{idx:04d}.jpg")
                 img.save(file_path, "JPEG")
             except Exception as e:
                 print(f"[ERROR] :    {file_path}: {e}")
+                continue
+            if hint is not None:
+                saved_hints[file_name] = hint
+        if saved_hints:
+            with open(os.path.join(cur_img_dir, FACE_HINTS_FILE), "w") as f:
+                json.dump(saved_hints, f)
         print(f"[DEBUG] :        Saved {len(frames)} images to {cur_img_dir}")
         return cur_img_dir
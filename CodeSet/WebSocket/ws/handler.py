@@ -38,7 +38,7 @@ async def websocket_endpoint(websocket: WebSocket,
                 # 1. 프레임 수집
                 img_dir = await RealTimeService.collect_frames(websocket, user_name)
                 # 2. 추론
-                cur_focus = await ModelService.inference_focus(img_dir)
+                cur_focus = await ModelService.inference_focus(img_dir, user_name)
                 # cur_focus = await ModelService.test_inference(file_name)
                 # 3. focus 갱신 / 집계
                 result = await focus_tracker.update_focus(user_name, cur_focus)
@@ -53,6 +53,7 @@ async def websocket_endpoint(websocket: WebSocket,
                 break
     finally:
         manager.disconnect(user_name)
+        ModelService.forget_user(user_name)
         print(f"[LOG] : {user_name} Disconnected.")
     score = await focus_tracker.compute_score(db, 
                                               user_name, 
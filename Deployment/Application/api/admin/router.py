@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+import asyncio
+
+from Application.core.deps import VerifyAdmin
+from Application.core.watchdog import LoopWatchdog
+from Application.core.sampler import SamplingProfiler, MAX_SECONDS, MAX_HZ
+from Application.core.exceptions import Admin
+from Application.core.config import LOOP_LAG_INTERVAL_MS, LOOP_LAG_THRESHOLD_MS
+
+
+router = APIRouter(dependencies=[Depends(VerifyAdmin)])
+
+# 이벤트 루프 지연 감시기 (main.py lifespan 에서 start / stop)
+loop_watchdog = LoopWatchdog(LOOP_LAG_INTERVAL_MS, LOOP_LAG_THRESHOLD_MS)
+
+
+
+# --- 이벤트 루프 지연 histogram / 블로킹 stack [HTTP GET : http://{ServerDNS}/api/admin/loop] ---
+@router.get(path="/loop",
+            status_code=status.HTTP_200_OK,
+            summary="Event Loop Lag",
+            description="Event-loop scheduling lag histogram and stacks captured while the loop was blocked.")
+async def get_loop_lag() -> dict:
+    return loop_watchdog.stats()
+# -------------------------------------------------------------------------------------------------
+
+
+
+# --- 전체 thread sampling profile [HTTP GET : http://{ServerDNS}/api/admin/sample?seconds=10&hz=100&format=collapsed] ---
+@router.get(path="/sample",
+            status_code=status.HTTP_200_OK,
+            summary="Sampling Profile",
+            description="Sample every thread's stack (event loop, worker threads) for a bounded time. "
+                        "Returns collapsed stacks (flamegraph) or speedscope JSON.")
+async def sample_profile(seconds: float = Query(default=10.0, gt=0, le=MAX_SECONDS),
+                         hz: float = Query(default=100.0, ge=1, le=MAX_HZ),
+                         format: str = Query(default="collapsed", pattern="^(collapsed|speedscope)$")):
+    if SamplingProfiler.busy():
+        raise Admin.PROFILE_RUNNING.exc()
+    try:
+        profiler = await asyncio.to_thread(SamplingProfiler(seconds, hz).run)
+    except RuntimeError:
+        raise Admin.PROFILE_RUNNING.exc()
+    if format == "speedscope":
+        return {**profiler.speedscope(), "info": profiler.info()}
+    return PlainTextResponse(profiler.collapsed())
+# ---------------------------------------------------------------------------------------------------------------------
@@ -44,6 +44,9 @@ class Daily(Enum):
     
 
 class Report(Enum):
+    INVALID_FORMAT  = ErrorMetadata("INVALID_FORMAT", 
+                                    "Invalid format.", 
+                                    status.HTTP_422_UNPROCESSABLE_ENTITY)
     FORBIDDEN       = ErrorMetadata("FORBIDDEN",
                                     "That was a rather convoluted request.",
                                     status.HTTP_403_FORBIDDEN)
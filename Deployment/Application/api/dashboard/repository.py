@@ -119,6 +119,16 @@ class StudyDB:
                     .limit(1))
         rows = await db.execute(query)
         return rows.scalars().first()
+
+    @staticmethod
+    async def get_recent_timeline(db: AsyncSession, name: str) -> bytes | None:
+        # 직전 학습의 timeline blob 만 조회 (다른 컬럼 로드 X)
+        query = (select(StudySession.timeline)
+                    .where(StudySession.user_name == name, StudySession.study_time > 0)
+                    .order_by(desc(StudySession.started_at))
+                    .limit(1))
+        rows = await db.execute(query)
+        return rows.scalars().first()
         
     @staticmethod
     async def renew_records(db: AsyncSession) -> dict:
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from Application.core.deps import AsyncDB, GetCurrentUser
 from Application.core.exceptions import Server
+from Application.core.config import TIMELINE_MAX_POINTS
 
 from Application.api.dashboard.service import RankingService, MainService
-from Application.api.dashboard.schemas import RankingResponse, MainResponse, RecentResponse
+from Application.api.dashboard.schemas import RankingResponse, MainResponse, RecentResponse, TimelineResponse
+from Application.api.dashboard.exceptions import Report
 
 
 
@@ -70,3 +72,23 @@ async def get_study_report(name: str = Depends(GetCurrentUser),
                           final_grade=res.get("final_grade") if res else "None",
                           final_ment=res.get("final_ment") if res else "Let's play with BrainBuddy!")
 # --------------------------------------------------------------------------------------------------------
+
+
+
+# --- 사용자의 직전 학습 집중도 타임라인 API [HTTPS GET : https://{ServerDNS}/api/dashboard/recent-report/me/timeline?points=N] ---
+@router.get(path="/recent-report/me/timeline",
+            summary="Recent Focus Timeline Request",
+            description="Return the per-window focus timeline of the user's most recent study session, downsampled to N points.")
+async def get_study_timeline(points: int = Query(default=120),
+                             name: str = Depends(GetCurrentUser),
+                             db: AsyncSession = Depends(AsyncDB.get_db)) -> TimelineResponse:
+    if not (1 <= points <= TIMELINE_MAX_POINTS):
+        raise Report.INVALID_FORMAT.exc()
+    try:
+        timeline = await MainService.fetch_recent_timeline(db, name, points)
+    except SQLAlchemyError:
+        raise Server.DB_ERROR.exc()
+    return TimelineResponse(status="success" if timeline else "skipped",
+                            points=len(timeline),
+                            timeline=timeline)
+# --------------------------------------------------------------------------------------------------------
\ No newline at end of file
@@ -63,4 +63,10 @@ class RecentResponse(BaseModel):
     max_focus: int
     min_focus: int
     final_grade: str
-    final_ment: str
\ No newline at end of file
+    final_ment: str
+
+# 사용자 직전 학습의 집중도 타임라인 (N 개 구간 평균으로 downsample)
+class TimelineResponse(BaseModel):
+    status: str = Field(...) # success | skipped
+    points: int
+    timeline: List[float]
\ No newline at end of file
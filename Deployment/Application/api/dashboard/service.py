@@ -3,6 +3,7 @@ from datetime import time, datetime
 from typing import List
 
 from Application.core.config import COMPONENT_CNT
+from Application.core.timeline import downsample_timeline
 from Application.models.score import StudySession
 
 from Application.api.dashboard.repository import UsersDB, ScoreDB, StudyDB
@@ -113,4 +114,10 @@ class MainService:
                     "final_grade": parse_grade(row.avg_focus),
                     "final_ment": parse_ment(row.avg_focus)}
         else:
-            return None
\ No newline at end of file
+            return None
+
+    # 사용자의 직전 학습 집중도 타임라인을 points 개로 downsample 하여 반환
+    # READ-ONLY process
+    async def fetch_recent_timeline(db: AsyncSession, name: str, points: int) -> List[float]:
+        blob = await StudyDB.get_recent_timeline(db, name)
+        return downsample_timeline(blob, points)
\ No newline at end of file
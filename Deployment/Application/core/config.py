@@ -31,4 +31,12 @@ DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT"))
 DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE"))
 
 COMPONENT_CNT = int(os.getenv("COMPONENT_CNT"))
-STUDY_TIME_THRESHOLD = int(os.getenv("STUDY_TIME_THRESHOLD"))
\ No newline at end of file
+STUDY_TIME_THRESHOLD = int(os.getenv("STUDY_TIME_THRESHOLD"))
+TIMELINE_MAX_POINTS = int(os.getenv("TIMELINE_MAX_POINTS", "500"))
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+LOOP_LAG_INTERVAL_MS = float(os.getenv("LOOP_LAG_INTERVAL_MS", "100"))
+LOOP_LAG_THRESHOLD_MS = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "200"))
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "false").lower() == "true"
+TRACE_DIR = os.getenv("TRACE_DIR", "/tmp/brainbuddy/traces")
+TRACE_SAMPLE_RATIO = float(os.getenv("TRACE_SAMPLE_RATIO", "1.0"))
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from Application.core.config import MYSQL_DB_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE
+from Application.core.tracing import instrument_sqlalchemy
 
 # 비동기 엔진(async engine) 생성
 # 실제 AWS 운영 DB
@@ -11,6 +12,7 @@ async_engine = create_async_engine(url=MYSQL_DB_URL,
                                    max_overflow=DB_MAX_OVERFLOW,
                                    pool_timeout=DB_POOL_TIMEOUT,
                                    pool_recycle=DB_POOL_RECYCLE)
+instrument_sqlalchemy(async_engine.sync_engine)   # 쿼리 별 trace span (TRACE_ENABLED)
 
 # 비동기 세션 메이커(async_sessionmaker) 생성
 AsyncSessionLocal = async_sessionmaker( bind=async_engine,     # bind the async engine
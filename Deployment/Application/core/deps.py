@@ -1,12 +1,14 @@
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import AsyncGenerator
+import hmac
 
 from Application.core.database import AsyncSessionLocal  # 공통 세션메이커(sessionmaker)
 
 from Application.core.security import Token
-from Application.core.exceptions import TokenAuth, Server
-from Application.core.config import ACCESS
+from Application.core.exceptions import TokenAuth, Server, Admin
+from Application.core.config import ACCESS, ADMIN_TOKEN
+from Application.core.tracing import current_span
 
 def GetCurrentUser(request: Request) -> str:
     token = request.cookies.get(ACCESS)
@@ -18,6 +20,7 @@ def GetCurrentUser(request: Request) -> str:
         user_name = payload.get("sub")
         if user_name is None:
             raise TokenAuth.TOKEN_INVALID.exc()
+        current_span().set("enduser.id", user_name)   # 요청 trace 를 사용자 단위로 검색
         return user_name
     except Exception:
         raise
@@ -30,10 +33,17 @@ def ParseName(request: Request) -> str:
         user_name = Token.parse_name(token)
         if user_name is None:
             raise TokenAuth.TOKEN_INVALID.exc()
+        current_span().set("enduser.id", user_name)
         return user_name
     except Exception:
         raise
 
+# 운영(admin) route 인증 : X-Admin-Token 헤더와 ADMIN_TOKEN 비교
+def VerifyAdmin(request: Request) -> None:
+    token = request.headers.get("X-Admin-Token")
+    if not ADMIN_TOKEN or token is None or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise Admin.INVALID_ADMIN_TOKEN.exc()
+
 class AsyncDB:
     async def get_db() -> AsyncGenerator[AsyncSession, None]:
         async with AsyncSessionLocal() as session:    # 현재 하나의 세션만 사용 ()
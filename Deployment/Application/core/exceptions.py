@@ -26,6 +26,21 @@ class Server(Enum):
                              detail={"code": code, "message": message})
     
 
+# --- 운영(admin) route 인증 ---
+class Admin(Enum):
+    INVALID_ADMIN_TOKEN = ErrorMetadata("INVALID_ADMIN_TOKEN",
+                                        "Invalid admin token.",
+                                        status.HTTP_403_FORBIDDEN)
+    PROFILE_RUNNING     = ErrorMetadata("PROFILE_RUNNING",
+                                        "A sampling profile is already running.",
+                                        status.HTTP_409_CONFLICT)
+
+    def exc(self) -> HTTPException:
+        code, message, http_status = self.value
+        return HTTPException(status_code=http_status,
+                             detail={"code": code, "message": message})
+
+
 # --- 토큰 인증 ---
 class TokenAuth(Enum):
     TOKEN_EXPIRED   = ErrorMetadata("TOKEN_EXPIRED",
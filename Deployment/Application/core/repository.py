@@ -6,6 +6,7 @@ from typing import Union
 
 from Application.models.security import RefreshToken
 from Application.core.config import REDIS_HOST, REDIS_PORT, REDIS_PASSWORD, BLACK_LIST_ID, EXIST
+from Application.core.tracing import tracer, CLIENT
 
 import redis.asyncio as aioredis
 
@@ -27,12 +28,14 @@ class AccessBlackList:
         else:
             expire_dt = expire
         ttl = max(int((expire_dt - now).total_seconds()), 1) # 딱 0이 되어버리면 1로 보정
-        await BlackList.setex(jti, ttl, EXIST)
+        with tracer.span("redis SETEX", CLIENT, **{"db.system": "redis"}):
+            await BlackList.setex(jti, ttl, EXIST)
 
     # jti 를 이용하여 유효한 토큰인지 검사
     @staticmethod
     async def is_token_blacklisted(jti: str) -> bool:
-        return await BlackList.exists(jti)
+        with tracer.span("redis EXISTS", CLIENT, **{"db.system": "redis"}):
+            return await BlackList.exists(jti)
 
 class RefreshTokensTable:
     @staticmethod
@@ -0,0 +1,105 @@
+from collections import Counter
+from typing import Any, Dict, Tuple
+import threading
+import time, sys, os
+
+MAX_SECONDS = 60.0
+MAX_HZ = 250.0
+MAX_OVERHEAD = 0.05     # 샘플링에 쓰는 시간 / 전체 시간 상한 (GIL 을 잡는 동안 다른 thread 가 멈춤)
+
+Frame = Tuple[str, str, int]    # (함수명, 파일, 함수 시작 line)
+
+
+# ---------------------------------------------------------------------------------
+# 운영 중 프로세스용 sampling profiler (외부 도구 attach 불필요)
+#   별도 thread 가 주기적으로 sys._current_frames() 로 모든 thread (이벤트 루프 / 추론 slot 포함)의
+#   stack 을 읽어 함수 단위로 집계. 결과는 collapsed-stack (flamegraph) 또는 speedscope JSON
+#   샘플링 비용이 MAX_OVERHEAD 를 넘지 않도록 간격을 자동으로 늘림. 프로세스당 동시에 1개만 실행
+# ---------------------------------------------------------------------------------
+class SamplingProfiler:
+    _running = threading.Lock()
+
+    def __init__(self, seconds: float = 10.0, hz: float = 100.0, max_overhead: float = MAX_OVERHEAD) -> None:
+        self.seconds = min(max(seconds, 0.1), MAX_SECONDS)
+        self.interval = 1.0 / min(max(hz, 1.0), MAX_HZ)
+        self.max_overhead = max_overhead
+        self.stacks: Counter = Counter()     # (thread 이름, (root ... leaf Frame)) -> sample 수
+        self.ticks = 0
+        self.cost_sec = 0.0
+        self.elapsed_sec = 0.0
+
+    @classmethod
+    def busy(cls) -> bool:
+        return cls._running.locked()
+
+    # 동기 실행 (async route 에서는 asyncio.to_thread 로 호출 -> 이벤트 루프도 샘플링 대상)
+    def run(self) -> "SamplingProfiler":
+        if not self._running.acquire(blocking=False):
+            raise RuntimeError("A sampling profile is already running")
+        try:
+            me = threading.get_ident()
+            names: Dict[int, str] = {}
+            start = time.perf_counter()
+            end = start + self.seconds
+            while time.perf_counter() < end:
+                t0 = time.perf_counter()
+                for tid, frame in sys._current_frames().items():
+                    if tid == me:
+                        continue
+                    if tid not in names:
+                        names.update({t.ident: t.name for t in threading.enumerate()})
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                        frame = frame.f_back
+                    self.stacks[(names.get(tid, str(tid)), tuple(reversed(stack)))] += 1
+                cost = time.perf_counter() - t0
+                self.cost_sec += cost
+                self.ticks += 1
+                # cost / (cost + sleep) <= max_overhead 가 되도록 대기
+                time.sleep(max(self.interval - cost, cost / self.max_overhead - cost))
+            self.elapsed_sec = time.perf_counter() - start
+            return self
+        finally:
+            self._running.release()
+
+    def info(self) -> Dict[str, Any]:
+        return {"seconds": round(self.elapsed_sec, 3),
+                "ticks": self.ticks,
+                "effective_hz": round(self.ticks / self.elapsed_sec, 1) if self.elapsed_sec else 0.0,
+                "overhead": round(self.cost_sec / self.elapsed_sec, 4) if self.elapsed_sec else 0.0}
+
+    @staticmethod
+    def _label(frame: Frame) -> str:
+        name, filename, line = frame
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    # flamegraph.pl / speedscope 호환 collapsed-stack : "thread;root;...;leaf count"
+    def collapsed(self) -> str:
+        lines = [";".join([thread] + [self._label(f).replace(";", ":") for f in stack]) + f" {count}"
+                 for (thread, stack), count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+    # speedscope (https://www.speedscope.app) file format : thread 별 sampled profile
+    def speedscope(self) -> Dict[str, Any]:
+        frames: Dict[Frame, int] = {}
+        per_thread: Dict[str, Dict[str, list]] = {}
+        weight = self.elapsed_sec / self.ticks if self.ticks else 0.0
+        for (thread, stack), count in self.stacks.items():
+            ids = [frames.setdefault(f, len(frames)) for f in stack]
+            prof = per_thread.setdefault(thread, {"samples": [], "weights": []})
+            prof["samples"].append(ids)
+            prof["weights"].append(count * weight)
+        return {"$schema": "https://www.speedscope.app/file-format-schema.json",
+                "name": f"pid {os.getpid()} sampling profile",
+                "exporter": "sampler.py",
+                "shared": {"frames": [{"name": n, "file": f, "line": l} for (n, f, l) in frames]},
+                "profiles": [{"type": "sampled",
+                              "name": thread,
+                              "unit": "seconds",
+                              "startValue": 0,
+                              "endValue": sum(p["weights"]),
+                              "samples": p["samples"],
+                              "weights": p["weights"]}
+                             for thread, p in per_thread.items()]}
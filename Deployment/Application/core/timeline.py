@@ -0,0 +1,37 @@
+from typing import List, Tuple
+
+# 집중도 타임라인(timeline) 직렬화 포맷 (WebSocket/core/timeline.py 와 동일)
+#   [0]     : 포맷 버전(version)
+#   [1:]    : (value, run) uint8 쌍의 반복 -> run-length 압축
+TIMELINE_VERSION = 1
+
+
+# RLE 압축 bytes -> (value, run) 리스트
+def decode_runs(blob: bytes | None) -> List[Tuple[int, int]]:
+    if not blob or blob[0] != TIMELINE_VERSION:
+        return []
+    view = memoryview(blob)[1:]
+    return [(view[i], view[i + 1]) for i in range(0, len(view) - 1, 2)]
+
+
+# 압축을 풀지 않고 run 단위로 순회하며 n_points 개 구간의 평균 집중도 계산
+def downsample_timeline(blob: bytes | None, n_points: int) -> List[float]:
+    runs = decode_runs(blob)
+    total = sum(run for _, run in runs)
+    if total == 0 or n_points <= 0:
+        return []
+    n_points = min(n_points, total)
+    sums = [0.0] * n_points
+    counts = [0] * n_points
+    idx = 0
+    for value, run in runs:
+        while run > 0:
+            # idx 번째 window 가 속한 구간(bucket)과 그 구간의 마지막 window 위치
+            bucket = idx * n_points // total
+            bucket_end = -(-(bucket + 1) * total // n_points)
+            take = min(run, bucket_end - idx)
+            sums[bucket] += value * take
+            counts[bucket] += take
+            idx += take
+            run -= take
+    return [round(s / c, 3) for s, c in zip(sums, counts)]
@@ -0,0 +1,312 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List
+import threading, queue
+import random
+import json
+import time, os
+
+# OTLP span kind
+INTERNAL, SERVER, CLIENT = 1, 2, 3
+# OTLP status code
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "kind", "sampled",
+                 "start_ns", "end_ns", "attributes", "status", "message", "_tracer")
+
+    def __init__(self, tracer: "Tracer | None", name: str, trace_id: str, parent_id: str | None,
+                 kind: int, sampled: bool, attributes: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.status = STATUS_UNSET
+        self.message = ""
+
+    # W3C trace context (다음 hop 에 전달)
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def error(self, exc: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.message = f"{type(exc).__name__}: {exc}"
+
+    def end(self) -> None:
+        if self.end_ns:
+            return
+        self.end_ns = time.time_ns()
+        if self._tracer is not None and self.sampled:
+            self._tracer._export(self)
+
+    def otlp(self) -> Dict[str, Any]:
+        span = {"traceId": self.trace_id,
+                "spanId": self.span_id,
+                "name": self.name,
+                "kind": self.kind,
+                "startTimeUnixNano": str(self.start_ns),
+                "endTimeUnixNano": str(self.end_ns),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()],
+                "status": {"code": self.status, "message": self.message} if self.message else {"code": self.status}}
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+# tracing 비활성 시 반환되는 span (속성 기록 / export 없음)
+class _NoopSpan(Span):
+    def __init__(self) -> None:
+        super().__init__(None, "", "0" * 32, None, INTERNAL, False, {})
+
+    def set(self, key: str, value: Any) -> None:
+        return None
+
+    def end(self) -> None:
+        return None
+
+
+NOOP_SPAN = _NoopSpan()
+_current: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span:
+    return _current.get() or NOOP_SPAN
+
+
+# "00-{trace_id 32}-{parent_id 16}-{flags 2}" -> (trace_id, parent_id, sampled)
+def parse_traceparent(value: str | None) -> tuple | None:
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], bool(flags & 0x01)
+
+
+# ---------------------------------------------------------------------------------
+# 경량 분산 tracing (W3C traceparent 전파 + OTLP/JSON 파일 export)
+#   - span 은 contextvars 로 현재 task / thread 에 연결 (asyncio task, to_thread 에 자동 전파)
+#   - 종료된 span 은 queue 를 거쳐 writer thread 가 1줄 = 1 ExportTraceServiceRequest (OTLP/JSON) 로 기록
+#     -> 네트워크 없이 동작, OpenTelemetry Collector 의 otlpjsonfile receiver 로 그대로 수집 가능
+#   - queue 가 가득 차면 요청 경로를 막지 않고 버림 (dropped)
+#   lifespan 에서 configure() / shutdown() 호출, 그 전에는 모든 span 이 NOOP
+# ---------------------------------------------------------------------------------
+class Tracer:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.service = "unknown"
+        self.path: str | None = None
+        self.sample_ratio = 1.0
+        self.exported = 0
+        self.dropped = 0
+        self._queue: "queue.Queue[Span | None]" = queue.Queue(maxsize=8192)
+        self._thread: threading.Thread | None = None
+
+    def configure(self, service: str, trace_dir: str, sample_ratio: float = 1.0, enabled: bool = True) -> None:
+        self.service = service
+        self.sample_ratio = sample_ratio
+        if not enabled or self.enabled:
+            return
+        os.makedirs(trace_dir, exist_ok=True)
+        # worker 프로세스 별 파일 (여러 프로세스가 같은 파일에 쓰지 않도록)
+        self.path = os.path.join(trace_dir, f"{service}-{os.getpid()}.otlp.jsonl")
+        self._thread = threading.Thread(target=self._write, name="trace-exporter", daemon=True)
+        self._thread.start()
+        self.enabled = True
+        print(f"[Startup] Tracing -> {self.path} (sample_ratio={sample_ratio})")
+
+    def shutdown(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def start_span(self, name: str, kind: int = INTERNAL, traceparent: str | None = None,
+                   **attributes: Any) -> Span:
+        if not self.enabled:
+            return NOOP_SPAN
+        remote = parse_traceparent(traceparent)
+        parent = _current.get()
+        if remote is not None:
+            trace_id, parent_id, sampled = remote
+        elif parent is not None and parent is not NOOP_SPAN:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        else:
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+            sampled = random.random() < self.sample_ratio
+        return Span(self, name, trace_id, parent_id, kind, sampled, attributes)
+
+    # span 을 현재 context 로 설정한 채 실행 (예외는 span 에 기록 후 다시 raise)
+    @contextmanager
+    def span(self, name: str, kind: int = INTERNAL, **attributes: Any) -> Iterator[Span]:
+        span = self.start_span(name, kind, **attributes)
+        if span is NOOP_SPAN:
+            yield span
+            return
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error(e)
+            raise
+        finally:
+            _current.reset(token)
+            span.end()
+
+    def activate(self, span: Span):
+        return _current.set(span)
+
+    def deactivate(self, token) -> None:
+        _current.reset(token)
+
+    def _export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _write(self) -> None:
+        resource = {"attributes": [{"key": "service.name", "value": {"stringValue": self.service}},
+                                   {"key": "process.pid", "value": {"intValue": str(os.getpid())}}]}
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                item = self._queue.get()
+                batch: List[Span] = []
+                while item is not None:
+                    batch.append(item)
+                    if len(batch) >= 512:
+                        break
+                    try:
+                        item = self._queue.get(timeout=1.0 if len(batch) < 64 else 0)
+                    except queue.Empty:
+                        break
+                if batch:
+                    request = {"resourceSpans": [{"resource": resource,
+                                                  "scopeSpans": [{"scope": {"name": "brainbuddy"},
+                                                                  "spans": [s.otlp() for s in batch]}]}]}
+                    f.write(json.dumps(request, ensure_ascii=False) + "\n")
+                    f.flush()
+                    self.exported += len(batch)
+                if item is None:
+                    return
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled,
+                "path": self.path,
+                "sample_ratio": self.sample_ratio,
+                "exported": self.exported,
+                "dropped": self.dropped,
+                "pending": self._queue.qsize()}
+
+
+tracer = Tracer()
+
+
+# ---------------------------------------------------------------------------------
+# ASGI middleware : HTTP 요청 / WebSocket 연결마다 SERVER span
+#   - 요청의 traceparent 헤더를 이어받고, HTTP 응답에는 traceparent 헤더를 돌려줌 (클라이언트가 다음 요청에 전달)
+#   - nginx 의 X-Request-ID 를 속성으로 남겨 access log 와 연결
+#   - WebSocket span 은 연결 전체 (handshake ~ close), window 별 span 은 handler 에서 자식으로 생성
+# ---------------------------------------------------------------------------------
+class TracingMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] not in ("http", "websocket") or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        is_ws = scope["type"] == "websocket"
+        name = f"WS {scope['path']}" if is_ws else f"{scope['method']} {scope['path']}"
+        span = tracer.start_span(name, SERVER, headers.get("traceparent"),
+                                 **{"url.path": scope["path"],
+                                    "network.protocol.name": scope["type"]})
+        span.set("http.request.method", scope.get("method"))
+        span.set("http.request_id", headers.get("x-request-id"))
+        span.set("client.address", headers.get("x-real-ip") or (scope.get("client") or (None,))[0])
+
+        async def traced_send(message) -> None:
+            kind = message["type"]
+            if kind == "http.response.start":
+                status = message["status"]
+                span.set("http.response.status_code", status)
+                if status >= 500:
+                    span.status = STATUS_ERROR
+                message = {**message, "headers": [*message.get("headers", []),
+                                                  (b"traceparent", span.traceparent.encode())]}
+            elif kind == "websocket.accept":
+                span.set("ws.handshake_ms", round((time.time_ns() - span.start_ns) / 1e6, 2))
+            elif kind == "websocket.close":
+                span.set("ws.close_code", message.get("code", 1000))
+            await send(message)
+
+        token = tracer.activate(span)
+        try:
+            await self.app(scope, receive, traced_send)
+        except BaseException as e:
+            span.error(e)
+            raise
+        finally:
+            tracer.deactivate(token)
+            span.end()
+
+
+# SQLAlchemy (async) engine 의 쿼리마다 CLIENT span
+#   async 세션의 greenlet 은 호출한 task 의 contextvars 를 이어받으므로 요청 / window span 의 자식이 됨
+def instrument_sqlalchemy(engine) -> None:
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not tracer.enabled or _current.get() is None:
+            return
+        operation = statement.lstrip().split(" ", 1)[0].upper()
+        span = tracer.start_span(f"db {operation}", CLIENT,
+                                 **{"db.system": "mysql", "db.statement": statement[:500]})
+        context._trace_span = span
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            span.set("db.rows", cursor.rowcount if cursor.rowcount >= 0 else None)
+            span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context) -> None:
+        span = getattr(exception_context.execution_context, "_trace_span", None)
+        if span is not None:
+            span.error(exception_context.original_exception)
+            span.end()
@@ -0,0 +1,110 @@
+from collections import deque
+from typing import Any, Deque, Dict, List
+import traceback
+import threading
+import bisect
+import asyncio
+import time, sys
+
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+# ---------------------------------------------------------------------------------
+# 이벤트 루프 지연(lag) 감시
+#   - 루프 안의 ticker 가 interval 마다 깨어나며 (실제 경과 - interval) 을 lag 로 기록 -> histogram
+#   - 별도 thread 가 ticker 의 마지막 박동(beat)을 감시, threshold 이상 멈춰 있으면
+#     그 순간 루프 thread 의 stack 을 캡처 (블로킹 중인 동기 코드 위치)
+# ---------------------------------------------------------------------------------
+class LoopWatchdog:
+    def __init__(self, interval_ms: float = 100, threshold_ms: float = 200, keep: int = 20) -> None:
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.counts: List[int] = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.samples = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=keep)
+        self._beat = time.monotonic()
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    # 이벤트 루프 thread 에서 호출 (lifespan startup)
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    async def _tick(self) -> None:
+        while True:
+            t0 = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._beat = time.monotonic()
+            self._observe((self._beat - t0 - self.interval) * 1000)
+
+    def _observe(self, lag_ms: float) -> None:
+        lag_ms = max(0.0, lag_ms)
+        self.samples += 1
+        self.total_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        self.counts[bisect.bisect_left(LAG_BUCKETS_MS, lag_ms)] += 1
+        # 방금 끝난 stall 의 최종 지연 기록
+        if lag_ms >= self.threshold * 1000 and self.stalls and self.stalls[-1]["lag_ms"] is None:
+            self.stalls[-1]["lag_ms"] = round(lag_ms, 1)
+
+    def _watch(self) -> None:
+        captured_beat = None
+        while not self._stop.wait(self.interval / 2):
+            beat = self._beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked < self.threshold or beat == captured_beat:
+                continue
+            captured_beat = beat     # stall 1회당 stack 1번만 캡처
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = traceback.format_stack(frame)[-15:] if frame is not None else []
+            self.stalls.append({"at": time.time(),
+                                "blocked_ms": round(blocked * 1000, 1),   # 캡처 시점까지의 지연
+                                "lag_ms": None,                           # 루프 재개 후 최종 지연
+                                "stack": [line.rstrip() for line in stack]})
+            print(f"[Watchdog] event loop blocked for {blocked * 1000:.0f}ms+ at:\n{''.join(stack[-4:])}")
+
+    def _percentile(self, q: float) -> float | None:
+        if self.samples == 0:
+            return None
+        target, seen = q * self.samples, 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return float(LAG_BUCKETS_MS[idx]) if idx < len(LAG_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def stats(self) -> Dict[str, Any]:
+        labels = [f"le_{b}ms" for b in LAG_BUCKETS_MS] + ["inf"]
+        return {"interval_ms": self.interval * 1000,
+                "threshold_ms": self.threshold * 1000,
+                "samples": self.samples,
+                "avg_ms": round(self.total_ms / self.samples, 2) if self.samples else 0.0,
+                "p50_ms": self._percentile(0.50),
+                "p99_ms": self._percentile(0.99),
+                "max_ms": round(self.max_ms, 1),
+                "histogram": dict(zip(labels, self.counts)),
+                "stalls": list(self.stalls)}
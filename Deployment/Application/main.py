@@ -2,16 +2,31 @@ from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 
 from Application.api.auth import router as auth_router
 from Application.api.dashboard import router as dashboard_router
+from Application.api.admin import router as admin_router
+from Application.api.admin.router import loop_watchdog
+from Application.core.tracing import tracer, TracingMiddleware
+from Application.core.config import TRACE_ENABLED, TRACE_DIR, TRACE_SAMPLE_RATIO
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    loop_watchdog.start()
+    tracer.configure("brainbuddy-was", TRACE_DIR, TRACE_SAMPLE_RATIO, enabled=TRACE_ENABLED)
+    yield
+    await loop_watchdog.stop()
+    tracer.shutdown()
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(TracingMiddleware)
 
 
 app.include_router(auth_router, prefix="/api/auth")
 app.include_router(dashboard_router, prefix="/api/dashboard")
+app.include_router(admin_router, prefix="/api/admin")
 
 @app.exception_handler(HTTPException)
 async def custom_error_handler(request: Request, exc: HTTPException) -> JSONResponse:
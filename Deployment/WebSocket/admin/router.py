@@ -0,0 +1,191 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+import asyncio
+import os
+
+from WebSocket.core.deps import Admin
+from WebSocket.core.watchdog import LoopWatchdog
+from WebSocket.core.sampler import SamplingProfiler, MAX_SECONDS, MAX_HZ
+from WebSocket.core.heaptrace import HeapTracer
+from WebSocket.core.utils import process_memory
+from WebSocket.core.config import LOOP_LAG_INTERVAL_MS, LOOP_LAG_THRESHOLD_MS, WS_PRELOAD, WS_WORKERS
+from WebSocket.service import ModelService, RealTimeService
+from WebSocket.ws.handler import manager, focus_tracker
+
+router = APIRouter(dependencies=[Depends(Admin.Verify)])
+
+# 이벤트 루프 지연 감시기 (main.py lifespan 에서 start / stop)
+loop_watchdog = LoopWatchdog(LOOP_LAG_INTERVAL_MS, LOOP_LAG_THRESHOLD_MS)
+# 요청 시에만 켜는 tracemalloc heap diff
+heap_tracer = HeapTracer()
+
+
+# --- 이벤트 루프 지연 histogram / 블로킹 stack [HTTP GET : http://{ServerDNS}/admin/loop] ---
+@router.get(path="/loop",
+            summary="Event Loop Lag",
+            description="Event-loop scheduling lag histogram and stacks captured while the loop was blocked.")
+async def get_loop_lag() -> dict:
+    return loop_watchdog.stats()
+# ---------------------------------------------------------------------------------------
+
+
+# --- 전체 thread sampling profile [HTTP GET : http://{ServerDNS}/admin/sample?seconds=10&hz=100&format=collapsed] ---
+@router.get(path="/sample",
+            summary="Sampling Profile",
+            description="Sample every thread's stack (event loop, inference slots) for a bounded time. "
+                        "Returns collapsed stacks (flamegraph) or speedscope JSON.")
+async def sample_profile(seconds: float = Query(default=10.0, gt=0, le=MAX_SECONDS),
+                         hz: float = Query(default=100.0, ge=1, le=MAX_HZ),
+                         format: str = Query(default="collapsed", pattern="^(collapsed|speedscope)$")):
+    if SamplingProfiler.busy():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A sampling profile is already running")
+    try:
+        profiler = await asyncio.to_thread(SamplingProfiler(seconds, hz).run)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if format == "speedscope":
+        return {**profiler.speedscope(), "info": profiler.info()}
+    return PlainTextResponse(profiler.collapsed())
+# ----------------------------------------------------------------------------------------------------------------
+
+
+# --- 메모리 진단 [HTTP GET : http://{ServerDNS}/admin/memory] ---
+@router.get(path="/memory",
+            summary="Memory Diagnostics",
+            description="Process RSS, model bytes per version, torch allocator, buffered frames per connection "
+                        "and FocusTracker sizes.")
+async def get_memory() -> dict:
+    return {"process": process_memory(),
+            "model": ModelService.memory(),
+            "connections": len(manager.connections),
+            "buffered_frames": RealTimeService.buffer_stats(),
+            "frame_store": RealTimeService.frame_store.stats() if RealTimeService.frame_store else None,
+            "focus_tracker": focus_tracker.stats(),
+            "tracemalloc": heap_tracer.status()}
+# ----------------------------------------------------------------
+
+
+# --- tracemalloc snapshot diff [HTTP POST : http://{ServerDNS}/admin/memory/snapshot?top=20&frames=1] ---
+@router.post(path="/memory/snapshot",
+             summary="Heap Snapshot Diff",
+             description="First call starts tracemalloc and records a baseline; each later call returns the top-N "
+                         "allocation growth since the previous snapshot. frames > 1 groups by traceback.")
+async def heap_snapshot(top: int = Query(default=20, ge=1, le=200),
+                        frames: int = Query(default=1, ge=1, le=25)) -> dict:
+    return await asyncio.to_thread(heap_tracer.snapshot, top, frames)
+# --------------------------------------------------------------------------------------------------------
+
+
+# --- tracemalloc 종료 (할당마다 붙는 추적 비용 제거) [HTTP DELETE : http://{ServerDNS}/admin/memory/snapshot] ---
+@router.delete(path="/memory/snapshot",
+               summary="Stop Heap Tracing",
+               description="Stop tracemalloc and drop the baseline snapshot.")
+async def stop_heap_tracing() -> dict:
+    return heap_tracer.stop()
+# ---------------------------------------------------------------------------------------------------------
+
+
+# --- 세션 녹화 현황 [HTTP GET : http://{ServerDNS}/admin/record] ---
+@router.get(path="/record",
+            summary="Session Recordings",
+            description="Show recording settings, users armed for their next connection and active recordings.")
+async def get_recordings() -> dict:
+    return RealTimeService.recording_stats()
+# -----------------------------------------------------------------
+
+
+# --- 다음 연결 1회 녹화 지정 [HTTP POST : http://{ServerDNS}/admin/record?user_name=...] ---
+@router.post(path="/record",
+             status_code=status.HTTP_202_ACCEPTED,
+             summary="Record Next Session",
+             description="Record the given user's next WebSocket connection into RECORD_DIR for offline replay.")
+async def arm_recording(user_name: str = Query(min_length=1)) -> dict:
+    RealTimeService.armed.add(user_name)
+    return RealTimeService.recording_stats()
+# ------------------------------------------------------------------------------------------
+
+
+# --- 라이브 프로파일링 요청 [HTTP POST : http://{ServerDNS}/admin/profile?windows=N] ---
+@router.post(path="/profile",
+             status_code=status.HTTP_202_ACCEPTED,
+             summary="Profile Live Inference",
+             description="Run the next N inference windows under the torch profiler and write reports to PROFILE_DIR.")
+async def profile_inference(windows: int = Query(default=3, ge=1, le=50)) -> dict:
+    out_dir = ModelService.request_profile(windows)
+    return {"status": "scheduled", "windows": windows, "out_dir": out_dir}
+# ------------------------------------------------------------------------------------
+
+
+# --- 추론 통계 조회 [HTTP GET : http://{ServerDNS}/admin/stats] ---
+@router.get(path="/stats",
+            summary="Inference Stats",
+            description="Show inference executor queue depth and near-duplicate window reuse counters.")
+async def get_stats() -> dict:
+    return ModelService.stats()
+# -------------------------------------------------------------------
+
+
+# --- 연결 별 frame rate / window 수집 시간 [HTTP GET : http://{ServerDNS}/admin/clients] ---
+@router.get(path="/clients",
+            summary="Client Frame Rates",
+            description="Show each connection's measured frame rate and window fill time.")
+async def get_clients() -> dict:
+    return RealTimeService.client_stats()
+# ------------------------------------------------------------------------------------------
+
+
+# 모델 교체 / rollback 은 요청을 받은 worker 프로세스의 상태만 바꿈
+#   preload 다중 worker 에서는 worker 마다 다른 버전을 서비스하게 되므로 거부 -> MODEL_PATH 변경 후 재시작으로 교체
+def _require_single_worker() -> None:
+    if WS_PRELOAD and WS_WORKERS > 1:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                            detail=f"Model swap/rollback only affects the worker that serves the request; "
+                                   f"refused with {WS_WORKERS} preloaded workers. Change MODEL_PATH and restart instead.")
+
+
+# --- 모델 버전 조회 [HTTP GET : http://{ServerDNS}/admin/models] ---
+@router.get(path="/models",
+            summary="Model Versions",
+            description="Show the active, previous (rollback) and loading model versions of the worker that answered.")
+async def get_models() -> dict:
+    return {"pid": os.getpid(), "workers": WS_WORKERS if WS_PRELOAD else 1, **ModelService.versions()}
+# ------------------------------------------------------------------
+
+
+async def _swap_in_background(ckpt: str | None) -> None:
+    try:
+        await ModelService.swap_model(ckpt)
+    except Exception as e:
+        print(f"[ERROR] Model swap failed ({ckpt}): {e}")
+
+
+# --- 새 모델 버전 로드 후 무중단 교체 [HTTP POST : http://{ServerDNS}/admin/models/load?ckpt=...] ---
+@router.post(path="/models/load",
+             status_code=status.HTTP_202_ACCEPTED,
+             summary="Hot-swap Model",
+             description="Load and warm up a checkpoint in the background, then switch new windows to it. "
+                         "Refused (409) when more than one preloaded worker is running.")
+async def load_model(background: BackgroundTasks,
+                     ckpt: str | None = Query(default=None)) -> dict:
+    _require_single_worker()
+    if ModelService.loading is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                            detail=f"Another model is loading: {ModelService.loading}")
+    background.add_task(_swap_in_background, ckpt)
+    return {"status": "loading", "ckpt": ckpt, **ModelService.versions()}
+# ---------------------------------------------------------------------------------------------------
+
+
+# --- 직전 버전으로 즉시 rollback [HTTP POST : http://{ServerDNS}/admin/models/rollback] ---
+@router.post(path="/models/rollback",
+             summary="Rollback Model",
+             description="Switch new windows back to the previous model version. "
+                         "Refused (409) when more than one preloaded worker is running.")
+async def rollback_model() -> dict:
+    _require_single_worker()
+    try:
+        ModelService.rollback()
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return ModelService.versions()
+# -----------------------------------------------------------------------------------------
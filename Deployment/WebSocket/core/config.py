@@ -29,4 +29,55 @@ MYSQL_DB_URL = os.getenv("MYSQL_DB_URL")
 TIME_OUT = int(os.getenv("TIME_OUT"))
 N_FRAMES = int(os.getenv("N_FRAMES"))
 FRAME_DIR = os.getenv("FRAME_DIR")
-MODEL_PATH = os.getenv("MODEL_PATH")
\ No newline at end of file
+FRAME_STORE = os.getenv("FRAME_STORE", "memory")             # memory | tmpfs | disk
+TMPFS_FRAME_DIR = os.getenv("TMPFS_FRAME_DIR", "/dev/shm/brainbuddy/frames")
+FRAME_STORE_CAPACITY = int(os.getenv("FRAME_STORE_CAPACITY", "16"))
+FRAME_STORE_BATCH = int(os.getenv("FRAME_STORE_BATCH", "8"))
+WINDOW_MODE = os.getenv("WINDOW_MODE", "frames")                    # frames | span
+WINDOW_SPAN_SEC = float(os.getenv("WINDOW_SPAN_SEC", "10"))
+WINDOW_MIN_FRAMES = int(os.getenv("WINDOW_MIN_FRAMES", "10"))
+WINDOW_MAX_FRAMES = int(os.getenv("WINDOW_MAX_FRAMES", "90"))
+FRAME_MAX_BYTES = int(os.getenv("FRAME_MAX_BYTES", "524288"))         # 프레임 1장 최대 크기
+FRAME_MAX_WIDTH = int(os.getenv("FRAME_MAX_WIDTH", "1920"))
+FRAME_MAX_HEIGHT = int(os.getenv("FRAME_MAX_HEIGHT", "1080"))
+FRAME_MAX_VIOLATIONS = int(os.getenv("FRAME_MAX_VIOLATIONS", "30"))  # FRAME_VIOLATION_WINDOW_SEC 동안 허용 불량 프레임 수
+FRAME_VIOLATION_WINDOW_SEC = float(os.getenv("FRAME_VIOLATION_WINDOW_SEC", "10"))
+RECORD_ENABLED = os.getenv("RECORD_ENABLED", "false").lower() == "true"
+RECORD_USERS = {u.strip() for u in os.getenv("RECORD_USERS", "").split(",") if u.strip()}   # 비어 있으면 전체
+RECORD_DIR = os.getenv("RECORD_DIR", "/tmp/brainbuddy/recordings")
+RECORD_MAX_MB = int(os.getenv("RECORD_MAX_MB", "200"))                # 세션 당 녹화 상한
+MODEL_PATH = os.getenv("MODEL_PATH") or "WebSocket/model/best_model_epoch_4.pt"
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "/tmp/brainbuddy/profiles")
+LOOP_LAG_INTERVAL_MS = float(os.getenv("LOOP_LAG_INTERVAL_MS", "100"))
+LOOP_LAG_THRESHOLD_MS = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "200"))
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "false").lower() == "true"
+TRACE_DIR = os.getenv("TRACE_DIR", "/tmp/brainbuddy/traces")
+TRACE_SAMPLE_RATIO = float(os.getenv("TRACE_SAMPLE_RATIO", "1.0"))
+
+WS_BIND_HOST = os.getenv("WS_BIND_HOST", "0.0.0.0")
+WS_BIND_PORT = int(os.getenv("WS_BIND_PORT", "9000"))
+WS_WORKERS = int(os.getenv("WS_WORKERS", "1"))
+WS_PRELOAD = os.getenv("WS_PRELOAD", "false").lower() == "true"
+WS_SHARE_WEIGHTS = os.getenv("WS_SHARE_WEIGHTS", "false").lower() == "true"
+WS_SHUTDOWN_TIMEOUT = float(os.getenv("WS_SHUTDOWN_TIMEOUT", "30"))
+
+INFER_SLOTS = int(os.getenv("INFER_SLOTS", "1"))
+INFER_THREADS_PER_SLOT = int(os.getenv("INFER_THREADS_PER_SLOT", "0"))   # 0 : core 수 / slot 수
+INFER_CPU_AFFINITY = os.getenv("INFER_CPU_AFFINITY", "false").lower() == "true"
+INFER_AUTOTUNE = os.getenv("INFER_AUTOTUNE", "false").lower() == "true"
+
+SCHED_POLICY = os.getenv("SCHED_POLICY", "edf")                      # edf | rr
+SCHED_DEADLINE_SEC = float(os.getenv("SCHED_DEADLINE_SEC", "10"))
+
+DEGRADE_ENABLED = os.getenv("DEGRADE_ENABLED", "false").lower() == "true"
+DEGRADE_QUEUE_HIGH = int(os.getenv("DEGRADE_QUEUE_HIGH", "4"))
+DEGRADE_QUEUE_LOW = int(os.getenv("DEGRADE_QUEUE_LOW", "1"))
+DEGRADE_P95_HIGH_MS = float(os.getenv("DEGRADE_P95_HIGH_MS", "1500"))
+DEGRADE_P95_LOW_MS = float(os.getenv("DEGRADE_P95_LOW_MS", "700"))
+DEGRADE_DWELL_SEC = float(os.getenv("DEGRADE_DWELL_SEC", "10"))
+
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "false").lower() == "true"
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.02"))      # 서명 평균 절대 차이 (0.0 ~ 1.0)
+DEDUP_MAX_STREAK = int(os.getenv("DEDUP_MAX_STREAK", "3"))
@@ -2,10 +2,12 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from WebSocket.core.config import MYSQL_DB_URL
+from WebSocket.core.tracing import instrument_sqlalchemy
 
 # 비동기 엔진(async engine) 생성
 # # 실제 AWS 운영 DB
 async_engine = create_async_engine(MYSQL_DB_URL, pool_pre_ping=True)
+instrument_sqlalchemy(async_engine.sync_engine)   # 쿼리 별 trace span (TRACE_ENABLED)
 
 # 비동기 세션 메이커(async_sessionmaker) 생성
 AsyncSessionLocal = async_sessionmaker( bind=async_engine,     # bind the async engine
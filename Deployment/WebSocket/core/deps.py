@@ -1,10 +1,11 @@
-from fastapi import WebSocket, WebSocketException, Cookie, status
+from fastapi import WebSocket, WebSocketException, HTTPException, Request, Cookie, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import AsyncGenerator, Dict, Set
+import hmac
 
 from WebSocket.core.database import AsyncSessionLocal  # 공통 세션메이커(sessionmaker)
 
-from WebSocket.core.config import ACCESS, REFRESH
+from WebSocket.core.config import ACCESS, REFRESH, ADMIN_TOKEN
 
 RequiredQuery: Set[str] = {"user_name", "subject", "location"}
 
@@ -62,6 +63,15 @@ class Get:
     #                             detail="None User Name")
     #     return user_name
 
+class Admin:
+    # 운영(admin) route 인증 : X-Admin-Token 헤더와 ADMIN_TOKEN 비교
+    @staticmethod
+    def Verify(request: Request) -> None:
+        token = request.headers.get("X-Admin-Token")
+        if not ADMIN_TOKEN or token is None or not hmac.compare_digest(token, ADMIN_TOKEN):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Invalid admin token")
+
 class AsyncDB:
     async def get_db() -> AsyncGenerator[AsyncSession, None]:
         async with AsyncSessionLocal() as session:    # 현재 하나의 세션만 사용 ()
@@ -12,4 +12,30 @@ class TokenVerdict(Enum):
 
     @property
     def reason(self):
-        return self.value[1]
\ No newline at end of file
+        return self.value[1]
+
+
+# 프레임 검증(validation) 결과 : 거부 시 code / reason 으로 연결 종료
+class FrameVerdict(Enum):
+    VALID = (1000, "OK")
+    EMPTY = (1007, "Empty frame.")
+    TOO_LARGE = (1009, "Frame too large.")
+    UNKNOWN_FORMAT = (1007, "Frame is not a JPEG/PNG image.")
+    BAD_DIMENSIONS = (1007, "Frame dimensions out of range.")
+    HEADER_MISMATCH = (1007, "Frame header does not match the image.")
+    MALFORMED_MESSAGE = (1007, "Malformed window message.")
+    TOO_MANY_VIOLATIONS = (1008, "Too many invalid frames.")
+
+    @property
+    def code(self):
+        return self.value[0]
+
+    @property
+    def reason(self):
+        return self.value[1]
+
+
+class FrameViolationError(Exception):
+    def __init__(self, verdict: FrameVerdict) -> None:
+        super().__init__(verdict.reason)
+        self.verdict = verdict
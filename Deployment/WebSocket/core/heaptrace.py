@@ -0,0 +1,79 @@
+from typing import Any, Dict
+import tracemalloc
+import threading
+import time
+
+# tracemalloc 자기 자신 / import 시스템 할당은 diff 에서 제외
+_EXCLUDE = (tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"))
+
+
+# ---------------------------------------------------------------------------------
+# 요청 시에만 켜는 tracemalloc 기반 heap diff (재시작 없이 누수 위치 추적)
+#   1번째 snapshot : tracing 시작 + 기준(baseline) 저장
+#   이후 snapshot  : 직전 snapshot 대비 증가량 top-N (파일:line 또는 traceback 단위) 반환 후 기준 갱신
+#   tracing 중에는 모든 할당에 비용이 붙으므로 조사가 끝나면 stop
+#   torch 텐서 / numpy 배열의 데이터 버퍼는 Python 할당자를 거치지 않아 집계되지 않음 (객체 header 만 보임)
+# ---------------------------------------------------------------------------------
+class HeapTracer:
+    def __init__(self, max_frames: int = 25) -> None:
+        self.max_frames = max_frames
+        self.frames = 1
+        self.snapshots = 0
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._taken_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def _take(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_EXCLUDE)
+
+    # asyncio.to_thread 로 호출 (snapshot 비교는 heap 크기에 비례)
+    def snapshot(self, top: int = 20, frames: int = 1) -> Dict[str, Any]:
+        with self._lock:
+            if not tracemalloc.is_tracing() or self._baseline is None:
+                self.frames = max(1, min(frames, self.max_frames))
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start(self.frames)
+                self._baseline, self._taken_at = self._take(), time.time()
+                self.snapshots = 1
+                return {"status": "tracing started", "frames": self.frames, **self.status()}
+            current, now = self._take(), time.time()
+            key = "traceback" if self.frames > 1 else "lineno"
+            diff = current.compare_to(self._baseline, key)
+            interval = now - self._taken_at
+            self._baseline, self._taken_at = current, now
+            self.snapshots += 1
+        return {"status": "diff",
+                "interval_sec": round(interval, 1),
+                "growth_bytes": sum(s.size_diff for s in diff),
+                "top": [self._entry(s) for s in diff[:top]],
+                **self.status()}
+
+    @staticmethod
+    def _entry(stat: tracemalloc.StatisticDiff) -> Dict[str, Any]:
+        return {"size_diff": stat.size_diff,
+                "size": stat.size,
+                "count_diff": stat.count_diff,
+                "count": stat.count,
+                "traceback": [f"{f.filename}:{f.lineno}" for f in stat.traceback]}
+
+    def stop(self) -> Dict[str, Any]:
+        with self._lock:
+            self._baseline = None
+            self.snapshots = 0
+            tracemalloc.stop()
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {"tracing": tracemalloc.is_tracing(),
+                "snapshots": self.snapshots,
+                "traced_bytes": current,
+                "traced_peak_bytes": peak,
+                "overhead_bytes": tracemalloc.get_tracemalloc_memory()}
@@ -0,0 +1,27 @@
+from typing import List
+
+# 집중도 타임라인(timeline) 직렬화 포맷
+#   [0]     : 포맷 버전(version)
+#   [1:]    : (value, run) uint8 쌍의 반복 -> run-length 압축
+#             value : 해당 window 의 집중도 (0 ~ 10)
+#             run   : 동일 value 가 연속된 window 수 (1 ~ 255)
+TIMELINE_VERSION = 1
+MAX_RUN = 255
+
+
+# window 별 집중도 시계열을 RLE 압축 bytes 로 변환
+def encode_timeline(values: bytes | bytearray | List[int]) -> bytes:
+    out = bytearray([TIMELINE_VERSION])
+    prev, run = None, 0
+    for v in values:
+        v = min(max(int(v), 0), 255)
+        if v == prev and run < MAX_RUN:
+            run += 1
+            continue
+        if prev is not None:
+            out += bytes((prev, run))
+        prev, run = v, 1
+    if prev is not None:
+        out += bytes((prev, run))
+    return bytes(out)
+
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from PIL import Image
 import io
 import os
@@ -15,4 +15,17 @@ def save_bytes_list_as_jpegs(bytes_list: List[bytes], origin: str) -> str:
         except Exception as e:
             print(f"[ERROR] :    frame_{idx:04d}: {e}")
     print(f"[DEBUG] :        Saved {len(bytes_list)} images to {file_dir}")
-    return file_dir
\ No newline at end of file
+    return file_dir
+
+
+# 프로세스 메모리 : rss(전체), uss(고유 page), pss(공유 page 를 비례 배분), shared(공유 page)
+def process_memory(pid: int | None = None) -> Dict[str, int]:
+    try:
+        import psutil
+        info = psutil.Process(pid or os.getpid()).memory_full_info()
+        return {"rss": info.rss,
+                "uss": getattr(info, "uss", 0),
+                "pss": getattr(info, "pss", 0),
+                "shared": getattr(info, "shared", 0)}
+    except Exception:
+        return {}
\ No newline at end of file
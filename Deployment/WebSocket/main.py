@@ -1,18 +1,49 @@
+import os, time
+_BOOT = time.perf_counter()
+
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from WebSocket.ws import router as ws_handler
-from WebSocket.service import ModelService
+from WebSocket.admin import router as admin_router
+from WebSocket.admin.router import loop_watchdog
+from WebSocket.service import ModelService, RealTimeService
+from WebSocket.core.config import MODEL_PATH, TRACE_ENABLED, TRACE_DIR, TRACE_SAMPLE_RATIO
+from WebSocket.core.tracing import tracer, TracingMiddleware
+from WebSocket.core.utils import process_memory
+
+IMPORT_SEC = time.perf_counter() - _BOOT
+
+def print_process_memory() -> None:
+    mem = process_memory()
+    if mem:
+        print(f"[Memory] pid={os.getpid()} " + " ".join(f"{k}={v / 2**20:.1f}MB" for k, v in mem.items()))
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("[Startup] 모델 로딩 중...")
-    ModelService.init_model("WebSocket/model/best_model_epoch_4.pt", "cpu")
+    t0 = time.perf_counter()
+    ModelService.init_model(MODEL_PATH, "cpu")   # preload 모드에서는 부모가 이미 로드 -> 즉시 반환
+    ModelService.ensure_warm()
+    ModelService.init_executor()
     print("[Startup] 모델 로드 완료")
     ModelService.print_footprint()
+    print_process_memory()
+    RealTimeService.init_store()
+    loop_watchdog.start()
+    tracer.configure("brainbuddy-ws", TRACE_DIR, TRACE_SAMPLE_RATIO, enabled=TRACE_ENABLED)
+    print(f"[Startup] ready : import={IMPORT_SEC * 1000:.1f}ms, "
+          f"model={(time.perf_counter() - t0) * 1000:.1f}ms, total={(time.perf_counter() - _BOOT) * 1000:.1f}ms")
     yield
+    await loop_watchdog.stop()
+    tracer.shutdown()
+    await RealTimeService.close_store()
+    await RealTimeService.close_recordings()
+    ModelService.shutdown_executor()
     print("[Shutdown] 서버 종료")
 
 ws_app = FastAPI(lifespan=lifespan)
+ws_app.add_middleware(TracingMiddleware)
 
-ws_app.include_router(ws_handler, prefix="/ws")
\ No newline at end of file
+ws_app.include_router(ws_handler, prefix="/ws")
+ws_app.include_router(admin_router, prefix="/admin")
\ No newline at end of file
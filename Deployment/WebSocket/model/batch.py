@@ -0,0 +1,183 @@
+# 저장된 프레임 폴더들을 일괄 재채점(batch re-scoring)하는 오프라인 CLI
+#   python -m WebSocket.model.batch --ckpt WebSocket/model/best_model_epoch_4.pt --root /data/frames --out scores.csv
+import os, csv, time
+import argparse
+from typing import Dict, Iterator, List, Set, Tuple
+
+import torch
+from torch.utils.data import Dataset, DataLoader
+
+from .inference import (NUM_FRAMES_DEFAULT, IMAGE_EXTS,
+                        load_frames_from_folder, find_latest_best_model, load_models_cached)
+
+FIELDS = ["folder", "prob", "pred"]
+
+
+# root 이하에서 이미지 프레임을 직접 포함하는 폴더를 정렬된 순서로 탐색
+def iter_frame_folders(root: str) -> Iterator[str]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        if any(f.lower().endswith(IMAGE_EXTS) for f in filenames):
+            yield os.path.relpath(dirpath, root)
+
+
+class FrameFolderDataset(Dataset):
+    def __init__(self, root: str, folders: List[str], num_frames: int = NUM_FRAMES_DEFAULT) -> None:
+        self.root = root
+        self.folders = folders
+        self.num_frames = num_frames
+
+    def __len__(self) -> int:
+        return len(self.folders)
+
+    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, str]:
+        folder = self.folders[idx]
+        try:
+            video = load_frames_from_folder(os.path.join(self.root, folder), self.num_frames)
+        except Exception as e:
+            print(f"[ERROR] : {folder}: {e}")
+            video = torch.empty(0)   # collate 에서 제외
+        return video, folder
+
+
+def collate_windows(batch: List[Tuple[torch.Tensor, str]]) -> Tuple[torch.Tensor, List[str]]:
+    batch = [(v, f) for v, f in batch if v.numel() > 0]
+    if not batch:
+        return torch.empty(0), []
+    videos, folders = zip(*batch)
+    return torch.stack(videos, dim=0), list(folders)   # (B,T,3,224,224)
+
+
+# ===== 결과 기록(writer) : CSV 는 append, Parquet 은 batch 마다 part 파일 추가 =====
+class CsvSink:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def done(self) -> Set[str]:
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path, newline="") as f:
+            return {row["folder"] for row in csv.DictReader(f)}
+
+    def __enter__(self) -> "CsvSink":
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._f = open(self.path, "a", newline="")
+        self._w = csv.DictWriter(self._f, fieldnames=FIELDS)
+        if new:
+            self._w.writeheader()
+        return self
+
+    def write(self, rows: List[Dict]) -> None:
+        self._w.writerows(rows)
+        self._f.flush()   # 중단되어도 처리한 batch 까지는 보존 -> 재시작시 resume
+
+    def __exit__(self, *exc) -> None:
+        self._f.close()
+
+
+class ParquetSink:
+    def __init__(self, path: str) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from e
+        self.pa, self.pq = pa, pq
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _parts(self) -> List[str]:
+        return sorted(f for f in os.listdir(self.path) if f.endswith(".parquet"))
+
+    def done(self) -> Set[str]:
+        folders: Set[str] = set()
+        for part in self._parts():
+            table = self.pq.read_table(os.path.join(self.path, part), columns=["folder"])
+            folders.update(table.column("folder").to_pylist())
+        return folders
+
+    def __enter__(self) -> "ParquetSink":
+        self._seq = len(self._parts())
+        return self
+
+    def write(self, rows: List[Dict]) -> None:
+        table = self.pa.Table.from_pylist(rows)
+        tmp = os.path.join(self.path, f".part-{self._seq:06d}.tmp")
+        self.pq.write_table(table, tmp)
+        os.replace(tmp, os.path.join(self.path, f"part-{self._seq:06d}.parquet"))   # 원자적 rename
+        self._seq += 1
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+@torch.inference_mode()
+def score_tree(root: str, ckpt_path: str, out: str, fmt: str = "csv", batch_size: int = 8,
+               num_workers: int = 4, threshold: float | None = None, device_str: str | None = None,
+               log_every: int = 10) -> Dict[str, float]:
+    device = torch.device(device_str or ("cuda" if torch.cuda.is_available() else "cpu"))
+    if os.path.isdir(ckpt_path):
+        ckpt_path = find_latest_best_model(ckpt_path)
+    cnn, head, meta = load_models_cached(os.path.abspath(ckpt_path), str(device))   # 모델은 1회만 로드
+    # 기본 threshold : 서버(ModelService, threshold_type="acc")와 같은 체크포인트의 thr_acc (없으면 0.5)
+    if threshold is None:
+        threshold = float(meta["thr_acc"]) if meta.get("thr_acc") is not None else 0.5
+
+    sink = ParquetSink(out) if fmt == "parquet" else CsvSink(out)
+    done = sink.done()
+    folders = [f for f in iter_frame_folders(root) if f not in done]
+    print(f"[Batch] {len(folders)} folders to score ({len(done)} already done) | device={device} | threshold={threshold}")
+
+    loader = DataLoader(FrameFolderDataset(root, folders),
+                        batch_size=batch_size,
+                        num_workers=num_workers,
+                        collate_fn=collate_windows,
+                        pin_memory=(device.type == "cuda"),
+                        persistent_workers=num_workers > 0)
+
+    n_windows, t_model = 0, 0.0
+    start = time.perf_counter()
+    with sink:
+        for step, (video, names) in enumerate(loader, start=1):
+            if not names:
+                continue
+            t0 = time.perf_counter()
+            probs = torch.sigmoid(head(cnn(video.to(device, non_blocking=True)))).view(-1).tolist()
+            t_model += time.perf_counter() - t0
+            sink.write([{"folder": name, "prob": prob, "pred": int(prob >= threshold)}
+                        for name, prob in zip(names, probs)])
+            n_windows += len(names)
+            if step % log_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"[Batch] {n_windows}/{len(folders)} windows | {n_windows / elapsed:.2f} win/s")
+
+    elapsed = time.perf_counter() - start
+    stats = {"windows": n_windows,
+             "threshold": threshold,
+             "elapsed_sec": round(elapsed, 3),
+             "windows_per_sec": round(n_windows / elapsed, 3) if elapsed > 0 else 0.0,
+             "frames_per_sec": round(n_windows * NUM_FRAMES_DEFAULT / elapsed, 3) if elapsed > 0 else 0.0,
+             "model_sec": round(t_model, 3),
+             "load_wait_sec": round(elapsed - t_model, 3)}   # DataLoader 대기 시간 포함
+    print(f"[Batch] done : {stats}")
+    return stats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ckpt", required=True, help="Checkpoint file or directory of best_model_epoch_*.pt")
+    ap.add_argument("--root", required=True, help="Directory tree containing frame folders")
+    ap.add_argument("--out", required=True, help="Output CSV file, or Parquet directory with --format parquet")
+    ap.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    ap.add_argument("--batch-size", type=int, default=8)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--threshold", type=float, default=None,
+                    help="Override the decision threshold (default: the checkpoint's thr_acc, as the server uses)")
+    ap.add_argument("--device", default=None)
+    args = ap.parse_args()
+
+    score_tree(args.root, args.ckpt, args.out, fmt=args.format, batch_size=args.batch_size,
+               num_workers=args.workers, threshold=args.threshold, device_str=args.device)
+
+if __name__ == "__main__":
+    main()
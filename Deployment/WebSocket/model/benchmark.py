@@ -0,0 +1,209 @@
+# 모델 서빙 비용 벤치마크 (architecture x execution mode x thread 수)
+#   python -m WebSocket.model.benchmark --codeset-model ../CodeSet/WebSocket/model/model.py --out bench/
+#
+# 각 설정은 별도 프로세스(spawn)에서 실행 -> peak RSS, thread 설정, compile 캐시가 서로 섞이지 않음
+import os, io, json, time, platform
+import argparse
+import importlib.util
+import multiprocessing as mp
+import queue
+from typing import Any, Callable, Dict, List
+
+import torch
+import torch.nn as nn
+
+from .inference import NUM_FRAMES_DEFAULT, build_models
+
+MODES = ("eager", "compiled", "quantized")
+ARCHS = ("mobilenet_v3", "resnet18_lstm")
+
+
+# ===== architecture 별 모듈 리스트 생성 =====
+def _build_mobilenet(_: str | None) -> List[nn.Module]:
+    cnn, head = build_models(torch.device("cpu"))
+    return [cnn, head]
+
+def _build_resnet18(codeset_model: str | None) -> List[nn.Module]:
+    # CodeSet/WebSocket/model/model.py 를 파일 경로로 로드 (패키지 이름이 동일하여 import 불가)
+    if not codeset_model:
+        raise ValueError("--codeset-model is required for resnet18_lstm")
+    spec = importlib.util.spec_from_file_location("codeset_model", codeset_model)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    model = module.CNN_LSTM(pretrained=False).eval()
+    return [model]
+
+BUILDERS = {"mobilenet_v3": _build_mobilenet, "resnet18_lstm": _build_resnet18}
+
+
+# 모듈 리스트를 순서대로 연결 (cnn -> head)
+def _forward(modules: List[nn.Module]) -> Callable[[torch.Tensor], torch.Tensor]:
+    def fn(x: torch.Tensor) -> torch.Tensor:
+        for m in modules:
+            x = m(x)
+        return x
+    return fn
+
+
+def _apply_mode(modules: List[nn.Module], mode: str) -> List[nn.Module]:
+    if mode == "quantized":
+        # dynamic int8 : Linear / LSTM 가중치 양자화 (conv 는 fp32 유지)
+        return [torch.ao.quantization.quantize_dynamic(m, {nn.Linear, nn.LSTM}, dtype=torch.qint8)
+                for m in modules]
+    if mode == "compiled":
+        return [torch.compile(m) for m in modules]
+    return modules
+
+
+def _footprint(modules: List[nn.Module]) -> Dict[str, int]:
+    params = sum(p.numel() for m in modules for p in m.parameters())
+    buf = io.BytesIO()
+    torch.save([m.state_dict() for m in modules], buf)   # 양자화 packed 가중치까지 포함한 직렬화 크기
+    return {"param_count": params, "state_dict_bytes": buf.tell()}
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if platform.system() == "Darwin" else rss * 1024   # linux 는 KB 단위
+    except Exception:
+        return 0
+
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+# ===== 단일 설정 측정 (자식 프로세스에서 실행) =====
+@torch.inference_mode()
+def run_case(arch: str, mode: str, threads: int, batch_sizes: List[int], iters: int,
+             warmup: int, codeset_model: str | None) -> Dict[str, Any]:
+    torch.manual_seed(0)
+    torch.set_num_threads(threads)
+    modules = _apply_mode(BUILDERS[arch](codeset_model), mode)
+    fn = _forward(modules)
+
+    result: Dict[str, Any] = {"arch": arch, "mode": mode, "threads": threads, **_footprint(modules)}
+
+    # 1) window 1개 지연시간(latency)
+    x = torch.randn(1, NUM_FRAMES_DEFAULT, 3, 224, 224)
+    for _ in range(warmup):
+        fn(x)
+    lat = []
+    for _ in range(iters):
+        t0 = time.perf_counter()
+        fn(x)
+        lat.append(time.perf_counter() - t0)
+    result["latency_ms"] = {"p50": round(_percentile(lat, 0.5) * 1000, 2),
+                            "p95": round(_percentile(lat, 0.95) * 1000, 2),
+                            "mean": round(sum(lat) / len(lat) * 1000, 2)}
+
+    # 2) batch 크기별 처리량(throughput)
+    result["throughput_wps"] = {}
+    for bs in batch_sizes:
+        xb = torch.randn(bs, NUM_FRAMES_DEFAULT, 3, 224, 224)
+        fn(xb)   # shape 별 warm-up (compiled 재컴파일 포함)
+        n = max(1, iters // bs)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn(xb)
+        result["throughput_wps"][str(bs)] = round(n * bs / (time.perf_counter() - t0), 3)
+
+    result["peak_rss_bytes"] = _peak_rss_bytes()
+    return result
+
+
+def _child(q, kwargs) -> None:
+    try:
+        q.put(run_case(**kwargs))
+    except Exception as e:
+        q.put({"arch": kwargs["arch"], "mode": kwargs["mode"], "threads": kwargs["threads"], "error": repr(e)})
+
+
+# 자식 프로세스 결과 대기 : OOM-kill / crash (결과 없이 종료) 또는 case_timeout 초과 시 error 행으로 기록
+def _wait_result(q, p, case: Dict[str, Any], case_timeout: float) -> Dict[str, Any]:
+    deadline = time.monotonic() + case_timeout
+    while True:
+        try:
+            return q.get(timeout=1.0)
+        except queue.Empty:
+            pass
+        if not p.is_alive():
+            try:
+                return q.get(timeout=1.0)   # 종료 직전에 넣은 결과
+            except queue.Empty:
+                return {**case, "error": f"child exited without a result (exitcode={p.exitcode})"}
+        if time.monotonic() > deadline:
+            p.terminate()
+            return {**case, "error": f"timed out after {case_timeout:.0f}s"}
+
+
+def run_suite(archs: List[str], modes: List[str], threads: List[int], batch_sizes: List[int],
+              iters: int, warmup: int, codeset_model: str | None,
+              case_timeout: float = 1800.0) -> List[Dict[str, Any]]:
+    ctx = mp.get_context("spawn")
+    results = []
+    for arch in archs:
+        for mode in modes:
+            for th in threads:
+                q = ctx.Queue()
+                p = ctx.Process(target=_child, args=(q, dict(arch=arch, mode=mode, threads=th,
+                                                             batch_sizes=batch_sizes, iters=iters,
+                                                             warmup=warmup, codeset_model=codeset_model)))
+                p.start()
+                res = _wait_result(q, p, {"arch": arch, "mode": mode, "threads": th}, case_timeout)
+                p.join()
+                print(f"[Bench] {arch:14s} {mode:9s} threads={th:<2d} -> {res.get('latency_ms', res.get('error'))}")
+                results.append(res)
+    return results
+
+
+def write_report(results: List[Dict[str, Any]], out_dir: str, batch_sizes: List[int]) -> None:
+    os.makedirs(out_dir, exist_ok=True)
+    env = {"torch": torch.__version__, "python": platform.python_version(),
+           "machine": platform.machine(), "cpu_count": os.cpu_count()}
+    with open(os.path.join(out_dir, "benchmark.json"), "w") as f:
+        json.dump({"env": env, "results": results}, f, indent=2)
+
+    head = ["arch", "mode", "threads", "params(M)", "state_dict(MB)", "p50(ms)", "p95(ms)", "peak RSS(MB)"] \
+         + [f"bs={bs} (win/s)" for bs in batch_sizes]
+    lines = ["# Model benchmark\n", f"`{json.dumps(env)}`\n",
+             "| " + " | ".join(head) + " |", "|" + "---|" * len(head)]
+    for r in results:
+        if "error" in r:
+            lines.append(f"| {r['arch']} | {r['mode']} | {r['threads']} | error: {r['error']} |")
+            continue
+        row = [r["arch"], r["mode"], str(r["threads"]),
+               f"{r['param_count'] / 1e6:.2f}", f"{r['state_dict_bytes'] / 2**20:.1f}",
+               str(r["latency_ms"]["p50"]), str(r["latency_ms"]["p95"]),
+               f"{r['peak_rss_bytes'] / 2**20:.0f}"] \
+            + [str(r["throughput_wps"].get(str(bs), "-")) for bs in batch_sizes]
+        lines.append("| " + " | ".join(row) + " |")
+    with open(os.path.join(out_dir, "benchmark.md"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"[Bench] report written to {out_dir}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--archs", nargs="+", choices=ARCHS, default=None,
+                    help="Default: mobilenet_v3, plus resnet18_lstm when --codeset-model is given")
+    ap.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    ap.add_argument("--threads", nargs="+", type=int, default=[1, 2, 4])
+    ap.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32])
+    ap.add_argument("--iters", type=int, default=20)
+    ap.add_argument("--warmup", type=int, default=3)
+    ap.add_argument("--codeset-model", default=None, help="Path to CodeSet/WebSocket/model/model.py (CNN_LSTM)")
+    ap.add_argument("--out", default="benchmark_report")
+    ap.add_argument("--case-timeout", type=float, default=1800.0, help="Seconds before a case is killed and reported as an error")
+    args = ap.parse_args()
+
+    archs = args.archs or [a for a in ARCHS if a != "resnet18_lstm" or args.codeset_model]
+    results = run_suite(archs, args.modes, args.threads, args.batch_sizes,
+                        args.iters, args.warmup, args.codeset_model, args.case_timeout)
+    write_report(results, args.out, args.batch_sizes)
+
+if __name__ == "__main__":
+    main()
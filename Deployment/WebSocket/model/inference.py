@@ -1,17 +1,20 @@
-import os, glob
+import os, io, glob
+from functools import lru_cache
 from typing import List, Literal, Optional, Dict, Any
+import numpy as np
 import torch
 import torch.nn as nn
-from torchvision import transforms, models
-from torchvision.transforms import InterpolationMode
 from PIL import Image
 
+# torchvision 은 모델 빌드 / 전처리 생성 시점에 import (모듈 import 시 cold start 비용 제거)
+
 # ===== Model =====
 class CNNEncoder(nn.Module):
     def __init__(self, output_dim: int = 512, dropout2d: float = 0.1, proj_dropout: float = 0.4):
         super().__init__()
+        from torchvision.models import mobilenet_v3_large
         # 주의: 사전학습 백본 다운로드를 피하려면 weights=None 권장
-        backbone = models.mobilenet_v3_large(weights=None)
+        backbone = mobilenet_v3_large(weights=None)
         self.features = backbone.features
         self.feat_channels = backbone.classifier[0].in_features  # 960
 
@@ -51,11 +54,15 @@ class EngagementModelNoFusion(nn.Module):
 # 학습과 동일하게 전처리
 NUM_FRAMES_DEFAULT = 30
 
-preprocess = transforms.Compose(transforms=[
-    transforms.Resize((224, 224), interpolation=InterpolationMode.BILINEAR, antialias=True),
-    transforms.ToTensor(),
-    transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
-])
+@lru_cache(maxsize=1)
+def get_preprocess():
+    from torchvision import transforms
+    from torchvision.transforms import InterpolationMode
+    return transforms.Compose(transforms=[
+        transforms.Resize((224, 224), interpolation=InterpolationMode.BILINEAR, antialias=True),
+        transforms.ToTensor(),
+        transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
+    ])
 
 IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
 
@@ -72,6 +79,7 @@ def load_frames_from_folder(folder_path: str,
     if len(selected) < num_frames:
         selected = selected + [selected[-1]] * (num_frames - len(selected))
 
+    preprocess = get_preprocess()
     frames: List[torch.Tensor] = []
     for name in selected:
         img = Image.open(os.path.join(folder_path, name)).convert("RGB")
@@ -79,6 +87,48 @@ def load_frames_from_folder(folder_path: str,
     video = torch.stack(frames, dim=0)  # (T,3,224,224)
     return video
 
+# 메모리의 이미지 bytes 리스트에서 (T,3,224,224) 텐서 반환. 디코딩 실패 프레임은 건너뛰고 마지막 프레임으로 채움
+def load_frames_from_bytes(frames_bytes: List[bytes],
+                           num_frames: int = NUM_FRAMES_DEFAULT) -> torch.Tensor:
+    preprocess = get_preprocess()
+    frames: List[torch.Tensor] = []
+    for idx, img_bytes in enumerate(frames_bytes[:num_frames]):
+        try:
+            img = Image.open(io.BytesIO(img_bytes)).convert("RGB")
+        except Exception as e:
+            print(f"[ERROR] :    frame_{idx:04d}: {e}")
+            continue
+        frames.append(preprocess(img))  # (3,224,224)
+    if len(frames) == 0:
+        raise ValueError("No decodable image frames in window")
+    if len(frames) < num_frames:
+        frames = frames + [frames[-1]] * (num_frames - len(frames))
+    return torch.stack(frames, dim=0)  # (T,3,224,224)
+
+# get_preprocess() 의 Normalize 상수 (load_frames_into 에서 in-place 정규화에 사용)
+_MEAN = torch.tensor([0.485, 0.456, 0.406]).view(3, 1, 1)
+_STD = torch.tensor([0.229, 0.224, 0.225]).view(3, 1, 1)
+
+# 미리 할당된 out (T,3,224,224) float32 에 in-place 로 디코딩 + 정규화 (get_preprocess 와 동일 연산, 프레임별 텐서 생성 없음)
+def load_frames_into(frames_bytes: List[bytes], out: torch.Tensor) -> torch.Tensor:
+    num_frames, _, height, width = out.shape
+    n = 0
+    for idx, img_bytes in enumerate(frames_bytes[:num_frames]):
+        try:
+            img = Image.open(io.BytesIO(img_bytes)).convert("RGB").resize((width, height), Image.BILINEAR)
+        except Exception as e:
+            print(f"[ERROR] :    frame_{idx:04d}: {e}")
+            continue
+        # PIL 버퍼를 numpy view 로 받아 slot 에 바로 복사 (uint8 HWC -> float CHW, 중간 bytes 복사 없음)
+        out[n].copy_(torch.from_numpy(np.asarray(img)).permute(2, 0, 1))
+        n += 1
+    if n == 0:
+        raise ValueError("No decodable image frames in window")
+    if n < num_frames:
+        out[n:].copy_(out[n - 1].expand_as(out[n:]))
+    out.div_(255.0).sub_(_MEAN).div_(_STD)
+    return out
+
 # ===== Checkpoint loading =====
 def build_models(device: torch.device):
     cnn = CNNEncoder().to(device)
@@ -86,6 +136,14 @@ def build_models(device: torch.device):
     cnn.eval(); head.eval()
     return cnn, head
 
+# 가중치 없이(meta device) 구조만 생성 -> 이후 load_state_dict(assign=True) 로 가중치 연결 (랜덤 초기화 비용 제거)
+def build_empty_models():
+    with torch.device("meta"):
+        cnn = CNNEncoder()
+        head = EngagementModelNoFusion()
+    cnn.eval(); head.eval()
+    return cnn, head
+
 # 훈련에서 저장한 dict(가중치+메타)를 로드
 def load_checkpoint(cnn: nn.Module,
                     head: nn.Module,
@@ -109,6 +167,19 @@ def find_latest_best_model(model_dir: str) -> str:
     candidates.sort(key=os.path.getmtime, reverse=True)
     return candidates[0]
 
+# (ckpt_path, device) 별로 모델을 1회만 빌드/로드하여 재사용
+#   학습 체크포인트 / 가중치 전용(*.weights.pt) 포맷 모두 지원 (golden / batch 가 서빙과 같은 파일을 사용할 수 있도록)
+@lru_cache(maxsize=4)
+def load_models_cached(ckpt_path: str, device_str: str):
+    device = torch.device(device_str)
+    from .weights import is_weights_file, load_weights    # weights.py 가 이 모듈을 import -> 순환 방지
+    if is_weights_file(ckpt_path):
+        cnn, head, meta, _ = load_weights(ckpt_path, device)
+        return cnn, head, meta
+    cnn, head = build_models(device)
+    meta = load_checkpoint(cnn, head, ckpt_path, device)
+    return cnn, head, meta
+
 # ===== Inference API (코어 함수) =====
 @torch.inference_mode()
 def predict_from_folder(folder_path: str,
@@ -120,8 +191,7 @@ def predict_from_folder(folder_path: str,
     if os.path.isdir(ckpt_path):
         ckpt_path = find_latest_best_model(ckpt_path)
 
-    cnn, head = build_models(device)
-    meta = load_checkpoint(cnn, head, ckpt_path, device)
+    cnn, head, meta = load_models_cached(os.path.abspath(ckpt_path), str(device))
 
     video = load_frames_from_folder(folder_path, num_frames=NUM_FRAMES_DEFAULT)
     video = video.unsqueeze(0).to(device)
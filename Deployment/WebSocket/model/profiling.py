@@ -0,0 +1,124 @@
+# CNNEncoder / EngagementModelNoFusion 의 layer(module) 별, operator 별 시간/메모리 프로파일링
+#   python -m WebSocket.model.profiling --ckpt WebSocket/model/best_model_epoch_4.pt --folder <frames> --out prof/
+import os, json, threading
+import argparse
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+import torch
+import torch.nn as nn
+from torch.profiler import profile, record_function, ProfilerActivity
+
+from .inference import NUM_FRAMES_DEFAULT, build_models, load_checkpoint, load_frames_from_folder
+
+# 프로파일 리포트에 구간(label)으로 표시할 하위 모듈
+CNN_SECTIONS = ("features", "avgpool", "drop2d", "fc")
+HEAD_SECTIONS = ("lstm", "fc")
+
+
+# 지정한 하위 모듈의 forward 를 record_function 구간으로 감싸는 hook 등록
+@contextmanager
+def module_sections(cnn: nn.Module, head: nn.Module) -> Iterator[None]:
+    handles = []
+    targets = [(f"cnn.{n}", getattr(cnn, n)) for n in CNN_SECTIONS] \
+            + [(f"head.{n}", getattr(head, n)) for n in HEAD_SECTIONS]
+    local = threading.local()   # 라이브 서비스에서는 여러 추론 thread 가 동시에 hook 을 호출
+    for label, module in targets:
+        def pre(_m, _i, label=label):
+            rf = record_function(f"module::{label}")
+            rf.__enter__()
+            local.__dict__.setdefault(label, []).append(rf)
+        def post(_m, _i, _o, label=label):
+            local.__dict__[label].pop().__exit__(None, None, None)
+        handles.append(module.register_forward_pre_hook(pre))
+        handles.append(module.register_forward_hook(post))
+    try:
+        yield
+    finally:
+        for h in handles:
+            h.remove()
+
+
+def _activities(device: torch.device) -> List[ProfilerActivity]:
+    acts = [ProfilerActivity.CPU]
+    if device.type == "cuda":
+        acts.append(ProfilerActivity.CUDA)
+    return acts
+
+
+def _summarize(prof, top: int) -> Dict[str, List[Dict]]:
+    modules, ops = [], []
+    for evt in prof.key_averages():
+        row = {"name": evt.key,
+               "calls": evt.count,
+               "cpu_total_ms": round(evt.cpu_time_total / 1000, 3),
+               "self_cpu_ms": round(evt.self_cpu_time_total / 1000, 3),
+               "self_cpu_mem_bytes": evt.self_cpu_memory_usage,
+               "cpu_mem_bytes": evt.cpu_memory_usage}
+        (modules if evt.key.startswith("module::") else ops).append(row)
+    modules.sort(key=lambda r: r["cpu_total_ms"], reverse=True)
+    ops.sort(key=lambda r: r["self_cpu_ms"], reverse=True)
+    return {"modules": modules, "operators": ops[:top]}
+
+
+# 주어진 입력으로 n_iters 회 forward 를 프로파일링하고 out_dir 에 리포트 기록
+#   summary.json   : module 별 / operator 별 시간, 메모리
+#   operators.txt  : profiler 표(table)
+#   trace.json     : chrome://tracing, perfetto 호환 trace
+#   stacks.txt     : flamegraph.pl / speedscope 호환 collapsed stack
+@torch.inference_mode()
+def profile_window(cnn: nn.Module, head: nn.Module, video: torch.Tensor, out_dir: str,
+                   n_iters: int = 1, top: int = 30) -> Tuple[torch.Tensor, Dict[str, List[Dict]]]:
+    os.makedirs(out_dir, exist_ok=True)
+    device = video.device
+    with module_sections(cnn, head):
+        with profile(activities=_activities(device), record_shapes=True,
+                     profile_memory=True, with_stack=True) as prof:
+            for _ in range(n_iters):
+                with record_function("window"):
+                    logit = head(cnn(video))
+    summary = _summarize(prof, top)
+    with open(os.path.join(out_dir, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    with open(os.path.join(out_dir, "operators.txt"), "w") as f:
+        f.write(prof.key_averages().table(sort_by="self_cpu_time_total", row_limit=top))
+    prof.export_chrome_trace(os.path.join(out_dir, "trace.json"))
+    prof.export_stacks(os.path.join(out_dir, "stacks.txt"), "self_cpu_time_total")
+    return logit, summary
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ckpt", default=None, help="Checkpoint (omit to profile random weights)")
+    ap.add_argument("--folder", default=None, help="Frame folder (omit to use a random window)")
+    ap.add_argument("--batch-size", type=int, default=1)
+    ap.add_argument("--iters", type=int, default=3)
+    ap.add_argument("--warmup", type=int, default=2)
+    ap.add_argument("--threads", type=int, default=None)
+    ap.add_argument("--device", default="cpu")
+    ap.add_argument("--out", default="profile_report")
+    args = ap.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    device = torch.device(args.device)
+    cnn, head = build_models(device)
+    if args.ckpt:
+        load_checkpoint(cnn, head, args.ckpt, device)
+    if args.folder:
+        video = load_frames_from_folder(args.folder, NUM_FRAMES_DEFAULT).unsqueeze(0)
+        video = video.expand(args.batch_size, *video.shape[1:]).contiguous()
+    else:
+        video = torch.randn(args.batch_size, NUM_FRAMES_DEFAULT, 3, 224, 224)
+    video = video.to(device)
+
+    with torch.inference_mode():
+        for _ in range(args.warmup):
+            head(cnn(video))
+    _, summary = profile_window(cnn, head, video, args.out, n_iters=args.iters)
+    for row in summary["modules"]:
+        print(f"[Profile] {row['name']:24s} {row['cpu_total_ms'] / args.iters:9.2f} ms/iter")
+    print(f"[Profile] report written to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# 가중치 전용(weights-only) 체크포인트 : mmap 로 로드 가능한 포맷
+#   학습 체크포인트(pickle dict, optimizer 등 포함) -> {"cnn": state_dict, "head": state_dict, "meta": dict}
+#   python -m WebSocket.model.weights --ckpt WebSocket/model/best_model_epoch_4.pt
+#     -> WebSocket/model/best_model_epoch_4.weights.pt
+import os, time
+import argparse
+from typing import Any, Dict, Tuple
+
+import torch
+import torch.nn as nn
+
+from .inference import build_empty_models
+
+WEIGHTS_SUFFIX = ".weights.pt"
+
+
+def is_weights_file(path: str) -> bool:
+    return str(path).endswith(WEIGHTS_SUFFIX)
+
+
+def export_weights(ckpt_path: str, out_path: str | None = None) -> str:
+    ckpt = torch.load(ckpt_path, map_location="cpu")
+    meta = {"epoch": ckpt.get("epoch"),
+            "val_loss": ckpt.get("val_loss"),
+            "thr_acc": ckpt.get("thr_acc"),
+            "thr_rec": ckpt.get("thr_rec")}
+    # weights_only 로드가 가능하도록 tensor / 기본 타입만 저장
+    meta = {k: (float(v) if isinstance(v, torch.Tensor) else v) for k, v in meta.items()}
+    payload = {"cnn": {k: v.contiguous() for k, v in ckpt["cnn_state_dict"].items()},
+               "head": {k: v.contiguous() for k, v in ckpt["model_state_dict"].items()},
+               "meta": meta}
+    out_path = out_path or os.path.splitext(ckpt_path)[0] + WEIGHTS_SUFFIX
+    torch.save(payload, out_path)   # zipfile 포맷 -> torch.load(mmap=True) 지원
+    return out_path
+
+
+# meta device 로 구조만 만들고 mmap 된 tensor 를 그대로 연결(assign) -> 복사 / 랜덤 초기화 없음
+def load_weights(ckpt_path: str, device: torch.device) -> Tuple[nn.Module, nn.Module, Dict[str, Any], Dict[str, float]]:
+    timings: Dict[str, float] = {}
+    t0 = time.perf_counter()
+    cnn, head = build_empty_models()
+    timings["build_sec"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    payload = torch.load(ckpt_path, map_location=device, mmap=(device.type == "cpu"), weights_only=True)
+    cnn.load_state_dict(payload["cnn"], assign=True)
+    head.load_state_dict(payload["head"], assign=True)
+    cnn.eval(); head.eval()
+    timings["load_sec"] = time.perf_counter() - t0
+    return cnn, head, payload.get("meta", {}), timings
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ckpt", required=True, help="Training checkpoint (dict with cnn_state_dict / model_state_dict)")
+    ap.add_argument("--out", default=None, help=f"Output path (default: <ckpt>{WEIGHTS_SUFFIX})")
+    args = ap.parse_args()
+    out = export_weights(args.ckpt, args.out)
+    print(f"[Weights] exported {args.ckpt} -> {out} ({os.path.getsize(out) / 2**20:.1f} MB)")
+
+if __name__ == "__main__":
+    main()
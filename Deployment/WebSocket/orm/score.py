@@ -1,4 +1,5 @@
-from sqlalchemy import Column, ForeignKey, UniqueConstraint, String, Integer, Double, DateTime, Boolean, func
+from sqlalchemy import Column, ForeignKey, UniqueConstraint, String, Integer, Double, DateTime, Boolean, LargeBinary, func
+from sqlalchemy.orm import deferred
 
 from WebSocket.orm.db import Base
 
@@ -28,6 +29,9 @@ class StudySession(Base):
     avg_focus = Column(Double, nullable=False, default=0.0)
     min_focus = Column(Integer, nullable=False, default=0)
     max_focus = Column(Integer, nullable=False, default=0)
+    # window 별 집중도 시계열 (RLE 압축 uint8). 기존 테이블에는 Deployment/migrations/001_study_session_timeline.sql 적용 필요
+    #   deferred : 일반 조회에서는 로드하지 않음 (timeline API 에서만 명시적으로 조회)
+    timeline = deferred(Column(LargeBinary, nullable=True))
 
     # 한 유저가 같은 일, 동일 시간, 과목, 장소에 여러 점수를 기록하지 않도록 Unique 제약
     __table_args__ = (
@@ -16,6 +16,7 @@ class DailyRecord:
     avg_focus:  float        # 평균 집중도
     min_focus:  int          # 최소 집중도
     max_focus:  int          # 최대 집중도
+    timeline:   bytes        # window 별 집중도 시계열 (RLE 압축)
 
 class ScoreDB:
     @staticmethod
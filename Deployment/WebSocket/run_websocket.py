@@ -1,12 +1,98 @@
 import multiprocessing
+import threading
+import socket
+import signal
+import time, os
 import uvicorn
 
+from WebSocket.core.config import (WS_BIND_HOST, WS_BIND_PORT, WS_WORKERS, WS_PRELOAD, WS_SHARE_WEIGHTS,
+                                   WS_SHUTDOWN_TIMEOUT, MODEL_PATH, FRAME_MAX_BYTES, N_FRAMES)
+
+# WS message 최대 크기 : batch window (프레임 최대 크기 x N_FRAMES + header) 초과 message 는 uvicorn 이 수신 단계에서 거부
+WS_MAX_SIZE = FRAME_MAX_BYTES * N_FRAMES + 64 * 1024
+
 
 def RUN_WS() -> None:
-    uvicorn.run(app="main:ws_app", host="0.0.0.0", port=9000)
+    uvicorn.run(app="main:ws_app", host=WS_BIND_HOST, port=WS_BIND_PORT, ws_max_size=WS_MAX_SIZE)
+
+
+# preload-then-fork worker : 부모가 열어둔 listen socket 을 공유하여 accept
+#   worker 는 별도 process group : 터미널 Ctrl-C 는 부모만 받고, 부모가 SIGTERM 을 1회만 전달 (중복 signal 은 uvicorn 강제 종료)
+def SERVE_WS(sock: socket.socket) -> None:
+    from uvicorn.importer import import_from_string
+    os.setpgid(0, 0)
+    config = uvicorn.Config(app=import_from_string("main:ws_app"), ws_max_size=WS_MAX_SIZE,
+                            timeout_graceful_shutdown=WS_SHUTDOWN_TIMEOUT)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def RUN_WS_PRELOADED(workers: int) -> None:
+    from uvicorn.importer import import_from_string
+    from WebSocket.service import ModelService
+    from WebSocket.core.utils import process_memory
+
+    # 1) 부모 프로세스에서 모델 1회 로드 (워밍업은 fork 이후 worker 별로 수행 -> torch thread pool 을 fork 하지 않음)
+    import_from_string("main:ws_app")
+    ModelService.init_model(MODEL_PATH, "cpu", warmup=False)
+    ModelService.freeze(share_memory=WS_SHARE_WEIGHTS)
+    base = process_memory()
+
+    # 2) listen socket 을 부모에서 열고 worker 들이 공유
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((WS_BIND_HOST, WS_BIND_PORT))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    # 3) fork : 가중치 page 는 copy-on-write 로 공유
+    ctx = multiprocessing.get_context("fork")
+
+    def spawn(i: int) -> multiprocessing.Process:
+        p = ctx.Process(target=SERVE_WS, args=(sock,), name=f"ws-worker-{i}")
+        p.start()
+        return p
+
+    # signal 은 부모가 받아 종료 절차 시작 (docker stop / systemctl stop / Ctrl-C)
+    stopping = threading.Event()
+    def on_signal(signum, frame) -> None:
+        print(f"[Shutdown] parent received {signal.Signals(signum).name}")
+        stopping.set()
+    signal.signal(signal.SIGTERM, on_signal)
+    signal.signal(signal.SIGINT, on_signal)
+
+    procs = [spawn(i) for i in range(workers)]
+    print(f"[Startup] preloaded parent pid={multiprocessing.current_process().pid} "
+          f"rss={base.get('rss', 0) / 2**20:.1f}MB -> {workers} workers on {WS_BIND_HOST}:{WS_BIND_PORT}")
+    # worker 별 메모리 오버헤드(uss : 해당 worker 고유 page)는 각 worker lifespan 에서 출력
+
+    # 4) 감시 : 비정상 종료한 worker 는 다시 fork (부모의 모델을 그대로 공유)
+    while not stopping.wait(1.0):
+        for i, p in enumerate(procs):
+            if not p.is_alive():
+                print(f"[Worker] {p.name} pid={p.pid} exited (code={p.exitcode}), restarting")
+                procs[i] = spawn(i)
+
+    # 5) 종료 : worker 에 SIGTERM -> uvicorn graceful shutdown + lifespan shutdown
+    #    (executor / tracer / recorder / FrameStore 정리), 제한 시간 초과 시 강제 종료
+    for p in procs:
+        if p.is_alive():
+            p.terminate()
+    deadline = time.monotonic() + WS_SHUTDOWN_TIMEOUT + 15
+    for p in procs:
+        p.join(timeout=max(0.0, deadline - time.monotonic()))
+        if p.is_alive():
+            print(f"[Worker] {p.name} pid={p.pid} did not stop in time, killing")
+            p.kill()
+            p.join()
+        print(f"[Worker] {p.name} pid={p.pid} exited (code={p.exitcode})")
+    sock.close()
+    print("[Shutdown] preloaded parent 종료")
 
 
 if __name__ == "__main__":
-    p = multiprocessing.Process(target=RUN_WS)
-    p.start()
-    p.join()
\ No newline at end of file
+    if WS_PRELOAD:
+        RUN_WS_PRELOADED(WS_WORKERS)
+    else:
+        p = multiprocessing.Process(target=RUN_WS)
+        p.start()
+        p.join()
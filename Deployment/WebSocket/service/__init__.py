@@ -1,4 +1,5 @@
 from .security import TokenService
 from .realtime import RealTimeService
+from .framestore import FrameStore, FrameWindow
 from .inference import ModelService
 from .focus import FocusTracker
\ No newline at end of file
@@ -0,0 +1,89 @@
+from typing import Any, Callable, Dict, List
+import tracemalloc
+import threading
+
+import torch
+
+from WebSocket.model.inference import load_frames_into
+from WebSocket.core.utils import process_memory
+
+
+# ---------------------------------------------------------------------------------
+# 입력 텐서 arena : 추론 slot(thread) 별로 (1,T,3,224,224) 입력 버퍼를 1회만 할당하고 window 마다 재사용
+#   slot 수가 고정이므로 메모리 상한 = slots x 버퍼 크기 (사용자 수와 무관)
+#   allocations 는 이 arena 의 입력 버퍼 할당만 셈 (slot 수에서 멈추면 입력 텐서는 재사용 중)
+#   JPEG decode / resize 중간 이미지, 모델 activation 등 arena 밖의 할당은 포함하지 않음 -> measure_allocations 로 측정
+# ---------------------------------------------------------------------------------
+class TensorArena:
+    def __init__(self, num_frames: int, size: int = 224) -> None:
+        self.shape = (1, num_frames, 3, size, size)
+        self.windows = 0
+        self.allocations = 0
+        self.allocated_bytes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _alloc(self, device: torch.device) -> torch.Tensor:
+        buf = torch.empty(self.shape, dtype=torch.float32, device=device)
+        with self._lock:
+            self.allocations += 1
+            self.allocated_bytes += buf.numel() * buf.element_size()
+        return buf
+
+    # frames 를 현재 slot 의 버퍼에 디코딩 + 정규화하여 반환 (다음 window 에서 덮어씀)
+    #   num_frames : 앞쪽 num_frames timestep 만 사용 (연속 메모리 view -> 추가 할당 없음)
+    def load(self, frames: List[bytes], device: torch.device, num_frames: int | None = None) -> torch.Tensor:
+        host = getattr(self._local, "host", None)
+        if host is None:
+            host = self._local.host = self._alloc(torch.device("cpu"))
+        host = host[:, :num_frames or self.shape[1]]
+        load_frames_into(frames, host[0])
+        with self._lock:
+            self.windows += 1
+        if device.type == "cpu":
+            return host
+        # ("cuda" 와 "cuda:0" 비교 불일치를 피하기 위해 요청된 device 객체 기준으로 보관)
+        target, buf = getattr(self._local, "device", (None, None))
+        if target != device:
+            buf = self._alloc(device)
+            self._local.device = (device, buf)
+        return buf[:, :host.shape[1]].copy_(host, non_blocking=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {"windows": self.windows,
+                "allocations": self.allocations,
+                "allocated_bytes": self.allocated_bytes}
+
+
+# ---------------------------------------------------------------------------------
+# window 를 반복 실행하며 arena 밖을 포함한 실제 할당 측정 (steady-state 에서 할당이 멈추는지 확인)
+#   cuda : torch 할당자(caching allocator)의 window 당 할당 요청 수 / 할당 bytes 증감
+#   cpu  : torch CPU 할당은 횟수를 세는 API 가 없으므로 RSS 증감 (누적 증가 여부) + tracemalloc (Python 객체) 증감
+#   1회 미측정 실행 후 측정 (arena / 할당자 cache 가 채워진 상태 기준)
+# ---------------------------------------------------------------------------------
+def measure_allocations(run: Callable[[], Any], windows: int, device: torch.device) -> Dict[str, Any]:
+    run()
+    cuda = device.type == "cuda"
+    if cuda:
+        torch.cuda.synchronize(device)
+        before = torch.cuda.memory_stats(device)
+    rss_before = process_memory().get("rss", 0)
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    py_before, _ = tracemalloc.get_traced_memory()
+    for _ in range(windows):
+        run()
+    py_after, _ = tracemalloc.get_traced_memory()
+    if started:
+        tracemalloc.stop()
+    result: Dict[str, Any] = {"windows": windows,
+                              "rss_delta_bytes": process_memory().get("rss", 0) - rss_before,
+                              "python_delta_bytes": py_after - py_before}
+    if cuda:
+        torch.cuda.synchronize(device)
+        after = torch.cuda.memory_stats(device)
+        result["cuda_allocations_per_window"] = round(
+            (after["allocation.all.allocated"] - before["allocation.all.allocated"]) / max(1, windows), 1)
+        result["cuda_allocated_delta_bytes"] = after["allocated_bytes.all.current"] - before["allocated_bytes.all.current"]
+    return result
@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import Dict, List
+from PIL import Image
+import threading
+import io
+
+import torch
+
+SIG_SIZE = 16     # 서명(signature)용 축소 이미지 한 변 (16x16 grayscale)
+SIG_FRAMES = 5    # window 에서 균등 간격으로 뽑는 프레임 수
+
+
+# window 의 저해상도 서명 : 균등 간격 프레임들을 16x16 grayscale 로 축소하여 이어붙임
+#   JPEG 은 draft() 로 DCT 단계에서 축소 디코딩 -> 전체 디코딩 대비 매우 저렴
+def window_signature(frames: List[bytes]) -> torch.Tensor | None:
+    if not frames:
+        return None
+    n = len(frames)
+    idxs = sorted({round(i * (n - 1) / max(1, SIG_FRAMES - 1)) for i in range(SIG_FRAMES)})
+    thumbs = bytearray()
+    for i in idxs:
+        try:
+            img = Image.open(io.BytesIO(frames[i]))
+            img.draft("L", (SIG_SIZE * 4, SIG_SIZE * 4))
+            thumbs += img.convert("L").resize((SIG_SIZE, SIG_SIZE), Image.BILINEAR).tobytes()
+        except Exception:
+            return None
+    return torch.frombuffer(thumbs, dtype=torch.uint8)
+
+
+# 두 서명의 평균 절대 차이 (0.0 ~ 1.0)
+def signature_distance(a: torch.Tensor, b: torch.Tensor) -> float:
+    if a.shape != b.shape:
+        return 1.0
+    return (a.float() - b.float()).abs().mean().item() / 255.0
+
+
+@dataclass
+class _LastWindow:
+    signature: torch.Tensor
+    prob: float
+    version: str
+    rung: str           # 확률을 만든 degradation rung (rung 이 바뀌면 재사용하지 않음)
+    streak: int = 0     # 연속 재사용 횟수
+
+
+# ---------------------------------------------------------------------------------
+# 사용자별 직전 window 와 거의 같은 window 는 CNN 추론 없이 직전 확률을 재사용
+#   max_streak 회 연속 재사용 후에는 반드시 실제 추론 수행 (서서히 변하는 장면 대비)
+# ---------------------------------------------------------------------------------
+class WindowDeduper:
+    def __init__(self, threshold: float, max_streak: int) -> None:
+        self.threshold = threshold
+        self.max_streak = max_streak
+        self.windows = 0
+        self.reused = 0
+        self._last: Dict[str, _LastWindow] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, user_name: str, signature: torch.Tensor | None, version: str, rung: str) -> float | None:
+        with self._lock:
+            self.windows += 1
+            last = self._last.get(user_name)
+            if signature is None or last is None or last.streak >= self.max_streak:
+                return None
+            if last.version != version or last.rung != rung:
+                return None
+            if signature_distance(signature, last.signature) > self.threshold:
+                return None
+            # 기준 서명은 마지막 실제 추론 window 로 유지 -> 재사용이 누적되어 drift 하지 않음
+            last.streak += 1
+            self.reused += 1
+            return last.prob
+
+    def store(self, user_name: str, signature: torch.Tensor | None, prob: float, version: str, rung: str) -> None:
+        if signature is None:
+            return
+        with self._lock:
+            self._last[user_name] = _LastWindow(signature=signature, prob=prob, version=version, rung=rung)
+
+    def forget(self, user_name: str) -> None:
+        with self._lock:
+            self._last.pop(user_name, None)
+
+    def stats(self) -> Dict[str, float]:
+        return {"windows": self.windows,
+                "reused": self.reused,
+                "hit_rate": round(self.reused / self.windows, 4) if self.windows else 0.0,
+                "tracked_users": len(self._last)}
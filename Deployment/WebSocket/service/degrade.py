@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from collections import deque
+from typing import Deque, Dict, Tuple
+import time
+
+from WebSocket.core.config import (DEGRADE_QUEUE_HIGH, DEGRADE_QUEUE_LOW, DEGRADE_P95_HIGH_MS,
+                                   DEGRADE_P95_LOW_MS, DEGRADE_DWELL_SEC)
+
+
+# 서빙 설정 1단계(rung) : 아래로 갈수록 가볍고 정확도는 낮음
+#   int8 rung 은 두지 않음 : dynamic 양자화는 Linear / LSTM 만 대상이라 연산 대부분인 MobileNetV3 conv 는 fp32 그대로
+#   (부하 감소가 거의 없음), conv 까지 int8 로 하려면 static 양자화 + calibration 데이터가 필요하고 CPU 에서만 동작
+#   -> 모든 device 에서 연산량이 확실히 줄어드는 timestep 수 / 해상도 축소만 사용
+@dataclass(frozen=True)
+class Rung:
+    name: str
+    frame_stride: int = 1       # window 프레임 간격 추출 (2 -> 15 timesteps), 디코딩도 그만큼 감소
+    size: int = 224             # 입력 해상도
+
+
+LADDER: Tuple[Rung, ...] = (
+    Rung("full"),
+    Rung("subsampled", frame_stride=2),
+    Rung("light", frame_stride=2, size=160),
+)
+
+
+# ---------------------------------------------------------------------------------
+# 부하 기반 rung 전환 : queue depth / p95 지연이 high 를 넘으면 한 단계 내리고,
+#   둘 다 low 아래로 내려오면 한 단계 올림. 전환 후 dwell_sec 동안은 유지 (hysteresis)
+# ---------------------------------------------------------------------------------
+class DegradeController:
+    def __init__(self,
+                 ladder: Tuple[Rung, ...] = LADDER,
+                 queue_high: int = DEGRADE_QUEUE_HIGH,
+                 queue_low: int = DEGRADE_QUEUE_LOW,
+                 p95_high_ms: float = DEGRADE_P95_HIGH_MS,
+                 p95_low_ms: float = DEGRADE_P95_LOW_MS,
+                 dwell_sec: float = DEGRADE_DWELL_SEC,
+                 window: int = 50) -> None:
+        self.ladder = ladder
+        self.queue_high, self.queue_low = queue_high, queue_low
+        self.p95_high_ms, self.p95_low_ms = p95_high_ms, p95_low_ms
+        self.dwell_sec = dwell_sec
+        self.level = 0
+        self.switches = 0
+        self.windows: Dict[str, int] = {r.name: 0 for r in ladder}
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._changed_at = 0.0
+
+    @property
+    def rung(self) -> Rung:
+        return self.ladder[self.level]
+
+    def p95_ms(self) -> float:
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    # window 1개 완료 시 호출 (latency : executor 대기 + 추론, pending : 현재 queue depth)
+    def observe(self, rung: Rung, latency_ms: float, pending: int) -> None:
+        self.windows[rung.name] = self.windows.get(rung.name, 0) + 1
+        self._latencies.append(latency_ms)
+        now = time.monotonic()
+        if now - self._changed_at < self.dwell_sec:
+            return
+        p95 = self.p95_ms()
+        if (pending > self.queue_high or p95 > self.p95_high_ms) and self.level < len(self.ladder) - 1:
+            self._switch(self.level + 1, now, pending, p95)
+        elif pending <= self.queue_low and p95 < self.p95_low_ms and self.level > 0:
+            self._switch(self.level - 1, now, pending, p95)
+
+    def _switch(self, level: int, now: float, pending: int, p95: float) -> None:
+        print(f"[Degrade] {self.rung.name} -> {self.ladder[level].name} (pending={pending}, p95={p95:.0f}ms)")
+        self.level = level
+        self.switches += 1
+        self._changed_at = now
+        self._latencies.clear()     # 새 rung 의 지연만으로 다음 판단
+
+    def stats(self) -> Dict[str, object]:
+        return {"rung": self.rung.name,
+                "level": self.level,
+                "p95_ms": round(self.p95_ms(), 1),
+                "switches": self.switches,
+                "windows": dict(self.windows)}
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+from functools import partial
+import contextvars
+import itertools
+import threading
+import asyncio
+import time, os
+
+import torch
+
+
+# ---------------------------------------------------------------------------------
+# 추론 전용 executor : asyncio 기본 executor 와 분리된 고정 slot(thread) 수
+#   slot 마다 torch intra-op thread 수를 제한하여 (slots x threads) <= core 수로 맞춤
+#   affinity=True 이면 slot 별로 서로 겹치지 않는 CPU 집합에 고정 (Linux)
+# ---------------------------------------------------------------------------------
+class InferenceExecutor:
+    def __init__(self, slots: int, threads_per_slot: int, affinity: bool = False) -> None:
+        self.slots = slots
+        self.threads_per_slot = threads_per_slot
+        self.affinity = affinity and hasattr(os, "sched_setaffinity")
+        self.pending = 0          # 대기 + 실행 중인 window 수 (queue depth)
+        self._slot_ids = itertools.count()
+        self._lock = threading.Lock()
+        # 전역 intra-op thread 수도 slot 당 값으로 제한 (OpenMP team 은 호출 thread 별로 생성)
+        torch.set_num_threads(threads_per_slot)
+        self._pool = ThreadPoolExecutor(max_workers=slots,
+                                        thread_name_prefix="inference",
+                                        initializer=self._init_slot)
+
+    def _init_slot(self) -> None:
+        slot = next(self._slot_ids)
+        torch.set_num_threads(self.threads_per_slot)
+        if self.affinity:
+            cpus = sorted(os.sched_getaffinity(0))
+            mine = cpus[slot * self.threads_per_slot:(slot + 1) * self.threads_per_slot]
+            if mine:
+                os.sched_setaffinity(0, mine)   # pid 0 : 호출한 thread 에만 적용
+
+    async def run(self, fn: Callable, *args):
+        with self._lock:
+            self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            # 호출한 task 의 contextvars (trace span 등)를 slot thread 에서도 유지
+            ctx = contextvars.copy_context()
+            return await loop.run_in_executor(self._pool, partial(ctx.run, fn, *args))
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def info(self) -> Dict[str, object]:
+        return {"slots": self.slots,
+                "threads_per_slot": self.threads_per_slot,
+                "affinity": self.affinity,
+                "pending": self.pending}
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# (slots, threads_per_slot) 후보 : slots x threads <= core 수
+def candidate_configs(cores: int | None = None) -> List[Tuple[int, int]]:
+    cores = cores or available_cpus()
+    configs = []
+    slots = 1
+    while slots <= cores:
+        configs.append((slots, max(1, cores // slots)))
+        slots *= 2
+    return configs
+
+
+# 시작 시 후보 설정별로 동시 window 처리량(windows/sec)을 측정하여 최고 설정 선택
+def autotune(work: Callable[[], object], affinity: bool = False,
+             windows_per_slot: int = 2) -> Tuple[Tuple[int, int], Dict[str, float]]:
+    results: Dict[str, float] = {}
+    best, best_wps = (1, available_cpus()), 0.0
+    for slots, threads in candidate_configs():
+        ex = InferenceExecutor(slots, threads, affinity)
+        try:
+            # slot 별 1회 워밍업 (thread 초기화 / OpenMP team 생성 비용 제외)
+            list(ex._pool.map(lambda _: work(), range(slots)))
+            n = slots * windows_per_slot
+            t0 = time.perf_counter()
+            list(ex._pool.map(lambda _: work(), range(n)))
+            wps = n / (time.perf_counter() - t0)
+        finally:
+            ex.shutdown()
+        results[f"{slots}x{threads}"] = round(wps, 3)
+        print(f"[Autotune] slots={slots} threads/slot={threads} -> {wps:.2f} windows/s")
+        if wps > best_wps:
+            best, best_wps = (slots, threads), wps
+    return best, results
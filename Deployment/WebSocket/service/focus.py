@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from WebSocket.repository import ScoreDB, StudyDB, DailyRecord
+from WebSocket.core.timeline import encode_timeline
 
 @dataclass
 class FocusInfo:
@@ -17,6 +18,7 @@ class FocusInfo:
     min_focus: int = 10
     max_focus: int = 0
     duration: int = 0
+    timeline: bytearray = field(default_factory=bytearray) # window 별 집중도 (uint8)
 
 class FocusTracker:
     def __init__(self) -> None:
@@ -26,6 +28,14 @@ class FocusTracker:
     def get_lock(self, user_name: str) -> asyncio.Lock:
         return self._locks[user_name]
 
+    # 메모리 진단 : 연결 종료 후에도 남는 항목이 있으면 users / locks 가 접속자 수보다 커짐
+    def stats(self) -> Dict[str, int]:
+        infos = list(self.focus_dict.values())
+        return {"users": len(infos),
+                "locks": len(self._locks),
+                "timeline_bytes": sum(len(info.timeline) for info in infos),
+                "max_duration": max((info.duration for info in infos), default=0)}
+
     # 사용자 집중도 dict 초기화
     def init_user(self, user_name: str) -> None:
         self.focus_dict[user_name] = FocusInfo()
@@ -40,6 +50,7 @@ class FocusTracker:
         self.focus_dict[user_name].min_focus = min(current, self.focus_dict[user_name].min_focus)
         self.focus_dict[user_name].max_focus = max(current, self.focus_dict[user_name].max_focus)
         self.focus_dict[user_name].duration += 1
+        self.focus_dict[user_name].timeline.append(current)
         self.focus_dict[user_name].avg_focus = self.focus_dict[user_name].score / self.focus_dict[user_name].duration
         print(f"[LOG] :     {user_name} current focus = {current}")
         return current
@@ -54,6 +65,7 @@ class FocusTracker:
         avg      = info.avg_focus
         mn       = info.min_focus
         mx       = info.max_focus
+        timeline = encode_timeline(info.timeline)
         self.focus_dict.pop(user_name)
         # score_date, start_time, study_time 계산
         duration = int((end - start).total_seconds())
@@ -69,7 +81,8 @@ class FocusTracker:
                                  score=score,
                                  avg_focus= avg,
                                  min_focus= mn,
-                                 max_focus= mx)
+                                 max_focus= mx,
+                                 timeline= timeline)
             # StudyDB 에 기록
             async with db.begin():
                 await ScoreDB.increase_total_cnt(db, user_name)
@@ -0,0 +1,206 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+import threading, queue
+import asyncio
+import shutil
+import time, os
+
+from WebSocket.core.config import (FRAME_STORE, FRAME_DIR, TMPFS_FRAME_DIR,
+                                   FRAME_STORE_CAPACITY, FRAME_STORE_BATCH)
+
+
+# 한 번의 추론 단위(window)로 수집된 프레임 묶음
+@dataclass
+class FrameWindow:
+    user_name: str
+    started_at: float                                   # 수집 시작 시각 (epoch sec)
+    frames: List[bytes] = field(default_factory=list)   # 클라이언트가 보낸 원본 이미지 bytes (batch message 는 memoryview slice)
+    timestamps: List[float] = field(default_factory=list)   # 프레임별 캡처 시각 (epoch sec, v1 은 서버 수신 시각)
+    seq: int = 0        # 이 window 를 완성한 마지막 message 의 연결 내 순번 (1부터, 결과 message 에 포함 -> replay 시 짝짓기)
+
+    @property
+    def window_id(self) -> str:
+        return f"images_{int(self.started_at * 1000)}"
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(f) for f in self.frames)
+
+
+# 백엔드별 write 지연시간(latency) 통계
+class WriteMetrics:
+    def __init__(self, window: int = 256) -> None:
+        self.count = 0
+        self.bytes = 0
+        self.total_sec = 0.0
+        self.max_sec = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()   # disk 백엔드는 worker thread 에서 기록
+
+    def observe(self, elapsed: float, nbytes: int) -> None:
+        with self._lock:
+            self.count += 1
+            self.bytes += nbytes
+            self.total_sec += elapsed
+            self.max_sec = max(self.max_sec, elapsed)
+            self._recent.append(elapsed)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            recent = sorted(self._recent)
+        p50 = recent[len(recent) // 2] if recent else 0.0
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {"writes": self.count,
+                "bytes": self.bytes,
+                "avg_ms": round(self.total_sec / self.count * 1000, 3) if self.count else 0.0,
+                "p50_ms": round(p50 * 1000, 3),
+                "p95_ms": round(p95 * 1000, 3),
+                "max_ms": round(self.max_sec * 1000, 3)}
+
+
+# ---------------------------------------------------------------------------------
+# FrameStore : 수집한 프레임 window 의 보관(audit / dataset 수집) 방식 추상화
+#   추론은 메모리의 bytes 로 직접 수행하므로, 저장은 추론 경로와 분리됨
+# ---------------------------------------------------------------------------------
+class FrameStore(ABC):
+    name = "base"
+
+    def __init__(self) -> None:
+        self.metrics = WriteMetrics()
+
+    @abstractmethod
+    async def save(self, window: FrameWindow) -> None:
+        ...
+
+    async def close(self) -> None:
+        return None
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": self.name, **self.metrics.snapshot()}
+
+
+# window 를 파일로 기록 (원본 bytes 그대로 기록 -> 디코딩/재인코딩 X)
+def _write_window(root: str, window: FrameWindow) -> str:
+    cur_img_dir = os.path.join(root, window.user_name, window.window_id)
+    os.makedirs(name=cur_img_dir, exist_ok=True)
+    for idx, img_bytes in enumerate(window.frames):
+        with open(os.path.join(cur_img_dir, f"{idx:04d}.jpg"), "wb") as f:
+            f.write(img_bytes)
+    return cur_img_dir
+
+
+def _remove_dirs(dirs: List[str]) -> None:
+    for d in dirs:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+# 메모리 ring buffer : 최근 capacity 개 window 만 보관 (파일시스템 접근 X)
+class MemoryFrameStore(FrameStore):
+    name = "memory"
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self.ring: Deque[FrameWindow] = deque(maxlen=capacity)
+
+    async def save(self, window: FrameWindow) -> None:
+        start = time.perf_counter()
+        self.ring.append(window)
+        self.metrics.observe(time.perf_counter() - start, window.nbytes)
+
+    def stats(self) -> Dict[str, object]:
+        return {**super().stats(),
+                "buffered_windows": len(self.ring),
+                "buffered_bytes": sum(w.nbytes for w in self.ring)}
+
+
+# tmpfs(RAM disk) : 최근 capacity 개 window 디렉토리만 유지
+#   파일 생성 / 삭제는 worker thread 에서 (이벤트 루프 블로킹 X), _dirs 는 이벤트 루프에서만 갱신
+class TmpfsFrameStore(FrameStore):
+    name = "tmpfs"
+
+    def __init__(self, root: str, capacity: int) -> None:
+        super().__init__()
+        self.root = root
+        self.capacity = capacity
+        self._dirs: Deque[str] = deque()
+
+    async def save(self, window: FrameWindow) -> None:
+        start = time.perf_counter()
+        self._dirs.append(await asyncio.to_thread(_write_window, self.root, window))
+        evicted = []
+        while len(self._dirs) > self.capacity:
+            evicted.append(self._dirs.popleft())
+        if evicted:
+            await asyncio.to_thread(_remove_dirs, evicted)
+        self.metrics.observe(time.perf_counter() - start, window.nbytes)
+
+    async def close(self) -> None:
+        dirs = list(self._dirs)
+        self._dirs.clear()
+        await asyncio.to_thread(_remove_dirs, dirs)
+
+
+# 디스크 : worker thread 가 queue 의 window 들을 batch 단위로 기록 (이벤트 루프 블로킹 X)
+class DiskFrameStore(FrameStore):
+    name = "disk"
+
+    def __init__(self, root: str, batch_size: int) -> None:
+        super().__init__()
+        self.root = root
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: "queue.Queue[Tuple[float, FrameWindow] | None]" = queue.Queue(maxsize=batch_size * 16)
+        self._worker = threading.Thread(target=self._run, name="frame-store-disk", daemon=True)
+        self._worker.start()
+
+    async def save(self, window: FrameWindow) -> None:
+        try:
+            self._queue.put_nowait((time.perf_counter(), window))
+        except queue.Full:
+            # 디스크가 밀리는 경우 추론 경로를 막지 않고 버림
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+            for entry in batch:
+                if entry is None:
+                    return
+                enqueued, window = entry
+                try:
+                    _write_window(self.root, window)
+                except Exception as e:
+                    # 어떤 예외든 worker 는 계속 동작 (thread 가 죽으면 queue 가 가득 차 모든 window 를 버리게 됨)
+                    print(f"[ERROR] : FrameStore(disk) {window.user_name}/{window.window_id}: {e!r}")
+                    continue
+                # enqueue ~ 기록 완료까지의 지연시간
+                self.metrics.observe(time.perf_counter() - enqueued, window.nbytes)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._queue.put, None)
+        await asyncio.to_thread(self._worker.join)
+
+    def stats(self) -> Dict[str, object]:
+        return {**super().stats(),
+                "pending_windows": self._queue.qsize(),
+                "dropped_windows": self.dropped}
+
+
+# config(FRAME_STORE) 에 따라 백엔드 생성
+def create_frame_store(backend: str = FRAME_STORE) -> FrameStore:
+    if backend == "memory":
+        return MemoryFrameStore(FRAME_STORE_CAPACITY)
+    if backend == "tmpfs":
+        return TmpfsFrameStore(TMPFS_FRAME_DIR, FRAME_STORE_CAPACITY)
+    if backend == "disk":
+        return DiskFrameStore(FRAME_DIR, FRAME_STORE_BATCH)
+    raise ValueError(f"Unsupported FRAME_STORE backend: {backend}")
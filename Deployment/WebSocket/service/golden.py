@@ -0,0 +1,199 @@
+# Golden-output 회귀(regression) corpus : 최적화된 추론 경로가 예측을 바꾸지 않는지 검증
+#   1) corpus 생성 : 현재 기준 경로(load_frames_from_folder + CNNEncoder + EngagementModelNoFusion)의 확률 기록
+#      python -m WebSocket.service.golden build --ckpt WebSocket/model/best_model_epoch_4.pt --root <frames> --corpus golden/
+#   2) 검증 : 임의의 ModelService 설정으로 corpus 를 degradation rung 별로 다시 채점하여 drift / flip rate / speedup 보고
+#      rung 별 허용 오차(TOLERANCES, --tolerance) 를 넘으면 exit 1
+#      python -m WebSocket.service.golden check --ckpt WebSocket/model/best_model_epoch_4.pt --corpus golden/ --opt device_str=\"cpu\"
+import os, json, time, shutil
+import argparse
+from typing import Any, Dict, List, Tuple
+
+import torch
+
+from WebSocket.model.inference import (NUM_FRAMES_DEFAULT, IMAGE_EXTS,
+                                       load_frames_from_folder, load_models_cached)
+from WebSocket.model.batch import iter_frame_folders
+from WebSocket.service.inference import ModelService
+from WebSocket.service.degrade import LADDER, Rung
+from WebSocket.service.arena import measure_allocations
+
+MANIFEST = "manifest.json"
+
+
+def _window_files(folder: str) -> List[str]:
+    files = [f for f in sorted(os.listdir(folder)) if f.lower().endswith(IMAGE_EXTS)]
+    return files[:NUM_FRAMES_DEFAULT]
+
+
+# 기준(reference) 경로로 window 1개의 확률 계산
+@torch.inference_mode()
+def _reference_proba(cnn, head, folder: str) -> float:
+    video = load_frames_from_folder(folder, NUM_FRAMES_DEFAULT).unsqueeze(0)
+    return torch.sigmoid(head(cnn(video))).item()
+
+
+def build_corpus(root: str, ckpt_path: str, corpus_dir: str, limit: int | None = None) -> Dict[str, Any]:
+    cnn, head, meta = load_models_cached(os.path.abspath(ckpt_path), "cpu")
+    windows = []
+    for idx, rel in enumerate(iter_frame_folders(root)):
+        if limit is not None and idx >= limit:
+            break
+        src = os.path.join(root, rel)
+        wid = f"w{idx:05d}"
+        dst = os.path.join(corpus_dir, "windows", wid)
+        os.makedirs(dst, exist_ok=True)
+        for name in _window_files(src):
+            shutil.copyfile(os.path.join(src, name), os.path.join(dst, name))   # 원본 bytes 그대로 보관
+        t0 = time.perf_counter()
+        prob = _reference_proba(cnn, head, dst)
+        windows.append({"id": wid, "source": rel, "prob": prob,
+                        "ref_ms": round((time.perf_counter() - t0) * 1000, 3)})
+    manifest = {"ckpt": os.path.basename(ckpt_path),
+                "torch": torch.__version__,
+                "meta": {k: v for k, v in meta.items() if v is not None},
+                "windows": windows}
+    with open(os.path.join(corpus_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"[Golden] corpus with {len(windows)} windows written to {corpus_dir}")
+    return manifest
+
+
+def _read_window(folder: str) -> List[bytes]:
+    frames = []
+    for name in _window_files(folder):
+        with open(os.path.join(folder, name), "rb") as f:
+            frames.append(f.read())
+    return frames
+
+
+# rung 별 허용 오차 (기준 경로 대비 max drift, flip rate) : 경량 rung 은 timestep / 해상도 축소로 손실이 있으므로 더 느슨하게
+TOLERANCES: Dict[str, Dict[str, float]] = {
+    "full": {"max_drift": 0.01, "flip_rate": 0.01},
+    "subsampled": {"max_drift": 0.15, "flip_rate": 0.05},
+    "light": {"max_drift": 0.25, "flip_rate": 0.10},
+}
+
+
+# 현재 ModelService 설정으로 corpus 를 rung 별로 채점 후 기준 확률과 비교
+#   최상위 값은 full rung (기존 보고 형식), rungs 에 rung 별 결과 + 허용 오차 통과 여부
+def check_corpus(corpus_dir: str, baseline: bool = True, rungs: Tuple[Rung, ...] = LADDER,
+                 tolerances: Dict[str, Dict[str, float]] | None = None) -> Dict[str, Any]:
+    with open(os.path.join(corpus_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    tolerances = {**TOLERANCES, **(tolerances or {})}
+    thr = float(ModelService.threshold)
+    drifts: Dict[str, List[float]] = {r.name: [] for r in rungs}
+    flips = {r.name: 0 for r in rungs}
+    t_cand = {r.name: 0.0 for r in rungs}
+    t_ref = 0.0
+    if baseline:
+        ref_cnn, ref_head, _ = load_models_cached(str(ModelService.ckpt_path), "cpu")
+        # 후보 경로는 init_model 에서 워밍업됨 -> 기준 경로도 1회 미측정 실행 후 시간 측정 (첫 window 의 초기화 비용 제외)
+        if manifest["windows"]:
+            _reference_proba(ref_cnn, ref_head, os.path.join(corpus_dir, "windows", manifest["windows"][0]["id"]))
+    for w in manifest["windows"]:
+        folder = os.path.join(corpus_dir, "windows", w["id"])
+        frames = _read_window(folder)
+        for rung in rungs:
+            t0 = time.perf_counter()
+            prob = ModelService.predict_proba(frames, rung)
+            t_cand[rung.name] += time.perf_counter() - t0
+            drifts[rung.name].append(abs(prob - w["prob"]))
+            flips[rung.name] += int((prob >= thr) != (w["prob"] >= thr))
+        if baseline:
+            # 동일 호스트에서 기준 경로 시간 측정 (speedup 계산용)
+            t0 = time.perf_counter()
+            _reference_proba(ref_cnn, ref_head, folder)
+            t_ref += time.perf_counter() - t0
+    n = len(manifest["windows"])
+    per_rung = {}
+    for rung in rungs:
+        d = drifts[rung.name]
+        stats = {"max_drift": max(d) if n else 0.0,
+                 "mean_drift": sum(d) / n if n else 0.0,
+                 "flip_rate": flips[rung.name] / n if n else 0.0,
+                 "candidate_ms": round(t_cand[rung.name] / n * 1000, 3) if n else 0.0}
+        if baseline and n:
+            stats["speedup"] = round(t_ref / t_cand[rung.name], 3) if t_cand[rung.name] > 0 else None
+        tol = tolerances.get(rung.name)
+        if tol is not None:
+            stats["tolerance"] = tol
+            stats["ok"] = stats["max_drift"] <= tol["max_drift"] and stats["flip_rate"] <= tol["flip_rate"]
+        per_rung[rung.name] = stats
+    full = per_rung.get(LADDER[0].name, {})
+    report = {"windows": n,
+              "threshold": thr,
+              "max_drift": full.get("max_drift", 0.0),
+              "mean_drift": full.get("mean_drift", 0.0),
+              "flip_rate": full.get("flip_rate", 0.0),
+              "candidate_ms": full.get("candidate_ms", 0.0)}
+    if baseline and n:
+        report["reference_ms"] = round(t_ref / n * 1000, 3)
+        report["speedup"] = full.get("speedup")
+    report["rungs"] = per_rung
+    report["ok"] = all(s.get("ok", True) for s in per_rung.values())
+    return report
+
+
+def _parse_opts(opts: List[str]) -> Dict[str, Any]:
+    # --opt key=value (value 는 JSON 리터럴, 파싱 실패 시 문자열)
+    kwargs = {}
+    for opt in opts:
+        key, _, value = opt.partition("=")
+        try:
+            kwargs[key] = json.loads(value)
+        except json.JSONDecodeError:
+            kwargs[key] = value
+    return kwargs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build")
+    b.add_argument("--ckpt", required=True)
+    b.add_argument("--root", required=True, help="Directory tree containing frame folders")
+    b.add_argument("--corpus", required=True)
+    b.add_argument("--limit", type=int, default=None)
+    c = sub.add_parser("check")
+    c.add_argument("--ckpt", required=True)
+    c.add_argument("--corpus", required=True)
+    c.add_argument("--opt", action="append", default=[], help="ModelService.init_model keyword, e.g. --opt device_str=\"cpu\"")
+    c.add_argument("--max-drift", type=float, default=None, help="Override the full rung's max drift tolerance")
+    c.add_argument("--max-flip-rate", type=float, default=None, help="Override the full rung's flip rate tolerance")
+    c.add_argument("--tolerance", action="append", default=[],
+                   help="Per-rung tolerance override, e.g. --tolerance light=0.3,0.15 (max_drift,flip_rate)")
+    c.add_argument("--rungs", nargs="+", choices=[r.name for r in LADDER], default=None,
+                   help="Rungs to check (default: every rung in the degradation ladder)")
+    c.add_argument("--no-baseline", action="store_true", help="Skip timing the reference path")
+    c.add_argument("--alloc-windows", type=int, default=0,
+                   help="Also re-run the first corpus window this many times and report steady-state allocations")
+    args = ap.parse_args()
+
+    if args.cmd == "build":
+        build_corpus(args.root, args.ckpt, args.corpus, args.limit)
+        return
+    tolerances = {name: dict(tol) for name, tol in TOLERANCES.items()}
+    if args.max_drift is not None:
+        tolerances["full"]["max_drift"] = args.max_drift
+    if args.max_flip_rate is not None:
+        tolerances["full"]["flip_rate"] = args.max_flip_rate
+    for opt in args.tolerance:
+        name, _, values = opt.partition("=")
+        max_drift, flip_rate = (float(v) for v in values.split(","))
+        tolerances[name] = {"max_drift": max_drift, "flip_rate": flip_rate}
+    rungs = tuple(r for r in LADDER if args.rungs is None or r.name in args.rungs)
+    ModelService.init_model(args.ckpt, **_parse_opts(args.opt))
+    report = check_corpus(args.corpus, baseline=not args.no_baseline, rungs=rungs, tolerances=tolerances)
+    if args.alloc_windows > 0 and report["windows"]:
+        with open(os.path.join(args.corpus, MANIFEST)) as f:
+            first = json.load(f)["windows"][0]["id"]
+        frames = _read_window(os.path.join(args.corpus, "windows", first))
+        report["allocations"] = measure_allocations(lambda: ModelService.predict_proba(frames),
+                                                    args.alloc_windows, ModelService.device)
+    print(json.dumps(report, indent=2))
+    if not report["ok"]:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
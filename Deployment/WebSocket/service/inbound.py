@@ -0,0 +1,51 @@
+from fastapi import WebSocket
+from typing import Callable, Tuple
+import asyncio
+import time
+
+MAX_QUEUED = 256    # 소비되지 않은 message 상한 (v2 batch 는 message 1개 = window 1개) -> 초과 시 socket 읽기 중단 (backpressure)
+
+
+# ---------------------------------------------------------------------------------
+# 연결 별 수신 task : handler 가 추론 / 송신 / 보관 중이어도 socket 을 계속 읽어 도착 순서대로 queue 에 넣음
+#   message 마다 읽은 시각(wall clock)을 함께 보관 -> frame rate 측정 / 녹화가 handler 의 처리 지연에 묶이지 않음
+#   on_message : 읽은 직후 호출 (세션 녹화 record 시각 = 이 task 가 socket 에서 message 를 읽은 시각)
+#   disconnect 등 수신 예외는 queue 에 넣었다가 get() 에서 다시 raise
+# ---------------------------------------------------------------------------------
+class InboundReader:
+    def __init__(self, websocket: WebSocket, on_message: Callable[[bytes], None] | None = None) -> None:
+        self.websocket = websocket
+        self.on_message = on_message
+        self._queue: "asyncio.Queue[Tuple[float, bytes] | BaseException]" = asyncio.Queue(maxsize=MAX_QUEUED)
+        self.consumed = 0   # get() 으로 꺼낸 message 수 = 마지막으로 꺼낸 message 의 연결 내 순번
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                data = await self.websocket.receive_bytes()
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await self._queue.put(e)
+                return
+            arrived = time.time()
+            if self.on_message is not None:
+                self.on_message(data)
+            await self._queue.put((arrived, data))
+
+    # (읽은 시각, message bytes)
+    async def get(self) -> Tuple[float, bytes]:
+        item = await self._queue.get()
+        if isinstance(item, BaseException):
+            self._queue.put_nowait(item)    # 이후 호출도 같은 예외
+            raise item
+        self.consumed += 1
+        return item
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        self._task.cancel()
@@ -2,31 +2,124 @@
 from __future__ import annotations
 from pathlib import Path
 from threading import Lock
-from typing import Optional, Literal, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, Literal, Dict, Any, List, Tuple
 
 import torch
+import torch.nn as nn
 import asyncio
+import threading
+import hashlib
+import gc
+import os, time
 
 from WebSocket.model.inference import (NUM_FRAMES_DEFAULT,
                                        build_models,            # (device) -> (cnn, head). eval() 설정 포함
                                        load_checkpoint,         # (cnn, head, ckpt_path, device) -> meta(dict)
-                                       load_frames_from_folder, # (folder, num_frames) -> (T,3,224,224) tensor
                                        find_latest_best_model)  # (model_dir) -> latest best path
+from WebSocket.model.weights import is_weights_file, load_weights
+from WebSocket.model.profiling import profile_window
+from WebSocket.core.config import (PROFILE_DIR, INFER_SLOTS, INFER_THREADS_PER_SLOT,
+                                   INFER_CPU_AFFINITY, INFER_AUTOTUNE,
+                                   DEDUP_ENABLED, DEDUP_THRESHOLD, DEDUP_MAX_STREAK, DEGRADE_ENABLED)
+from WebSocket.service.executor import InferenceExecutor, autotune, available_cpus
+from WebSocket.service.dedup import WindowDeduper, window_signature
+from WebSocket.service.arena import TensorArena
+from WebSocket.service.degrade import LADDER, DegradeController, Rung
+from WebSocket.service.scheduler import InferenceScheduler
+from WebSocket.core.tracing import tracer, current_span
+
+
+# ---------------------------------------------------------------------------------
+# 모델 버전(version) : 한 체크포인트로 빌드/워밍업된 모델 묶음
+# ---------------------------------------------------------------------------------
+@dataclass
+class ModelVersion:
+    version: str                  # "{파일명}-{크기/수정시각 fingerprint 8자리}" (로드 경로에서 파일 전체를 읽지 않음)
+    ckpt_path: Path
+    cnn: nn.Module
+    head: nn.Module
+    meta: Dict[str, Any]
+    threshold: float
+    loaded_at: float = field(default_factory=time.time)
+    inflight: int = 0             # 이 버전으로 처리 중인 window 수
+    timings: Dict[str, float] = field(default_factory=dict)   # 로드 단계별 소요 시간(sec)
+    sha256: str | None = None     # 체크포인트 전체 hash : 활성화 후 백그라운드 thread 에서 계산 (완료 전 None)
+    _hash_pid: int | None = field(default=None, repr=False)   # hash 를 계산 중인 프로세스 (fork 된 worker 는 다시 시작)
+
+    def info(self) -> Dict[str, Any]:
+        return {"version": self.version,
+                "ckpt_path": str(self.ckpt_path),
+                "threshold": self.threshold,
+                "loaded_at": self.loaded_at,
+                "sha256": self.sha256,
+                "inflight": self.inflight,
+                "timings": {k: round(v, 4) for k, v in self.timings.items()}}
+
+    # sha256 을 백그라운드 thread 에서 계산 (weights 로드 / mmap 전에 파일 전체를 읽지 않도록 활성화 이후로 미룸)
+    def hash_in_background(self) -> None:
+        if self.sha256 is not None or self._hash_pid == os.getpid():
+            return
+        self._hash_pid = os.getpid()
+        threading.Thread(target=self._hash, name="ckpt-sha256", daemon=True).start()
+
+    def _hash(self) -> None:
+        t0 = time.perf_counter()
+        digest = hashlib.sha256()
+        try:
+            with open(self.ckpt_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError as e:
+            print(f"[ERROR] : sha256 of {self.ckpt_path} failed: {e!r}")
+            return
+        self.sha256 = digest.hexdigest()
+        self.timings["hash_sec"] = time.perf_counter() - t0
 
 
 # ---------------------------------------------------------------------------------
 # 전역 싱글톤(Global Singleton) ModelService
+#   active 버전으로 새 window 를 처리, 교체(hot-swap) 시 진행 중 window 는 기존 버전으로 마무리
+#   previous 버전은 즉시 rollback 용으로 보관
 # ---------------------------------------------------------------------------------
 class ModelService:
     _lock = Lock()
+    _swap_lock = Lock()
     _initialized: bool = False
 
-    # 전역 상태(global state)
+    # 전역 상태(global state) : active 버전의 값을 그대로 노출
     device: torch.device | None = None
     cnn = None
     head = None
     threshold: float = 0.5
     meta: Dict[str, Any] = {}
+    ckpt_path: Path | None = None
+
+    # 버전 레지스트리(registry)
+    active: ModelVersion | None = None
+    previous: ModelVersion | None = None
+    loading: str | None = None    # 백그라운드 로딩 중인 체크포인트
+    _threshold_type: str = "acc"
+    _warm_pid: int | None = None   # 워밍업을 수행한 프로세스 (fork 후 worker 별로 다시 수행)
+    _custom_threshold: Optional[float] = None
+
+    # 추론 전용 executor (프로세스 별로 생성 -> fork 된 worker 도 각자 보유)
+    executor: InferenceExecutor | None = None
+    scheduler: InferenceScheduler | None = None     # executor 앞단의 사용자 간 공정 scheduler
+    _executor_pid: int | None = None
+
+    # 사용자별 중복(near-duplicate) window 재사용 (DEDUP_ENABLED=false 이면 None)
+    deduper: WindowDeduper | None = WindowDeduper(DEDUP_THRESHOLD, DEDUP_MAX_STREAK) if DEDUP_ENABLED else None
+
+    # slot 별 재사용 입력 버퍼 (window 마다 프레임 / stack 텐서를 새로 만들지 않음), 입력 해상도별 1개
+    arenas: Dict[int, TensorArena] = {}
+
+    # 부하 기반 단계적 경량화 (DEGRADE_ENABLED=false 이면 None -> 항상 full)
+    degrader: DegradeController | None = DegradeController() if DEGRADE_ENABLED else None
+
+    # 라이브 프로파일링(profiling) 요청 상태 : 남은 window 수 / 기록 경로
+    _profile_remaining: int = 0
+    _profile_dir: str | None = None
 
     @classmethod
     def _select_device(cls, device_str: Optional[str]) -> torch.device:
@@ -57,6 +150,68 @@ class ModelService:
             raise FileNotFoundError(f"[ModelService] checkpoint not found: {ckpt}")
         return ckpt
 
+    @classmethod
+    def _resolve_threshold(cls, meta: Dict[str, Any]) -> float:
+        if cls._threshold_type == "custom" and (cls._custom_threshold is not None):
+            return float(cls._custom_threshold)
+        if cls._threshold_type == "rec" and (meta.get("thr_rec") is not None):
+            return float(meta["thr_rec"])
+        if cls._threshold_type == "acc" and (meta.get("thr_acc") is not None):
+            return float(meta["thr_acc"])
+        return 0.5  # 기본값
+
+    # 체크포인트 1개를 빌드 + 로드 + 워밍업 하여 ModelVersion 생성 (active 에는 영향 없음)
+    @classmethod
+    def _load_version(cls, ckpt_path: Path, warmup: bool = True) -> ModelVersion:
+        timings: Dict[str, float] = {}
+        st = ckpt_path.stat()
+        fingerprint = hashlib.sha256(f"{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:8]
+
+        if is_weights_file(str(ckpt_path)):
+            # weights-only 포맷 : mmap + meta device 빌드 (빠른 경로)
+            cnn, head, meta, load_timings = load_weights(str(ckpt_path), cls.device)
+            timings.update(load_timings)
+        else:
+            t0 = time.perf_counter()
+            cnn, head = build_models(cls.device)                             # 팀원 함수
+            timings["build_sec"] = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            meta = load_checkpoint(cnn, head, str(ckpt_path), cls.device)    # 팀원 함수
+            timings["load_sec"] = time.perf_counter() - t0
+
+        # 워밍업(warm-up)으로 첫 추론 지연(latency) 감소
+        if warmup:
+            t0 = time.perf_counter()
+            cls._warmup(cnn, head)
+            timings["warmup_sec"] = time.perf_counter() - t0
+
+        return ModelVersion(version=f"{ckpt_path.stem}-{fingerprint}",
+                            ckpt_path=ckpt_path,
+                            cnn=cnn,
+                            head=head,
+                            meta=meta,
+                            threshold=cls._resolve_threshold(meta),
+                            timings=timings)
+
+    @classmethod
+    def _warmup(cls, cnn: nn.Module, head: nn.Module) -> None:
+        with torch.inference_mode():
+            dummy = torch.zeros((1, NUM_FRAMES_DEFAULT, 3, 224, 224),
+                                dtype=torch.float32, device=cls.device)
+            _ = head(cnn(dummy))
+        cls._warm_pid = os.getpid()
+
+    # active 버전 원자적 교체 : 이후 새 window 부터 적용
+    @classmethod
+    def _activate(cls, version: ModelVersion) -> None:
+        with cls._swap_lock:
+            if cls.active is not None and cls.active is not version:
+                cls.previous = cls.active
+            cls.active = version
+            cls.cnn, cls.head = version.cnn, version.head
+            cls.meta, cls.threshold, cls.ckpt_path = version.meta, version.threshold, version.ckpt_path
+        version.hash_in_background()
+
     # -----------------------------------------------------------------------------
     # 초기화(Initialization): 앱 시작 시 1회 호출 (lifespan에서 호출)
     # -----------------------------------------------------------------------------
@@ -65,81 +220,285 @@ class ModelService:
                    ckpt_path_or_dir: Optional[str] = None,
                    device_str: Optional[str] = None,
                    threshold_type: Literal["acc", "rec", "custom"] = "acc",
-                   custom_threshold: Optional[float] = None) -> None:
+                   custom_threshold: Optional[float] = None,
+                   warmup: bool = True) -> None:
         if cls._initialized:
             return
         with cls._lock:
             if cls._initialized:
                 return
 
-            # 1) 디바이스 선택(device)
+            # 1) 디바이스 선택(device) / 임계값 정책 저장 (교체 시에도 동일 정책 적용)
             cls.device = cls._select_device(device_str)
+            cls._threshold_type, cls._custom_threshold = threshold_type, custom_threshold
 
-            # 2) 체크포인트 경로(resolve)
-            ckpt_path = cls._resolve_ckpt(ckpt_path_or_dir)
-
-            # 3) 모델 빌드(build) + 가중치 로드(load)
-            cls.cnn, cls.head = build_models(cls.device)                     # 팀원 함수
-            cls.meta = load_checkpoint(cls.cnn, cls.head, str(ckpt_path),    # 팀원 함수
-                                       cls.device)
-
-            # 4) 임계값(threshold) 결정
-            if threshold_type == "custom" and (custom_threshold is not None):
-                cls.threshold = float(custom_threshold)
-            elif threshold_type == "rec" and (cls.meta.get("thr_rec") is not None):
-                cls.threshold = float(cls.meta["thr_rec"])
-            elif threshold_type == "acc" and (cls.meta.get("thr_acc") is not None):
-                cls.threshold = float(cls.meta["thr_acc"])
-            # else: 기본 0.5 유지
-
-            # 5) 워밍업(warm-up)으로 첫 추론 지연(latency) 감소
-            with torch.inference_mode():
+            # 2) 체크포인트 경로(resolve) -> 3) 빌드 / 로드 / 워밍업 -> 4) 활성화
+            version = cls._load_version(cls._resolve_ckpt(ckpt_path_or_dir), warmup=warmup)
+            cls._activate(version)
+
+            cls._initialized = True
+            print(f"[Startup] Model loaded on {cls.device} | ckpt={version.ckpt_path} "
+                  f"| version={version.version} | thr={cls.threshold}")
+            print("[Startup] load timings : " + ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in version.timings.items()))
+
+    # -----------------------------------------------------------------------------
+    # preload-then-fork : 부모 프로세스에서 로드한 가중치를 worker 들이 copy-on-write 로 공유
+    # -----------------------------------------------------------------------------
+    @classmethod
+    def freeze(cls, share_memory: bool = False) -> None:
+        """fork 전에 호출. 가중치를 읽기 전용으로 고정하여 worker 에서 page 복사가 일어나지 않게 함."""
+        for module in (cls.cnn, cls.head):
+            for p in module.parameters():
+                p.requires_grad_(False)
+            if share_memory:
+                module.share_memory()   # 가중치를 공유 메모리(/dev/shm)로 이동
+        gc.collect()
+        gc.freeze()   # 이후 GC 가 부모에서 만든 객체를 순회(refcount/헤더 write)하지 않도록 제외
+
+    @classmethod
+    def ensure_warm(cls) -> None:
+        """현재 프로세스에서 워밍업이 안 된 경우 실행 (fork 된 worker 의 lifespan 에서 호출)."""
+        if cls._initialized and cls._warm_pid != os.getpid():
+            t0 = time.perf_counter()
+            cls._warmup(cls.cnn, cls.head)
+            print(f"[Startup] worker {os.getpid()} warm-up {(time.perf_counter() - t0) * 1000:.1f}ms")
+        if cls.active is not None:
+            cls.active.hash_in_background()     # fork 전에 끝나지 않은 hash 는 worker 에서 다시 계산
+
+    # -----------------------------------------------------------------------------
+    # 추론 executor : slot 수 / slot 당 torch thread 수 / CPU affinity (선택적으로 자동 튜닝)
+    # -----------------------------------------------------------------------------
+    @classmethod
+    def init_executor(cls) -> InferenceExecutor:
+        if cls.executor is not None and cls._executor_pid == os.getpid():
+            return cls.executor
+        with cls._lock:
+            if cls.executor is not None and cls._executor_pid == os.getpid():
+                return cls.executor
+            slots = max(1, INFER_SLOTS)
+            threads = INFER_THREADS_PER_SLOT or max(1, available_cpus() // slots)
+            if INFER_AUTOTUNE and cls._initialized:
                 dummy = torch.zeros((1, NUM_FRAMES_DEFAULT, 3, 224, 224),
                                     dtype=torch.float32, device=cls.device)
-                _ = cls.head(cls.cnn(dummy))
+                def work() -> None:
+                    with torch.inference_mode():
+                        cls.head(cls.cnn(dummy))
+                (slots, threads), _ = autotune(work, INFER_CPU_AFFINITY)
+            cls.executor = InferenceExecutor(slots, threads, INFER_CPU_AFFINITY)
+            cls.scheduler = InferenceScheduler(cls.executor)
+            cls._executor_pid = os.getpid()
+            print(f"[Startup] inference executor : {cls.executor.info()}")
+            return cls.executor
 
-            cls._initialized = True
-            print(f"[Startup] Model loaded on {cls.device} | ckpt={ckpt_path} | thr={cls.threshold}")
+    @classmethod
+    def shutdown_executor(cls) -> None:
+        if cls.executor is not None and cls._executor_pid == os.getpid():
+            cls.executor.shutdown()
+        cls.executor = None
+        cls.scheduler = None
 
     # -----------------------------------------------------------------------------
-    # 추론(Inference): 프레임 폴더 경로를 받아 예측값 반환
+    # 무중단 교체(hot-swap) / rollback
     # -----------------------------------------------------------------------------
     @classmethod
-    async def inference_focus(cls, img_dir: str) -> int:
+    async def swap_model(cls, ckpt_path_or_dir: Optional[str] = None) -> ModelVersion:
+        """새 체크포인트를 백그라운드 thread 에서 로드/워밍업 후 active 로 교체."""
+        ckpt_path = cls._resolve_ckpt(ckpt_path_or_dir)
+        with cls._swap_lock:
+            if cls.loading is not None:
+                raise RuntimeError(f"Another model is loading: {cls.loading}")
+            cls.loading = str(ckpt_path)
+        try:
+            version = await asyncio.to_thread(cls._load_version, ckpt_path)
+        finally:
+            cls.loading = None
+        cls._activate(version)
+        print(f"[Model] switched to {version.version} (previous={cls.previous.version if cls.previous else None})")
+        return version
+
+    @classmethod
+    def rollback(cls) -> ModelVersion:
+        with cls._swap_lock:
+            if cls.previous is None:
+                raise RuntimeError("No previous model version to roll back to")
+            target = cls.previous
+        cls._activate(target)
+        print(f"[Model] rolled back to {target.version}")
+        return target
+
+    @classmethod
+    def versions(cls) -> Dict[str, Any]:
+        return {"active": cls.active.info() if cls.active else None,
+                "previous": cls.previous.info() if cls.previous else None,
+                "loading": cls.loading}
+
+    # -----------------------------------------------------------------------------
+    # 추론(Inference): 수집한 프레임 bytes 리스트를 받아 예측값 반환
+    # -----------------------------------------------------------------------------
+    @classmethod
+    async def inference_focus(cls, frames: List[bytes], user_name: str | None = None) -> Tuple[int, str]:
         """
         비동기(async) 엔드포인트(WebSocket)에서 안전하게 호출.
-        내부는 CPU/GPU 바운드이므로 to_thread로 이벤트 루프 블로킹 방지.
-        반환: pred(int) 0/1
+        내부는 CPU/GPU 바운드이므로 전용 executor 로 이벤트 루프 블로킹 방지.
+        user_name 이 주어지면 직전 window 와 거의 같은 경우 직전 확률 재사용.
+        반환: (pred(int) 0/1, 결과를 만든 rung 이름)
         """
         if not cls._initialized:
             # lifespan에서 보통 init_model을 호출하지만, 혹시 누락 시 방어적으로 로드
             cls.init_model()
 
-        def _run_sync() -> int:
-            vid = load_frames_from_folder(img_dir, num_frames=NUM_FRAMES_DEFAULT)  # (T,3,224,224)
-            x = vid.unsqueeze(0).to(cls.device)                                    # (1,T,3,224,224)
-            with torch.inference_mode():
-                logit = cls.head(cls.cnn(x))
+        cls.init_executor()
+        scheduler = cls.scheduler
+        rung = cls.degrader.rung if cls.degrader is not None else LADDER[0]
+        t0 = time.perf_counter()
+        # 사용자별 queue 를 거쳐 실행 (늦어질 window 는 StaleWindowError)
+        with tracer.span("model.inference", rung=rung.name, frames=len(frames)) as span:
+            span.set("queue.depth", scheduler.depth)
+            prob, version = await scheduler.submit(user_name or "-", cls._predict, frames, user_name, rung)
+            span.set("model.version", version.version)
+            span.set("probability", prob)
+        if cls.degrader is not None:
+            cls.degrader.observe(rung, (time.perf_counter() - t0) * 1000, scheduler.depth)
+        print(f"[DEBUG] :       probability : {prob} and focus : {prob >= version.threshold} ({version.version}, {rung.name})")
+        return int(prob >= float(version.threshold)), rung.name
+
+    # 동기(sync) 추론 : window 1개의 집중 확률(probability) 반환 (오프라인 harness 에서도 사용)
+    #   rung : degradation ladder 의 경량 설정으로 채점 (golden harness 의 rung 별 drift 검증)
+    @classmethod
+    def predict_proba(cls, frames: List[bytes], rung: Rung = LADDER[0]) -> float:
+        return cls._predict(frames, rung=rung)[0]
+
+    @classmethod
+    def _predict(cls, frames: List[bytes], user_name: str | None = None,
+                 rung: Rung = LADDER[0]) -> Tuple[float, ModelVersion]:
+        # window 시작 시점의 active 버전을 고정 -> 도중에 교체되어도 같은 버전으로 마무리
+        version = cls.active
+        signature = None
+        if user_name is not None and cls.deduper is not None:
+            signature = window_signature(frames)
+            prob = cls.deduper.lookup(user_name, signature, version.version, rung.name)
+            if prob is not None:
+                current_span().set("dedup.reused", True)
+                return prob, version
+        with cls._swap_lock:
+            version.inflight += 1
+        try:
+            if rung.frame_stride > 1:
+                frames = frames[::rung.frame_stride]
+            with tracer.span("frames.decode", frames=len(frames)):
+                x = cls._arena(rung.size).load(frames, cls.device,
+                                               num_frames=NUM_FRAMES_DEFAULT // rung.frame_stride)  # (1,T,3,S,S)
+            cnn, head = version.cnn, version.head
+            profile_dir = cls._take_profile_slot()
+            with tracer.span("model.forward", timesteps=x.shape[1], size=rung.size), torch.inference_mode():
+                if profile_dir:
+                    logit, _ = profile_window(cnn, head, x, profile_dir)
+                    print(f"[Profile] window profile written to {profile_dir}")
+                else:
+                    logit = head(cnn(x))
                 prob = torch.sigmoid(logit).item()
-                print(f"[DEBUG] :       probability : {prob} and focus : {prob >= cls.threshold}")
-            return int(prob >= float(cls.threshold))
+            if signature is not None:
+                cls.deduper.store(user_name, signature, prob, version.version, rung.name)
+            return prob, version
+        finally:
+            with cls._swap_lock:
+                version.inflight -= 1
+
+    @classmethod
+    def _arena(cls, size: int) -> TensorArena:
+        if size not in cls.arenas:
+            with cls._lock:
+                cls.arenas.setdefault(size, TensorArena(NUM_FRAMES_DEFAULT, size))
+        return cls.arenas[size]
+
+    # 연결 종료 시 사용자별 상태 정리
+    @classmethod
+    def forget_user(cls, user_name: str) -> None:
+        if cls.deduper is not None:
+            cls.deduper.forget(user_name)
+        if cls.scheduler is not None:
+            cls.scheduler.forget(user_name)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {"executor": cls.executor.info() if cls.executor else None,
+                "scheduler": cls.scheduler.stats() if cls.scheduler else None,
+                "dedup": cls.deduper.stats() if cls.deduper else None,
+                "arena": {size: arena.stats() for size, arena in cls.arenas.items()},
+                "degrade": cls.degrader.stats() if cls.degrader else None}
+
+    # -----------------------------------------------------------------------------
+    # 라이브 프로파일링(profiling): 다음 n_windows 개 window 를 torch profiler 로 기록
+    # -----------------------------------------------------------------------------
+    @classmethod
+    def request_profile(cls, n_windows: int) -> str:
+        with cls._lock:
+            cls._profile_dir = os.path.join(PROFILE_DIR, f"live_{int(time.time())}")
+            cls._profile_remaining = n_windows
+            return cls._profile_dir
 
-        return await asyncio.to_thread(_run_sync)
+    @classmethod
+    def _take_profile_slot(cls) -> str | None:
+        if cls._profile_remaining <= 0:
+            return None
+        with cls._lock:
+            if cls._profile_remaining <= 0:
+                return None
+            cls._profile_remaining -= 1
+            return os.path.join(cls._profile_dir, f"window_{cls._profile_remaining:03d}")
 
     # -----------------------------------------------------------------------------
-    # 메모리 풋프린트 출력(footprint)
+    # 메모리 풋프린트(footprint) : 모델 버전별 용량 / 입력 arena / torch 할당자(allocator)
     # -----------------------------------------------------------------------------
+    @staticmethod
+    def _module_bytes(*modules: nn.Module) -> Dict[str, int]:
+        params = sum(p.numel() * p.element_size() for m in modules for p in m.parameters())
+        buffers = sum(b.numel() * b.element_size() for m in modules for b in m.buffers())
+        return {"params": params, "buffers": buffers, "total": params + buffers}
+
+    @classmethod
+    def _version_bytes(cls, version: ModelVersion) -> Dict[str, Any]:
+        return {"version": version.version, **cls._module_bytes(version.cnn, version.head)}
+
+    @classmethod
+    def _allocator(cls) -> Dict[str, Any]:
+        if cls.device is None:
+            return {}
+        try:
+            if cls.device.type == "cuda":
+                stats = torch.cuda.memory_stats(cls.device)
+                return {"device": str(cls.device),
+                        "allocated": torch.cuda.memory_allocated(cls.device),
+                        "reserved": torch.cuda.memory_reserved(cls.device),
+                        "max_allocated": torch.cuda.max_memory_allocated(cls.device),
+                        "alloc_retries": stats.get("num_alloc_retries", 0),
+                        "ooms": stats.get("num_ooms", 0)}
+            if cls.device.type == "mps":
+                import torch.mps as mps
+                return {"device": str(cls.device),
+                        "allocated": mps.current_allocated_memory(),
+                        "driver": mps.driver_allocated_memory()}
+        except Exception:
+            pass
+        # CPU 텐서는 시스템 malloc 사용 -> 별도 통계 없음 (process RSS 로 확인)
+        return {"device": str(cls.device)}
+
+    @classmethod
+    def memory(cls) -> Dict[str, Any]:
+        if not cls._initialized:
+            return {"initialized": False}
+        # previous 버전은 rollback 전까지 메모리에 남음
+        return {"initialized": True,
+                "active": cls._version_bytes(cls.active) if cls.active else None,
+                "previous": cls._version_bytes(cls.previous) if cls.previous else None,
+                "arena_bytes": sum(arena.allocated_bytes for arena in list(cls.arenas.values())),
+                "allocator": cls._allocator()}
+
     @classmethod
     def print_footprint(cls) -> None:
         if not cls._initialized:
             print("[Memory] Model not initialized")
             return
-        # 1) 모델 파라미터/버퍼 용량
-        param_bytes = sum(p.numel() * p.element_size() for p in cls.cnn.parameters()) \
-                    + sum(p.numel() * p.element_size() for p in cls.head.parameters())
-        buffer_bytes = sum(b.numel() * b.element_size() for b in cls.cnn.buffers()) \
-                     + sum(b.numel() * b.element_size() for b in cls.head.buffers())
-        model_bytes = param_bytes + buffer_bytes
 
         def fmt(n: int) -> str:
             u = ["B","KB","MB","GB","TB"]
@@ -148,30 +507,21 @@ class ModelService:
                 f /= 1024; i += 1
             return f"{f:.2f} {u[i]}"
 
-        print(f"[Memory] model(params+buffers) = {fmt(model_bytes)} "
-              f"(params={fmt(param_bytes)}, buffers={fmt(buffer_bytes)})")
+        # 1) 모델 파라미터/버퍼 용량
+        model = cls._module_bytes(cls.cnn, cls.head)
+        print(f"[Memory] model(params+buffers) = {fmt(model['total'])} "
+              f"(params={fmt(model['params'])}, buffers={fmt(model['buffers'])})")
 
         # 2) 프로세스 RSS
         try:
-            import psutil, os
+            import psutil
             rss = psutil.Process(os.getpid()).memory_info().rss
             print(f"[Memory] process RSS = {fmt(rss)}")
         except Exception:
             pass
 
         # 3) 장치 메모리(device memory)
-        if cls.device and cls.device.type == "cuda":
-            try:
-                alloc = torch.cuda.memory_allocated(cls.device)
-                resv  = torch.cuda.memory_reserved(cls.device)
-                mx    = torch.cuda.max_memory_allocated(cls.device)
-                print(f"[Memory] device allocated={fmt(alloc)} reserved={fmt(resv)} max_alloc={fmt(mx)}")
-            except Exception:
-                pass
-        elif cls.device and cls.device.type == "mps":
-            try:
-                import torch.mps as mps
-                print(f"[Memory] device allocated={fmt(mps.current_allocated_memory())} "
-                      f"driver={fmt(mps.driver_allocated_memory())}")
-            except Exception:
-                pass
\ No newline at end of file
+        allocator = cls._allocator()
+        if len(allocator) > 1:
+            print("[Memory] device " + " ".join(f"{k}={fmt(v)}" for k, v in allocator.items()
+                                                if k in ("allocated", "reserved", "max_allocated", "driver")))
@@ -0,0 +1,98 @@
+from typing import Dict, List, Tuple
+
+from WebSocket.core.config import (N_FRAMES, TIME_OUT, WINDOW_MODE, WINDOW_SPAN_SEC,
+                                   WINDOW_MIN_FRAMES, WINDOW_MAX_FRAMES)
+from WebSocket.service.framestore import FrameWindow
+
+FPS_EWMA_ALPHA = 0.3
+
+
+# 캡처 시각 기준으로 균등 간격 n 개 시점에 가장 가까운 프레임 선택 (bytes 단위 -> 디코딩 없음)
+def resample_frames(frames: List[bytes], timestamps: List[float], n: int) -> Tuple[List[bytes], List[float]]:
+    if len(frames) == n or not frames:
+        return frames, timestamps
+    t0, t1 = timestamps[0], timestamps[-1]
+    out_frames, out_ts = [], []
+    j = 0
+    for i in range(n):
+        target = t0 + (t1 - t0) * i / (n - 1) if n > 1 else t0
+        while j + 1 < len(timestamps) and abs(timestamps[j + 1] - target) <= abs(timestamps[j] - target):
+            j += 1
+        out_frames.append(frames[j])
+        out_ts.append(timestamps[j])
+    return out_frames, out_ts
+
+
+# ---------------------------------------------------------------------------------
+# 연결(connection) 별 window 구성 정책 + 클라이언트 frame rate 측정
+#   frames : 기존 방식, N_FRAMES 장이 모이면 window 완성
+#   span   : WINDOW_SPAN_SEC 동안 모인 프레임(최소 WINDOW_MIN_FRAMES)으로 window 완성 후 N_FRAMES 로 resample
+#            -> 느린 / 빠른 클라이언트 모두 window 지연이 span 으로 일정
+# ---------------------------------------------------------------------------------
+class WindowPacer:
+    def __init__(self, mode: str = WINDOW_MODE) -> None:
+        self.mode = mode
+        self.fps = 0.0            # 캡처 기준 frame rate (EWMA)
+        self.fill_sec = 0.0       # 직전 window 수집 소요 시간
+        self.fill_sec_avg = 0.0   # 수집 소요 시간 (EWMA)
+        self.raw_frames = 0       # 직전 window 의 resample 전 프레임 수
+        self.windows = 0
+        self._first_arrival: float | None = None
+
+    # window 당 최대 프레임 수 (batch message 에서 이 이상은 버림)
+    @property
+    def capacity(self) -> int:
+        return WINDOW_MAX_FRAMES if self.mode == "span" else N_FRAMES
+
+    def observe(self, now: float) -> None:
+        if self._first_arrival is None:
+            self._first_arrival = now
+
+    def _span_end(self) -> float | None:
+        if self.mode != "span" or self._first_arrival is None:
+            return None
+        return self._first_arrival + WINDOW_SPAN_SEC
+
+    def ready(self, window: FrameWindow, now: float) -> bool:
+        n = len(window.frames)
+        if self.mode != "span":
+            return n >= N_FRAMES
+        if n >= WINDOW_MAX_FRAMES:
+            return True
+        if n < WINDOW_MIN_FRAMES:
+            return False
+        capture_span = window.timestamps[-1] - window.timestamps[0]
+        return capture_span >= WINDOW_SPAN_SEC or now >= self._span_end()
+
+    # 다음 receive 대기 마감 시각 : span 종료 시점 또는 TIME_OUT
+    def next_deadline(self, window: FrameWindow, now: float) -> float:
+        timeout_at = window.started_at + TIME_OUT
+        span_end = self._span_end()
+        if span_end is not None and now < span_end < timeout_at:
+            return span_end
+        return timeout_at
+
+    # window 완성 처리 : 통계 갱신 + (span 모드) N_FRAMES 로 resample
+    def finish(self, window: FrameWindow, now: float) -> FrameWindow:
+        self._first_arrival = None
+        n = len(window.frames)
+        self.raw_frames = n
+        self.fill_sec = now - window.started_at
+        duration = window.timestamps[-1] - window.timestamps[0] if n > 1 else 0.0
+        if duration > 0:
+            fps = (n - 1) / duration
+            self.fps = fps if self.windows == 0 else FPS_EWMA_ALPHA * fps + (1 - FPS_EWMA_ALPHA) * self.fps
+        self.fill_sec_avg = self.fill_sec if self.windows == 0 else \
+            FPS_EWMA_ALPHA * self.fill_sec + (1 - FPS_EWMA_ALPHA) * self.fill_sec_avg
+        self.windows += 1
+        if self.mode == "span":
+            window.frames, window.timestamps = resample_frames(window.frames, window.timestamps, N_FRAMES)
+        return window
+
+    def stats(self) -> Dict[str, float]:
+        return {"mode": self.mode,
+                "fps": round(self.fps, 2),
+                "fill_sec": round(self.fill_sec, 3),
+                "fill_sec_avg": round(self.fill_sec_avg, 3),
+                "raw_frames": self.raw_frames,
+                "windows": self.windows}
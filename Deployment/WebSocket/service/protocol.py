@@ -0,0 +1,71 @@
+from typing import List, NamedTuple
+import struct
+
+# ---------------------------------------------------------------------------------
+# WebSocket 프레임 프로토콜
+#   v1 (기존) : binary message 1개 = 프레임 이미지(JPEG/PNG) 1장
+#   v2 (batch): binary message 1개 = window 전체 (length-prefixed)
+#
+#   message header : magic "BBW2"(4) | version u8 | reserved u8 | n_frames u16
+#   frame header   : timestamp_ms u64 | width u16 | height u16 | codec u8 | reserved u8 | length u32
+#   frame payload  : length bytes (이미지 원본)
+#   모든 정수는 little-endian
+# ---------------------------------------------------------------------------------
+BATCH_MAGIC = b"BBW2"
+BATCH_VERSION = 2
+_MSG_HEADER = struct.Struct("<4sBxH")
+_FRAME_HEADER = struct.Struct("<QHHBxI")
+
+CODEC_JPEG = 1
+CODEC_PNG = 2
+CODECS = {CODEC_JPEG: "jpeg", CODEC_PNG: "png"}
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+class FrameHeader(NamedTuple):
+    timestamp_ms: int     # 클라이언트 캡처 시각 (epoch ms)
+    width: int
+    height: int
+    codec: int
+
+
+def is_batch_message(data: bytes) -> bool:
+    return data[:4] == BATCH_MAGIC
+
+
+# window message 를 (header, payload) 목록으로 분해. payload 는 원본 message 의 memoryview slice (복사 없음)
+def parse_window_message(data: bytes) -> List[tuple[FrameHeader, memoryview]]:
+    view = memoryview(data)
+    if len(view) < _MSG_HEADER.size:
+        raise ProtocolError("truncated message header")
+    magic, version, n_frames = _MSG_HEADER.unpack_from(view, 0)
+    if magic != BATCH_MAGIC or version != BATCH_VERSION:
+        raise ProtocolError(f"unsupported message (magic={bytes(magic)!r}, version={version})")
+
+    frames = []
+    offset = _MSG_HEADER.size
+    for idx in range(n_frames):
+        if offset + _FRAME_HEADER.size > len(view):
+            raise ProtocolError(f"truncated header of frame {idx}")
+        ts_ms, width, height, codec, length = _FRAME_HEADER.unpack_from(view, offset)
+        offset += _FRAME_HEADER.size
+        if offset + length > len(view):
+            raise ProtocolError(f"truncated payload of frame {idx}")
+        frames.append((FrameHeader(ts_ms, width, height, codec), view[offset:offset + length]))
+        offset += length
+    if offset != len(view):
+        raise ProtocolError(f"{len(view) - offset} trailing bytes")
+    return frames
+
+
+# client / replay 도구용 : (header, payload) 목록을 v2 window message 로 직렬화
+def build_window_message(frames: List[tuple[FrameHeader, bytes]]) -> bytes:
+    parts = [_MSG_HEADER.pack(BATCH_MAGIC, BATCH_VERSION, len(frames))]
+    for header, payload in frames:
+        parts.append(_FRAME_HEADER.pack(header.timestamp_ms, header.width, header.height,
+                                        header.codec, len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
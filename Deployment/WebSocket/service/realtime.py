@@ -1,49 +1,186 @@
 from fastapi import WebSocket
-from PIL import Image
 from datetime import datetime
-import time, os, io
+from typing import Any, Dict, Set
+import time, os, json
 import asyncio
-import shutil
 
-from WebSocket.core.config import TIME_OUT, N_FRAMES, FRAME_DIR
+from WebSocket.core.config import TIME_OUT, RECORD_ENABLED, RECORD_USERS, RECORD_DIR, RECORD_MAX_MB
+from WebSocket.core.exceptions import FrameVerdict
+from WebSocket.service.framestore import FrameStore, FrameWindow, create_frame_store
+from WebSocket.service.protocol import ProtocolError, is_batch_message, parse_window_message
+from WebSocket.service.validation import FrameValidator
+from WebSocket.service.pacing import WindowPacer
+from WebSocket.service.recorder import SessionRecorder, INBOUND, OUTBOUND, RECORD_EXT, safe_name, shutdown_writer
+from WebSocket.service.inbound import InboundReader
 
 class RealTimeService:
-    @staticmethod
-    async def collect_frames(websocket: WebSocket, user_name: str) -> str:
-        frames = []
-        start = time.time()
-        cnt = 0
-        while len(frames) < N_FRAMES and (time.time() - start) < TIME_OUT:
+    frame_store: FrameStore | None = None
+    # 연결 별 window 구성 정책 / frame rate 통계 (user_name -> WindowPacer)
+    pacers: Dict[str, WindowPacer] = {}
+    # 연결 별 수집 중 / 추론 중인 window (user_name -> FrameWindow) : 메모리 진단용
+    windows: Dict[str, FrameWindow] = {}
+    # 세션 녹화 (user_name -> SessionRecorder), armed : 다음 연결 1회 녹화 대상 (admin 지정)
+    recorders: Dict[str, SessionRecorder] = {}
+    armed: Set[str] = set()
+    # 연결 별 수신 task (user_name -> InboundReader) : 첫 collect_frames 에서 생성, forget 에서 종료
+    readers: Dict[str, InboundReader] = {}
+
+    # lifespan 에서 1회 호출 : config(FRAME_STORE) 에 맞는 저장 백엔드 생성
+    @classmethod
+    def init_store(cls) -> None:
+        if cls.frame_store is None:
+            cls.frame_store = create_frame_store()
+            print(f"[Startup] FrameStore backend = {cls.frame_store.name}")
+
+    @classmethod
+    async def close_store(cls) -> None:
+        if cls.frame_store is not None:
+            await cls.frame_store.close()
+            cls.frame_store = None
+
+    # lifespan shutdown : 녹화 중인 세션을 닫고 writer thread 가 남은 record 를 모두 쓸 때까지 대기
+    @classmethod
+    async def close_recordings(cls, timeout: float = 10.0) -> None:
+        for user_name, recorder in list(cls.recorders.items()):
+            recorder.close()
+            print(f"[Shutdown] {user_name} session recorded : {recorder.stats()}")
+        cls.recorders.clear()
+        if not await asyncio.to_thread(shutdown_writer, timeout):
+            print(f"[ERROR] : session recorder did not flush within {timeout:.0f}s, pending records dropped")
+
+    @classmethod
+    def pacer(cls, user_name: str) -> WindowPacer:
+        if user_name not in cls.pacers:
+            cls.pacers[user_name] = WindowPacer()
+        return cls.pacers[user_name]
+
+    @classmethod
+    def forget(cls, user_name: str) -> None:
+        cls.pacers.pop(user_name, None)
+        cls.windows.pop(user_name, None)
+        reader = cls.readers.pop(user_name, None)
+        if reader is not None:
+            reader.close()
+        recorder = cls.recorders.pop(user_name, None)
+        if recorder is not None:
+            recorder.close()
+            print(f"[LOG] : {user_name} session recorded : {recorder.stats()}")
+
+    # 연결 시작 시 호출 : 녹화 대상이면 archive 생성 (토큰 등 인증 정보는 기록하지 않음)
+    @classmethod
+    def start_recording(cls, user_name: str, **meta: Any) -> None:
+        selected = RECORD_ENABLED and (not RECORD_USERS or user_name in RECORD_USERS)
+        if not selected and user_name not in cls.armed:
+            return
+        cls.armed.discard(user_name)
+        path = os.path.join(RECORD_DIR, safe_name(user_name), f"{int(time.time() * 1000)}{RECORD_EXT}")
+        cls.recorders[user_name] = SessionRecorder(path, {"user_name": user_name, **meta}, RECORD_MAX_MB * 2**20)
+        print(f"[LOG] : {user_name} session recording -> {path}")
+
+    # 수신 원본 기록 : InboundReader 가 socket 에서 읽는 즉시 호출 (검증 전 원본 그대로, 불량 프레임도 재현)
+    @classmethod
+    def record_inbound(cls, user_name: str, data: bytes) -> None:
+        recorder = cls.recorders.get(user_name)
+        if recorder is not None:
+            recorder.record(INBOUND, data)
+
+    @classmethod
+    def reader(cls, user_name: str, websocket: WebSocket) -> InboundReader:
+        reader = cls.readers.get(user_name)
+        if reader is None or reader.websocket is not websocket:
+            if reader is not None:
+                reader.close()
+            reader = cls.readers[user_name] = InboundReader(websocket,
+                                                            lambda data: cls.record_inbound(user_name, data))
+        return reader
+
+    # 클라이언트에게 보낸 결과 기록 (replay 시 결과 일치율 비교용)
+    @classmethod
+    def record_outbound(cls, user_name: str, message: Dict[str, Any]) -> None:
+        recorder = cls.recorders.get(user_name)
+        if recorder is not None:
+            recorder.record(OUTBOUND, json.dumps(message).encode())
+
+    @classmethod
+    def recording_stats(cls) -> Dict[str, Any]:
+        return {"enabled": RECORD_ENABLED,
+                "users": sorted(RECORD_USERS),
+                "armed": sorted(cls.armed),
+                "active": {user_name: r.stats() for user_name, r in list(cls.recorders.items())}}
+
+    # 연결 별 frame rate / window 수집 시간 (느린 클라이언트 파악용)
+    @classmethod
+    def client_stats(cls) -> Dict[str, Dict[str, float]]:
+        return {user_name: pacer.stats() for user_name, pacer in list(cls.pacers.items())}
+
+    # 연결 별 보관 중인 프레임 bytes
+    #   retained_bytes : batch message 의 memoryview slice 는 message 전체를 붙잡고 있으므로 원본 버퍼 기준
+    @classmethod
+    def buffer_stats(cls) -> Dict[str, Dict[str, int]]:
+        stats = {}
+        for user_name, window in list(cls.windows.items()):
+            buffers = {}
+            for f in list(window.frames):
+                base = f.obj if isinstance(f, memoryview) else f
+                buffers[id(base)] = len(base)
+            stats[user_name] = {"frames": len(window.frames),
+                                "frame_bytes": window.nbytes,
+                                "retained_bytes": sum(buffers.values())}
+        return stats
+
+    @classmethod
+    async def collect_frames(cls, websocket: WebSocket, user_name: str,
+                             validator: FrameValidator | None = None) -> FrameWindow:
+        # validator : 연결 별 프레임 검증기 (불량 프레임은 디코딩 전에 버림, 한도 초과 시 FrameViolationError)
+        validator = validator or FrameValidator()
+        pacer = cls.pacer(user_name)
+        reader = cls.reader(user_name, websocket)
+        window = FrameWindow(user_name=user_name, started_at=time.time())
+        cls.windows[user_name] = window
+        # deadline (span 종료 또는 TIME_OUT) 까지 message 당 await 1회 (1초 polling 없음)
+        #   message 는 InboundReader 가 미리 읽어 둔 것 -> 도착(읽은) 시각 기준으로 frame rate / timestamp 기록
+        while True:
+            now = time.time()
+            if pacer.ready(window, now):
+                break
+            if now >= window.started_at + TIME_OUT:
+                raise asyncio.TimeoutError()
             try:
-                frame = await asyncio.wait_for(websocket.receive_bytes(), 1.0)
-                frames.append(frame)
-                cnt += 1
-                print(f"[LOG] :     {cnt} - {datetime.now()}")
+                arrived, data = await asyncio.wait_for(reader.get(), pacer.next_deadline(window, now) - now)
             except asyncio.TimeoutError:
+                continue    # span 종료 / TIME_OUT 여부는 루프 앞에서 판정
+            pacer.observe(arrived)
+            if not is_batch_message(data):
+                # v1 : 프레임 1장
+                if len(window.frames) < pacer.capacity and validator.check(data):
+                    window.frames.append(data)
+                    window.timestamps.append(arrived)
                 continue
-        if len(frames) < N_FRAMES:
-            raise asyncio.TimeoutError()
-        
-        user_dir = os.path.join(FRAME_DIR, user_name)
-        os.makedirs(name=user_dir, exist_ok=True)
-        cur_img_dir = os.path.join(user_dir, f"images_{int(start)}")
-        os.makedirs(name=cur_img_dir, exist_ok=True)
-
-        for idx, img_bytes in enumerate(iterable=frames):
-            try:
-                img = Image.open(io.BytesIO(img_bytes))  # bytes → Image 객체
-                file_path = os.path.join(cur_img_dir, f"{idx:04d}.jpg")
-                img.save(file_path, "JPEG")
-            except Exception as e:
-                print(f"[ERROR] :    {file_path}: {e}")
-        print(f"[DEBUG] :        Saved {len(frames)} images to {cur_img_dir}")
-        return cur_img_dir
-    
-
-    @staticmethod
-    async def clear(img_dir: str) -> None:
-        if img_dir and os.path.exists(img_dir):
+            # v2 : window 전체를 한 message 로 수신 -> memoryview slice 로 분해 (복사 없음)
             try:
-                await asyncio.to_thread(shutil.rmtree, img_dir)
-            except Exception as e:
-                print(f"[ERROR] Failed to delete {img_dir}: {e}")
\ No newline at end of file
+                frames = parse_window_message(data)
+            except ProtocolError as e:
+                print(f"[ERROR] :    {user_name} malformed window message: {e}")
+                validator.reject(FrameVerdict.MALFORMED_MESSAGE)
+                continue
+            for header, payload in frames:
+                if len(window.frames) >= pacer.capacity:
+                    break
+                if validator.check(payload, header):
+                    window.frames.append(payload)
+                    window.timestamps.append(header.timestamp_ms / 1000)
+        window.seq = reader.consumed
+        window = pacer.finish(window, time.time())
+        print(f"[LOG] :     {user_name} collected {pacer.raw_frames} frames in {pacer.fill_sec:.2f}s "
+              f"({pacer.fps:.1f} fps) - {datetime.now()}")
+        return window
+
+    # 추론이 끝난 window 를 FrameStore 에 보관 (audit / dataset 수집)
+    @classmethod
+    async def archive(cls, window: FrameWindow) -> None:
+        if cls.frame_store is None:
+            return
+        try:
+            await cls.frame_store.save(window)
+        except Exception as e:
+            print(f"[ERROR] Failed to store {window.user_name}/{window.window_id}: {e}")
@@ -0,0 +1,178 @@
+from typing import Any, Dict, Iterator, Tuple, BinaryIO
+import threading, queue
+import struct
+import json
+import time, os, re
+
+# ---------------------------------------------------------------------------------
+# WebSocket 세션 녹화(recording) archive (.bbrec)
+#   file header : magic "BBRC"(4) | version u8 | reserved(3) | meta_len u32 | meta (JSON, utf-8)
+#   record      : offset_us u64 | kind u8 | reserved(3) | length u32 | payload
+#     offset_us : 녹화 시작 기준 시각 (monotonic, us)
+#                 INBOUND  = 연결 별 InboundReader 가 socket 에서 message 를 읽은 시각
+#                            (handler 의 추론 / 송신 / 보관과 무관하게 계속 읽음, 이벤트 루프 자체가 밀린 만큼만 늦음)
+#                 OUTBOUND = 결과를 클라이언트에 보낸 직후 시각
+#     kind      : INBOUND (클라이언트 -> 서버 binary message 원본), OUTBOUND (서버 -> 클라이언트 JSON)
+#   모든 정수는 little-endian. 서버가 도중에 종료되어도 마지막 완전한 record 까지 읽을 수 있음
+# ---------------------------------------------------------------------------------
+RECORD_MAGIC = b"BBRC"
+RECORD_VERSION = 1
+RECORD_EXT = ".bbrec"
+_FILE_HEADER = struct.Struct("<4sBxxxI")
+_RECORD = struct.Struct("<QBxxxI")
+
+INBOUND = 1
+OUTBOUND = 2
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+# 녹화 파일 경로용 : user_name 의 경로 구분자 등 제거
+def safe_name(name: str) -> str:
+    return re.sub(r"[^\w.-]", "_", name).lstrip(".") or "_"
+
+
+def read_archive(path: str) -> Tuple[Dict[str, Any], Iterator[Tuple[float, int, bytes]]]:
+    f = open(path, "rb")
+    head = f.read(_FILE_HEADER.size)
+    if len(head) < _FILE_HEADER.size:
+        f.close()
+        raise ArchiveError(f"{path}: truncated file header")
+    magic, version, meta_len = _FILE_HEADER.unpack(head)
+    if magic != RECORD_MAGIC or version != RECORD_VERSION:
+        f.close()
+        raise ArchiveError(f"{path}: unsupported archive (magic={magic!r}, version={version})")
+    meta = json.loads(f.read(meta_len).decode("utf-8"))
+
+    # (offset_sec, kind, payload) 순회
+    def records() -> Iterator[Tuple[float, int, bytes]]:
+        with f:
+            while True:
+                head = f.read(_RECORD.size)
+                if len(head) < _RECORD.size:
+                    return
+                offset_us, kind, length = _RECORD.unpack(head)
+                payload = f.read(length)
+                if len(payload) < length:
+                    return
+                yield offset_us / 1e6, kind, payload
+
+    return meta, records()
+
+
+# 모든 녹화 세션이 공유하는 writer thread : 이벤트 루프에서는 queue 에 넣기만 함
+#   디스크가 밀려 대기 중인 bytes 가 max_pending 을 넘으면 record 를 받지 않음 (close 는 항상 받음)
+class _ArchiveWriter:
+    def __init__(self, max_pending: int = 64 * 2**20) -> None:
+        self.max_pending = max_pending
+        self.pending = 0
+        self._queue: "queue.Queue[Tuple[SessionRecorder | None, Tuple[bytes, ...] | None]]" = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._files: Dict[int, BinaryIO] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, recorder: "SessionRecorder", parts: Tuple[bytes, ...] | None) -> bool:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+                self._thread.start()
+            if parts is not None:
+                size = sum(len(p) for p in parts)
+                if self.pending + size > self.max_pending:
+                    return False
+                self.pending += size
+        self._queue.put((recorder, parts))
+        return True
+
+    # lifespan shutdown : 대기 중인 record 를 모두 쓰고 열린 파일을 닫은 뒤 thread 종료 (timeout 초과 시 남은 record 는 버려짐)
+    def close(self, timeout: float = 10.0) -> bool:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return True
+        self._queue.put((None, None))
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            recorder, parts = self._queue.get()
+            if recorder is None:
+                for f in self._files.values():
+                    f.close()
+                self._files.clear()
+                return
+            key = id(recorder)
+            try:
+                if parts is None:
+                    f = self._files.pop(key, None)
+                    if f is not None:
+                        f.close()
+                    continue
+                f = self._files.get(key)
+                if f is None:
+                    os.makedirs(os.path.dirname(recorder.path), exist_ok=True)
+                    f = self._files[key] = open(recorder.path, "wb")
+                for part in parts:
+                    f.write(part)
+            except OSError as e:
+                print(f"[ERROR] : SessionRecorder {recorder.path}: {e}")
+                recorder.truncated = True
+            finally:
+                if parts is not None:
+                    with self._lock:
+                        self.pending -= sum(len(p) for p in parts)
+
+
+_writer = _ArchiveWriter()
+
+
+def shutdown_writer(timeout: float = 10.0) -> bool:
+    return _writer.close(timeout)
+
+
+# ---------------------------------------------------------------------------------
+# 연결 1개의 수신 프레임 stream 을 시각과 함께 그대로 기록 (opt-in, 원본 얼굴 프레임 포함)
+#   record() 는 이벤트 루프에서 복사 없이 queue 에 넣기만 함 (디스크 I/O 는 writer thread)
+#   max_bytes 초과 / writer 가 밀려 record 를 버려야 하면 그 시점에서 녹화 종료 (archive 는 앞부분까지 유효)
+# ---------------------------------------------------------------------------------
+class SessionRecorder:
+    def __init__(self, path: str, meta: Dict[str, Any], max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.started = time.monotonic()
+        self.records = 0
+        self.bytes = 0
+        self.truncated = False
+        self.closed = False
+        meta = {**meta, "started_at": time.time()}
+        blob = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        self.truncated = not _writer.submit(self, (_FILE_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, len(blob)), blob))
+
+    def record(self, kind: int, data: bytes) -> None:
+        if self.closed or self.truncated:
+            return
+        if self.bytes + len(data) > self.max_bytes:
+            print(f"[LOG] : SessionRecorder {self.path} reached {self.max_bytes} bytes, recording stopped")
+            self.truncated = True
+            return
+        offset_us = int((time.monotonic() - self.started) * 1e6)
+        if not _writer.submit(self, (_RECORD.pack(offset_us, kind, len(data)), data)):
+            self.truncated = True
+            return
+        self.records += 1
+        self.bytes += len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            _writer.submit(self, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path,
+                "seconds": round(time.monotonic() - self.started, 1),
+                "records": self.records,
+                "bytes": self.bytes,
+                "truncated": self.truncated}
@@ -0,0 +1,221 @@
+# 녹화 세션 replay : 성능 변경을 실제 클라이언트 트래픽(jitter, burst, 다양한 JPEG 크기)으로 반복 평가
+#   녹화 : RECORD_ENABLED / RECORD_USERS 또는 admin POST /admin/record?user_name=... -> RECORD_DIR/<user>/<ms>.bbrec
+#   1) archive 요약
+#      python -m WebSocket.service.replay inspect recordings/alice/1700000000000.bbrec
+#   2) /ws/real-time 로 재생 (archive 여러 개 = 동시 연결), speed 2 -> 2배속, 0 -> 대기 없이 최대 속도
+#      python -m WebSocket.service.replay run recordings/*/*.bbrec --url ws://localhost:9000/ws/real-time --tokens tokens.json --speed 1
+#      tokens.json : {"<user_name>": {"access": "...", "refresh": "..."}}  (replay 할 계정의 토큰)
+import json, time
+import argparse
+import asyncio
+from collections import deque
+from typing import Any, Dict, List
+from urllib.parse import urlencode
+
+from WebSocket.core.config import ACCESS, REFRESH
+from WebSocket.service.protocol import ProtocolError, is_batch_message, parse_window_message
+from WebSocket.service.recorder import INBOUND, OUTBOUND, read_archive
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {"p50": round(ordered[len(ordered) // 2], 2),
+            "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            "max": round(ordered[-1], 2)}
+
+
+# archive 1개 요약 : 수신 간격(jitter), message / 프레임 크기 분포
+def inspect_archive(path: str) -> Dict[str, Any]:
+    meta, records = read_archive(path)
+    gaps_ms, sizes = [], []
+    frames = batches = outbound = 0
+    last = duration = None
+    for offset, kind, payload in records:
+        duration = offset
+        if kind == OUTBOUND:
+            outbound += 1
+            continue
+        if last is not None:
+            gaps_ms.append((offset - last) * 1000)
+        last = offset
+        sizes.append(len(payload))
+        if is_batch_message(payload):
+            batches += 1
+            try:
+                frames += len(parse_window_message(payload))
+            except ProtocolError:
+                pass
+        else:
+            frames += 1
+    return {"path": path,
+            "meta": meta,
+            "duration_sec": round(duration or 0.0, 2),
+            "messages": len(sizes),
+            "batch_messages": batches,
+            "frames": frames,
+            "results": outbound,
+            "bytes": sum(sizes),
+            "message_bytes": {**_percentiles(sizes), "min": min(sizes, default=0)},
+            "interarrival_ms": _percentiles(gaps_ms)}
+
+
+def _connect():
+    try:
+        from websockets.asyncio.client import connect     # websockets >= 13
+        return connect, "additional_headers"
+    except ImportError:
+        from websockets import connect
+        return connect, "extra_headers"
+
+
+# 결과 message 와 녹화된 결과 짝짓기
+#   seq (window 를 완성한 message 순번) 가 양쪽에 있으면 seq 로 짝지음 -> 한쪽에서만 drop / 다른 window 구성이 생겨도
+#   나머지 짝은 어긋나지 않음 (짝이 없는 결과는 unmatched / missing 으로 보고)
+#   seq 가 없는 녹화(이전 서버)는 개수가 같을 때만 순서대로 짝짓고, 다르면 aligned=False 로 보고 (비교하지 않음)
+def _pair_results(results: List[Dict[str, Any]], expected: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if results and expected and all("seq" in r for r in results) and all("seq" in e for e in expected):
+        by_seq = {e["seq"]: e for e in expected}
+        pairs = [(r, by_seq[r["seq"]]) for r in results if r["seq"] in by_seq]
+        aligned = True
+    else:
+        aligned = len(results) == len(expected)
+        pairs = list(zip(results, expected)) if aligned else []
+    matches = sum(1 for r, e in pairs if r.get("focus") == e.get("focus"))
+    return {"aligned": aligned,
+            "paired": len(pairs),
+            "unmatched_results": len(results) - len(pairs) if aligned else None,
+            "missing_results": len(expected) - len(pairs) if aligned else None,
+            "focus_agreement": round(matches / len(pairs), 4) if pairs else None}
+
+
+# archive 1개를 새 연결로 재생
+#   latency : 결과 수신 시각 - 그 window 를 완성한 INBOUND message (결과의 seq 번째) 를 보낸 시각
+#             seq 가 없는 서버 / 녹화는 녹화에서 OUTBOUND 직전에 있던 INBOUND 송신 시각을 순서대로 사용
+#             (이 경우 결과 수가 녹화와 다르면 aligned=False, 지연은 전체 집계에서 제외)
+#   lag     : 녹화 시각 대비 송신이 늦어진 정도, 제때 보낸 message 는 0 (replayer 자체가 병목인지 확인)
+async def replay_session(path: str, url: str, tokens: Dict[str, Dict[str, str]], speed: float,
+                         user_name: str | None = None, drain_sec: float = 30.0) -> Dict[str, Any]:
+    connect, headers_kw = _connect()
+    meta, records = read_archive(path)
+    user_name = user_name or meta["user_name"]
+    token = tokens[user_name]
+    query = urlencode({"user_name": user_name,
+                       "subject": meta.get("subject") or "replay",
+                       "location": meta.get("location") or "replay"})
+    headers = {"Cookie": f"{ACCESS}={token['access']}; {REFRESH}={token['refresh']}"}
+
+    expected: List[Dict[str, Any]] = []
+    results: List[Dict[str, Any]] = []
+    latencies: List[float] = []
+    lags: List[float] = []
+    sent_at: Dict[int, float] = {}     # message 순번(1부터) -> 송신 시각
+    last_sent = time.perf_counter()
+    anchors: deque = deque()    # seq 가 없을 때 : OUTBOUND 마다 그 직전 INBOUND 송신 시각
+    sent = sent_bytes = 0
+    error = None
+
+    async def receive(ws) -> None:
+        try:
+            async for message in ws:
+                now = time.perf_counter()
+                result = json.loads(message)
+                anchor = sent_at.get(result.get("seq"))
+                if anchor is None:
+                    anchor = anchors.popleft() if anchors else last_sent
+                latencies.append((now - anchor) * 1000)
+                results.append(result)
+        except Exception:
+            pass    # 비정상 종료는 close_code 로 보고
+
+    async with connect(f"{url}?{query}", max_size=None, **{headers_kw: headers}) as ws:
+        receiver = asyncio.create_task(receive(ws))
+        t0 = time.perf_counter()
+        try:
+            for offset, kind, payload in records:
+                if kind == OUTBOUND:
+                    expected.append(json.loads(payload))
+                    anchors.append(last_sent)
+                    continue
+                if kind != INBOUND:
+                    continue
+                if speed > 0:
+                    delay = t0 + offset / speed - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    lags.append(max(0.0, -delay) * 1000)
+                await ws.send(payload)
+                last_sent = time.perf_counter()
+                sent += 1
+                sent_at[sent] = last_sent
+                sent_bytes += len(payload)
+            # 남은 window 결과 대기
+            deadline = time.perf_counter() + drain_sec
+            while len(results) < len(expected) and time.perf_counter() < deadline and not receiver.done():
+                await asyncio.sleep(0.1)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - t0
+        await ws.close()
+        receiver.cancel()
+        close_code = getattr(ws, "close_code", None)
+
+    pairing = _pair_results(results, expected)
+    return {"path": path,
+            "user_name": user_name,
+            "elapsed_sec": round(elapsed, 2),
+            "messages": sent,
+            "bytes": sent_bytes,
+            "results": len(results),
+            "recorded_results": len(expected),
+            **pairing,
+            "rungs": sorted({r.get("rung", "full") for r in results}),
+            "latency_ms": _percentiles(latencies),
+            "send_lag_ms": _percentiles(lags),
+            "close_code": close_code,
+            "error": error,
+            "_latencies": latencies if pairing["aligned"] else []}
+
+
+async def replay(paths: List[str], url: str, tokens: Dict[str, Dict[str, str]], speed: float,
+                 users: List[str] | None = None) -> Dict[str, Any]:
+    users = users or [None] * len(paths)
+    sessions = await asyncio.gather(*(replay_session(p, url, tokens, speed, u) for p, u in zip(paths, users)))
+    latencies = [ms for s in sessions for ms in s.pop("_latencies")]
+    return {"speed": speed,
+            "sessions": sessions,
+            "results": len(latencies),
+            "latency_ms": _percentiles(latencies),
+            "unaligned": sum(1 for s in sessions if not s["aligned"]),
+            "errors": sum(1 for s in sessions if s["error"])}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    i = sub.add_parser("inspect")
+    i.add_argument("archives", nargs="+")
+    r = sub.add_parser("run")
+    r.add_argument("archives", nargs="+")
+    r.add_argument("--url", default="ws://localhost:9000/ws/real-time")
+    r.add_argument("--tokens", required=True, help="JSON file: {user_name: {access, refresh}}")
+    r.add_argument("--users", nargs="+", default=None, help="Replay as these users instead of the recorded ones (one per archive)")
+    r.add_argument("--speed", type=float, default=1.0, help="Playback speed (0 = send as fast as possible)")
+    r.add_argument("--max-p95-ms", type=float, default=None, help="Exit non-zero if result latency p95 exceeds this")
+    args = ap.parse_args()
+
+    if args.cmd == "inspect":
+        print(json.dumps([inspect_archive(p) for p in args.archives], indent=2, ensure_ascii=False))
+        return
+    if args.users and len(args.users) != len(args.archives):
+        ap.error("--users needs one user per archive")
+    with open(args.tokens, encoding="utf-8") as f:
+        tokens = json.load(f)
+    report = asyncio.run(replay(args.archives, args.url, tokens, args.speed, args.users))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if report["errors"] or report["unaligned"] or (args.max_p95_ms is not None and report["latency_ms"]["p95"] > args.max_p95_ms):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
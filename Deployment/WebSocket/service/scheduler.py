@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Set, Tuple
+import contextvars
+import asyncio
+import time
+
+from WebSocket.core.config import SCHED_POLICY, SCHED_DEADLINE_SEC
+from WebSocket.service.executor import InferenceExecutor
+
+
+class StaleWindowError(Exception):
+    """deadline 안에 결과를 낼 수 없어 버려진 window (또는 같은 사용자의 새 window 로 대체됨)."""
+
+
+@dataclass
+class _Job:
+    user_name: str
+    deadline: float                       # time.monotonic() 기준 결과 마감 시각
+    fn: Callable
+    args: Tuple[Any, ...]
+    future: asyncio.Future
+    enqueued: float = field(default_factory=time.monotonic)
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)  # 제출한 task 의 context
+
+
+# 사용자별 scheduling 지연 (queue 대기 시간) 통계
+class _UserStats:
+    def __init__(self) -> None:
+        self.delays: Deque[float] = deque(maxlen=100)
+        self.served = 0
+        self.dropped = 0
+
+    def info(self) -> Dict[str, float]:
+        ordered = sorted(self.delays)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        return {"served": self.served,
+                "dropped": self.dropped,
+                "delay_avg_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+                "delay_p95_ms": round(p95 * 1000, 2),
+                "delay_max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0}
+
+
+# ---------------------------------------------------------------------------------
+# 사용자 간 공정(fair-share) 추론 scheduler : executor 앞단에서 실행 순서 결정
+#   - 사용자별 queue, 사용자당 실행 중 window 최대 1개 (대기 중 window 는 새 window 가 오면 대체)
+#   - 빈 slot 이 생기면 edf(가장 이른 deadline) 또는 rr(round-robin) 순으로 다음 window 선택
+#   - 예상 처리 시간을 더해도 deadline 을 넘기는 window 는 실행하지 않고 StaleWindowError
+#   이벤트 루프 thread 에서만 호출됨 (lock 불필요)
+# ---------------------------------------------------------------------------------
+class InferenceScheduler:
+    def __init__(self, executor: InferenceExecutor, policy: str = SCHED_POLICY,
+                 deadline_sec: float = SCHED_DEADLINE_SEC) -> None:
+        self.executor = executor
+        self.policy = policy
+        self.deadline_sec = deadline_sec
+        self.service_sec = 0.0            # window 처리 시간 (EWMA) : stale 판정용
+        self._free = executor.slots
+        self._queues: Dict[str, Deque[_Job]] = {}
+        self._running: Set[str] = set()
+        self._order: Deque[str] = deque()     # queue 가 있는 사용자
+        self._last: Dict[str, float] = {}     # 사용자별 마지막 실행 시각 (공정성 기준)
+        self._stats: Dict[str, _UserStats] = {}
+
+    @property
+    def depth(self) -> int:
+        return sum(len(q) for q in self._queues.values()) + len(self._running)
+
+    async def submit(self, user_name: str, fn: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        job = _Job(user_name, time.monotonic() + self.deadline_sec, fn, args, loop.create_future())
+        queue = self._queues.setdefault(user_name, deque())
+        while queue:    # 대기 중인 이전 window 는 새 window 로 대체
+            self._drop(queue.popleft(), "superseded by a newer window")
+        queue.append(job)
+        if user_name not in self._order:
+            self._order.append(user_name)
+        self._last.setdefault(user_name, job.enqueued)
+        self._dispatch()
+        return await job.future
+
+    def _user(self, user_name: str) -> _UserStats:
+        return self._stats.setdefault(user_name, _UserStats())
+
+    def _drop(self, job: _Job, reason: str) -> None:
+        self._user(job.user_name).dropped += 1
+        if not job.future.done():
+            job.future.set_exception(StaleWindowError(reason))
+
+    # 실행 가능한 다음 job 선택 (실행 중인 사용자 제외, stale / 취소된 job 정리)
+    def _pick(self) -> _Job | None:
+        now = time.monotonic()
+        heads = []
+        for user_name in list(self._order):
+            queue = self._queues.get(user_name)
+            while queue and (queue[0].future.done() or now + self.service_sec > queue[0].deadline):
+                job = queue.popleft()
+                if not job.future.done():
+                    self._drop(job, "deadline would be missed")
+            if not queue:
+                self._queues.pop(user_name, None)
+                self._order.remove(user_name)
+                continue
+            if user_name not in self._running:
+                heads.append(queue[0])
+        if not heads:
+            return None
+        # rr  : 가장 오래 실행되지 못한 사용자 먼저
+        # edf : window deadline 과 "마지막 결과 + deadline_sec" 중 이른 쪽 (버려지기만 하는 사용자가 생기지 않도록)
+        if self.policy == "edf":
+            job = min(heads, key=lambda j: min(j.deadline, self._last[j.user_name] + self.deadline_sec))
+        else:
+            job = min(heads, key=lambda j: self._last[j.user_name])
+        self._queues[job.user_name].popleft()
+        return job
+
+    def _dispatch(self) -> None:
+        while self._free > 0:
+            job = self._pick()
+            if job is None:
+                return
+            self._free -= 1
+            self._running.add(job.user_name)
+            self._last[job.user_name] = time.monotonic()
+            stats = self._user(job.user_name)
+            stats.delays.append(time.monotonic() - job.enqueued)
+            stats.served += 1
+            # 다른 사용자의 완료 callback 에서 dispatch 되더라도 제출한 task 의 context 로 실행
+            task = job.context.run(asyncio.ensure_future, self.executor.run(job.fn, *job.args))
+            task.add_done_callback(partial(self._done, job, time.monotonic()))
+
+    def _done(self, job: _Job, started: float, task: asyncio.Future) -> None:
+        elapsed = time.monotonic() - started
+        self.service_sec = elapsed if self.service_sec == 0 else 0.2 * elapsed + 0.8 * self.service_sec
+        self._free += 1
+        self._running.discard(job.user_name)
+        error = None if task.cancelled() else task.exception()   # 호출자가 떠났어도 예외는 항상 회수
+        if not job.future.done():
+            if task.cancelled():
+                job.future.cancel()
+            elif error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(task.result())
+        self._dispatch()
+
+    def forget(self, user_name: str) -> None:
+        self._stats.pop(user_name, None)
+        self._last.pop(user_name, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"policy": self.policy,
+                "depth": self.depth,
+                "service_ms": round(self.service_sec * 1000, 2),
+                "users": {u: s.info() for u, s in list(self._stats.items())}}
@@ -0,0 +1,110 @@
+from collections import deque
+from typing import Deque, Dict, Tuple
+import struct
+import time
+
+from WebSocket.core.config import (FRAME_MAX_BYTES, FRAME_MAX_WIDTH, FRAME_MAX_HEIGHT,
+                                   FRAME_MAX_VIOLATIONS, FRAME_VIOLATION_WINDOW_SEC)
+from WebSocket.core.exceptions import FrameVerdict, FrameViolationError
+from WebSocket.service.protocol import CODEC_JPEG, CODEC_PNG, FrameHeader
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG SOF(Start Of Frame) marker : 해상도가 기록된 segment (DHT / JPG / DAC 제외)
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+# 디코딩 없이 header 만 읽어 (codec, width, height) 반환. JPEG/PNG 가 아니거나 header 가 깨졌으면 None
+def inspect_image(data: bytes) -> Tuple[int, int, int] | None:
+    if data[:8] == PNG_SIGNATURE:
+        # signature(8) | IHDR length(4) | "IHDR"(4) | width(4) | height(4)
+        if len(data) < 24 or data[12:16] != b"IHDR":
+            return None
+        width, height = struct.unpack_from(">II", data, 16)
+        return CODEC_PNG, width, height
+    if data[:3] == b"\xff\xd8\xff":
+        i = 2
+        while i + 4 <= len(data):
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:          # fill byte
+                i += 1
+                continue
+            (length,) = struct.unpack_from(">H", data, i + 2)
+            if marker in _JPEG_SOF:
+                # length(2) | precision(1) | height(2) | width(2)
+                if i + 9 > len(data):
+                    return None
+                height, width = struct.unpack_from(">HH", data, i + 5)
+                return CODEC_JPEG, width, height
+            if marker == 0xDA:          # SOS 이전에 SOF 가 없으면 비정상
+                return None
+            i += 2 + length
+    return None
+
+
+# ---------------------------------------------------------------------------------
+# 연결(connection) 별 프레임 검증 : 디코딩 전에 크기 / 포맷 / 해상도 확인
+#   불량 프레임은 버리고 집계, 최근 window_sec 동안 max_violations 초과 시 FrameViolationError -> 연결 종료
+#   (연결 전체 누적이 아닌 비율 기준 : 긴 정상 세션의 가끔 깨진 프레임은 허용, 짧은 burst 는 차단)
+# ---------------------------------------------------------------------------------
+class FrameValidator:
+    def __init__(self,
+                 max_bytes: int = FRAME_MAX_BYTES,
+                 max_width: int = FRAME_MAX_WIDTH,
+                 max_height: int = FRAME_MAX_HEIGHT,
+                 max_violations: int = FRAME_MAX_VIOLATIONS,
+                 window_sec: float = FRAME_VIOLATION_WINDOW_SEC) -> None:
+        self.max_bytes = max_bytes
+        self.max_width = max_width
+        self.max_height = max_height
+        self.max_violations = max_violations
+        self.window_sec = window_sec
+        self.accepted = 0
+        self.rejected: Dict[str, int] = {}     # 연결 전체 누적 (통계용)
+        self._recent: Deque[float] = deque()   # 최근 window_sec 안의 불량 시각 (monotonic)
+
+    @property
+    def violations(self) -> int:
+        return sum(self.rejected.values())
+
+    # 최근 window_sec 동안의 불량 프레임 수
+    def recent_violations(self, now: float | None = None) -> int:
+        now = time.monotonic() if now is None else now
+        while self._recent and now - self._recent[0] > self.window_sec:
+            self._recent.popleft()
+        return len(self._recent)
+
+    def _verdict(self, data: bytes, declared: FrameHeader | None) -> FrameVerdict:
+        if len(data) == 0:
+            return FrameVerdict.EMPTY
+        if len(data) > self.max_bytes:
+            return FrameVerdict.TOO_LARGE
+        info = inspect_image(data)
+        if info is None:
+            return FrameVerdict.UNKNOWN_FORMAT
+        codec, width, height = info
+        if not (0 < width <= self.max_width and 0 < height <= self.max_height):
+            return FrameVerdict.BAD_DIMENSIONS
+        if declared is not None and (declared.codec, declared.width, declared.height) != (codec, width, height):
+            return FrameVerdict.HEADER_MISMATCH
+        return FrameVerdict.VALID
+
+    # 사용 가능한 프레임이면 True. 불량이면 집계 후 False (한도 초과 시 예외)
+    def check(self, data: bytes, declared: FrameHeader | None = None) -> bool:
+        verdict = self._verdict(data, declared)
+        if verdict == FrameVerdict.VALID:
+            self.accepted += 1
+            return True
+        self.reject(verdict)
+        return False
+
+    def reject(self, verdict: FrameVerdict) -> None:
+        self.rejected[verdict.name] = self.rejected.get(verdict.name, 0) + 1
+        now = time.monotonic()
+        self._recent.append(now)
+        if self.recent_violations(now) > self.max_violations:
+            raise FrameViolationError(FrameVerdict.TOO_MANY_VIOLATIONS)
+
+    def stats(self) -> Dict[str, object]:
+        return {"accepted": self.accepted, "rejected": dict(self.rejected)}
@@ -2,10 +2,14 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from asyncio import TimeoutError
 from typing import Dict
+import time
 
 from WebSocket.core.deps import AsyncDB, Get
-from WebSocket.core.exceptions import TokenVerdict
+from WebSocket.core.exceptions import TokenVerdict, FrameViolationError
 from WebSocket.service import TokenService, RealTimeService, ModelService, FocusTracker
+from WebSocket.service.validation import FrameValidator
+from WebSocket.service.scheduler import StaleWindowError
+from WebSocket.core.tracing import tracer, current_span
 
 from WebSocket.ws.manager import ConnectionManager
 
@@ -19,9 +23,12 @@ focus_tracker = FocusTracker()
 async def websocket_endpoint(websocket: WebSocket,
                              db: AsyncSession = Depends(AsyncDB.get_db),
                              params: Dict = Depends(Get.Parameters)) -> None:
-    verdict = await TokenService.verify_tokens(db=db, access=params["access"], 
-                                              refresh=params["refresh"], 
-                                              user_name=params["user_name"])
+    current_span().set("enduser.id", params["user_name"])
+    with tracer.span("ws.handshake") as span:
+        verdict = await TokenService.verify_tokens(db=db, access=params["access"], 
+                                                  refresh=params["refresh"], 
+                                                  user_name=params["user_name"])
+        span.set("token.verdict", verdict.name)
     # HandShake 수락
     await websocket.accept()
     if verdict != TokenVerdict.VALID or manager.check_user(user_name):
@@ -32,33 +39,54 @@ async def websocket_endpoint(websocket: WebSocket,
     print(f"[CONNECTED] : {user_name}")
     manager.connect(user_name, websocket)
     focus_tracker.init_user(user_name)
+    validator = FrameValidator()
+    RealTimeService.start_recording(user_name, subject=params["subject"], location=params["location"])
     try:
         while True:
             try:
-                # 1. 프레임 수집
-                img_dir = await RealTimeService.collect_frames(websocket, user_name)
-                # 2. 추론
-                cur_focus = await ModelService.inference_focus(img_dir)
-                # 3. focus 갱신 / 집계
-                result = await focus_tracker.update_focus(user_name, cur_focus)
-                # 4. result 를 client 에게 송신
-                await manager.send_current_focus(user_name, result)
-                # 5. img_dir 삭제
-                await RealTimeService.clear(img_dir)
+                # 1. 프레임 수집 (span 밖 : 정상 종료 / time-out 이 ERROR span 으로 남지 않도록)
+                window = await RealTimeService.collect_frames(websocket, user_name, validator)
+                # window 1개 = trace span 1개 (연결 span 의 자식), 수집 시간은 window.fill_ms 속성으로 기록
+                with tracer.span("ws.window", **{"enduser.id": user_name}) as span:
+                    span.set("frames", len(window.frames))
+                    span.set("window.fill_ms", round((time.time() - window.started_at) * 1000, 1))
+                    # 2. 추론 (메모리의 프레임 bytes 로 직접 수행)
+                    cur_focus, rung = await ModelService.inference_focus(window.frames, user_name)
+                    # 3. focus 갱신 / 집계
+                    result = await focus_tracker.update_focus(user_name, cur_focus)
+                    span.set("focus", result)
+                    # 4. result 를 client 에게 송신
+                    #    seq : window 를 완성한 message 순번 (replay 가 결과를 녹화된 결과와 짝지을 때 사용)
+                    message = {"focus": result, "rung": rung, "seq": window.seq}
+                    await manager.send_current_focus(user_name, message)
+                    RealTimeService.record_outbound(user_name, message)
+                    # 5. FrameStore 에 window 보관
+                    await RealTimeService.archive(window)
             except TimeoutError:
                 print(f"[LOG] : {user_name} disconnected by time-out.")
                 await websocket.close(code=1000, reason="Timeout")
                 break
+            except StaleWindowError as e:
+                # 결과가 너무 늦어질 window : 집계하지 않고 다음 window 로
+                print(f"[LOG] : {user_name} window dropped ({e})")
+                continue
+            except FrameViolationError as e:
+                print(f"[LOG] : {user_name} disconnected : {e.verdict.reason} {validator.stats()}")
+                await websocket.close(code=e.verdict.code, reason=e.verdict.reason)
+                break
             except WebSocketDisconnect:
                 print(f"[LOG] : {user_name} Client disconnected.")
                 break
     finally:
         manager.disconnect(user_name)
+        ModelService.forget_user(user_name)
+        RealTimeService.forget(user_name)
         print(f"[LOG] : {user_name} Disconnected.")
-    score = await focus_tracker.compute_score(db, 
-                                              user_name, 
-                                              params["location"], 
-                                              params["subject"])
+    with tracer.span("session.score", **{"enduser.id": user_name}):
+        score = await focus_tracker.compute_score(db, 
+                                                  user_name, 
+                                                  params["location"], 
+                                                  params["subject"])
     print(f"[LOG] : {user_name} 's score is {score}.")
 
     # 유저가 연결하자마자 바로 끊은 경우 : compute_score에서 내부적으로 “데이터 유무 체크” & “예외처리/skip” 구현  -> 최소 5분 초과만 학습 점수 연산 및 기록
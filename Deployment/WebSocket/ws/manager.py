@@ -21,8 +21,9 @@ class ConnectionManager:
     def check_user(self, user_name: str) -> bool:
         return user_name in self.connections
 
-    async def send_current_focus(self, user_name: str, focus: int) -> None:
+    # rung : 이 결과를 만든 서빙 설정 (degradation ladder, 기본 "full")
+    async def send_current_focus(self, user_name: str, message: Dict[str, Any]) -> None:
         websocket = self.get_connection(user_name)
         if websocket:
-            print(f"[LOG] :     Manager send {user_name} - focus : {focus}")
-            await websocket.send_json({"focus": focus})
+            print(f"[LOG] :     Manager send {user_name} - {message}")
+            await websocket.send_json(message)
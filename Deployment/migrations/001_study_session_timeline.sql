@@ -0,0 +1,4 @@
+-- StudySession.timeline : window 별 집중도 시계열 (RLE 압축 uint8, core/timeline.py)
+-- WAS / WebSocket 새 버전 배포 전에 운영 DB 에 1회 적용 (적용 전에는 StudySession 조회 / 기록이 실패함)
+--   mysql -h <host> -u <user> -p BrainBuddy < Deployment/migrations/001_study_session_timeline.sql
+ALTER TABLE StudySession ADD COLUMN timeline BLOB NULL;